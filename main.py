@@ -6,12 +6,12 @@ It uses Flask for the web interface and provides the ability to scan
 networks for open ports using multiple threads for better performance.
 """
 
-# Step 1: Import the Flask app and setup functions from flask_web_interface module
-from scanner_tool.flask_web_interface import app, ensure_directories
+# Step 1: Import the app factory from flask_web_interface module
+from scanner_tool.flask_web_interface import create_app
 
-# Step 2: Initialize required directories and files before app startup
-# This ensures all necessary file structure is in place
-ensure_directories()  # Create directory structure for the application
+# Step 2: Build the app; templates and static files ship with the package,
+# so startup only creates the results directory and checks the assets exist
+app = create_app()
 
 # Step 3: Define the application entry point with Flask app run parameters
 if __name__ == "__main__":
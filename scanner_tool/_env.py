@@ -0,0 +1,23 @@
+"""
+Environment Loader - Loads the .env file once per process
+
+Importing this module is enough; later imports are no-ops. On Vercel the platform
+injects environment variables directly, so the .env file is not parsed there.
+"""
+
+import os
+from dotenv import load_dotenv
+
+_loaded = False
+
+def load_env():
+    """Load variables from .env into os.environ, at most once."""
+    global _loaded
+    if _loaded:
+        return
+    if not os.environ.get('VERCEL'):
+        # Never override variables already set by the environment
+        load_dotenv(override=False)
+    _loaded = True
+
+load_env()
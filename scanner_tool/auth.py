@@ -1,23 +1,151 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session, current_app
+from flask import Blueprint, render_template, request, redirect, url_for, flash, session
 import os
+import threading
+import time
 from functools import wraps
-import re
-from dotenv import load_dotenv
+from typing import Optional
 from supabase import create_client, Client
-import json
+from postgrest.exceptions import APIError
+try:
+    # supabase-py 2.10+ splits the options per client; create_client() needs the sync ones
+    from supabase.lib.client_options import SyncClientOptions as ClientOptions
+except ImportError:
+    from supabase.lib.client_options import ClientOptions
+import httpx
+import importlib.util
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (once per process)
+try:
+    from scanner_tool._env import load_env
+except ImportError:
+    # Running the terminal scanner from inside the scanner_tool directory
+    from _env import load_env
+load_env()
 
 auth = Blueprint('auth', __name__)
 
-def get_supabase() -> Client:
-    """Get Supabase client instance."""
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_KEY")
-    if not supabase_url or not supabase_key:
+# How long a cached admin flag in the session is trusted before re-checking
+ADMIN_CHECK_TTL = 300
+
+# Supabase credentials, read once at import
+_SUPABASE_URL = os.getenv("SUPABASE_URL")
+_SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+
+# Timeouts (seconds) and connection pool limits for Supabase HTTP requests
+SUPABASE_TIMEOUT = 5
+SUPABASE_STORAGE_TIMEOUT = 10
+SUPABASE_MAX_KEEPALIVE = 20
+SUPABASE_MAX_CONNECTIONS = 50
+# HTTP/2 multiplexes concurrent Supabase requests over one connection; httpx needs the h2 package for it
+SUPABASE_HTTP2 = importlib.util.find_spec('h2') is not None
+
+# Shared Supabase client for table access, created on first use and reused across requests
+_supabase_client: Optional[Client] = None
+# Connection pool shared by the table client and the per-request auth clients
+_http_client: Optional[httpx.Client] = None
+_supabase_lock = threading.Lock()
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared keep-alive connection pool. Caller must hold _supabase_lock."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=SUPABASE_HTTP2,
+            limits=httpx.Limits(
+                max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+                max_connections=SUPABASE_MAX_CONNECTIONS
+            ),
+            timeout=SUPABASE_TIMEOUT
+        )
+    return _http_client
+
+def _client_options(**overrides) -> ClientOptions:
+    """Build client options with bounded timeouts and a keep-alive connection pool."""
+    options = {
+        'postgrest_client_timeout': SUPABASE_TIMEOUT,
+        'storage_client_timeout': SUPABASE_STORAGE_TIMEOUT,
+        **overrides
+    }
+    # Newer supabase-py versions accept a shared httpx client
+    if 'httpx_client' in getattr(ClientOptions, '__dataclass_fields__', {}):
+        with _supabase_lock:
+            options['httpx_client'] = _get_http_client()
+    return ClientOptions(**options)
+
+def _check_credentials():
+    """Raise if the Supabase URL or key is missing."""
+    if not _SUPABASE_URL or not _SUPABASE_KEY:
         raise ValueError("Supabase URL and Key must be set in environment variables.")
-    return create_client(supabase_url, supabase_key)
+
+def get_supabase() -> Client:
+    """
+    Get the shared Supabase client instance, used for table and RPC access with the project key.
+    
+    Never sign users in or out on this client: supabase-py rewrites the client's
+    Authorization header on auth events, which would apply one user's token to
+    every later request. Use create_auth_client() for that.
+    """
+    global _supabase_client
+    if _supabase_client is None:
+        _check_credentials()
+        options = _client_options()
+        with _supabase_lock:
+            if _supabase_client is None:
+                _supabase_client = create_client(_SUPABASE_URL, _SUPABASE_KEY, options=options)
+    return _supabase_client
+
+def create_auth_client() -> Client:
+    """
+    Create a short-lived Supabase client for one sign-up, sign-in or sign-out.
+    
+    Its auth state belongs to the current request only. It shares the connection
+    pool with the table client but never refreshes tokens in the background.
+    """
+    _check_credentials()
+    options = _client_options(auto_refresh_token=False, persist_session=False)
+    return create_client(_SUPABASE_URL, _SUPABASE_KEY, options=options)
+
+def check_admin(supabase: Client, user_id: str) -> bool:
+    """Check whether the given user is listed in the admin_users table."""
+    user_data = supabase.table('admin_users').select('id').eq('id', user_id).execute()
+    return bool(user_data.data)
+
+def cache_admin_flag(is_admin: bool):
+    """Store the admin flag in the session along with its expiry time."""
+    session['is_admin'] = is_admin
+    session['is_admin_expires'] = time.time() + ADMIN_CHECK_TTL
+
+# PostgREST / Postgres error codes for a database function that doesn't exist
+MISSING_FUNCTION_CODES = frozenset(('PGRST202', '42883'))
+
+# Cleared once the get_login_profile function turns out not to be deployed
+_login_profile_rpc = True
+
+def get_login_profile(supabase: Client, user_id: str) -> dict:
+    """
+    Fetch the username and admin flag for a user in one call.
+    
+    Uses the get_login_profile(p_user_id uuid) database function from
+    supabase/migrations. If it isn't deployed, falls back to querying the users
+    and admin_users tables, and stops trying the function for this process.
+    Must be called on the client the user just signed in on.
+    """
+    global _login_profile_rpc
+    if _login_profile_rpc:
+        try:
+            result = supabase.rpc('get_login_profile', {'p_user_id': user_id}).execute()
+            if isinstance(result.data, dict):
+                return result.data
+        except APIError as e:
+            if e.code not in MISSING_FUNCTION_CODES:
+                raise
+            _login_profile_rpc = False
+    
+    user_data = supabase.table('users').select('username').eq('id', user_id).execute()
+    return {
+        'username': user_data.data[0]['username'] if user_data.data else None,
+        'is_admin': check_admin(supabase, user_id)
+    }
 
 def init_db():
     """Initialize database connection - this is kept for compatibility with existing code."""
@@ -40,15 +168,16 @@ def admin_required(f):
         if 'user_id' not in session or 'access_token' not in session:
             return redirect(url_for('auth.login'))
         
-        # Check if user is admin
-        try:
-            supabase = get_supabase()
-            user_data = supabase.table('admin_users').select('*').eq('id', session['user_id']).execute()
-            if not user_data.data or len(user_data.data) == 0:
-                flash('Admin access required', 'error')
+        # Check if user is admin, re-querying only when the cached flag has expired
+        if 'is_admin' not in session or session.get('is_admin_expires', 0) < time.time():
+            try:
+                cache_admin_flag(check_admin(get_supabase(), session['user_id']))
+            except Exception as e:
+                flash(f'Error checking admin status: {str(e)}', 'error')
                 return redirect(url_for('dashboard'))
-        except Exception as e:
-            flash(f'Error checking admin status: {str(e)}', 'error')
+        
+        if not session.get('is_admin'):
+            flash('Admin access required', 'error')
             return redirect(url_for('dashboard'))
             
         return f(*args, **kwargs)
@@ -66,7 +195,8 @@ def signup():
             return redirect(url_for('auth.signup'))
             
         try:
-            supabase = get_supabase()
+            # Per-request client: signing up may sign the user in on it
+            supabase = create_auth_client()
             
             # Register the user with Supabase Auth
             auth_response = supabase.auth.sign_up({
@@ -116,7 +246,8 @@ def login():
             return redirect(url_for('auth.login'))
             
         try:
-            supabase = get_supabase()
+            # Per-request client: the sign-in switches it to the user's token
+            supabase = create_auth_client()
             
             # Sign in with Supabase Auth
             auth_response = supabase.auth.sign_in_with_password({
@@ -130,13 +261,12 @@ def login():
                 session['access_token'] = auth_response.session.access_token
                 session['refresh_token'] = auth_response.session.refresh_token
                 
-                # Get user data from the users table
-                user_data = supabase.table('users').select('username').eq('id', auth_response.user.id).execute()
+                # Get username and admin status in a single round trip
+                profile = get_login_profile(supabase, auth_response.user.id)
+                session['username'] = profile.get('username') or email
                 
-                if user_data.data and len(user_data.data) > 0:
-                    session['username'] = user_data.data[0]['username']
-                else:
-                    session['username'] = email
+                # Cache admin status so admin routes don't query it on every hit
+                cache_admin_flag(bool(profile.get('is_admin')))
                 
                 flash('Welcome back!', 'success')
                 return redirect(url_for('dashboard'))
@@ -156,7 +286,9 @@ def login():
 def logout():
     try:
         if 'access_token' in session:
-            supabase = get_supabase()
+            # Sign out this user's session only, on a per-request client
+            supabase = create_auth_client()
+            supabase.auth.set_session(session['access_token'], session.get('refresh_token', ''))
             supabase.auth.sign_out()
     except Exception:
         # Even if sign out fails, clear the session
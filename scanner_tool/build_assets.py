@@ -0,0 +1,67 @@
+"""
+Asset Builder - Minifies the dashboard stylesheet and script at build time
+
+Run once after editing the static sources (needs the "minify" extra):
+
+    python -m scanner_tool.build_assets
+
+Each source gets a .min sibling next to it. When a .min file exists the web
+interface serves it in place of the source, so nothing is generated at request
+time or on server start.
+"""
+
+import os
+import sys
+from typing import Callable, Dict
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+# Source files, relative to the static folder
+ASSETS = ('css/styles.css', 'css/dashboard.css', 'js/script.js')
+
+
+def min_path(filename: str) -> str:
+    """
+    Name of the minified variant of a static file.
+
+    Args:
+        filename: Path of the source file, e.g. css/styles.css
+
+    Returns:
+        str: Path of the minified file, e.g. css/styles.min.css
+    """
+    root, ext = os.path.splitext(filename)
+    return f"{root}.min{ext}"
+
+
+def _minifiers() -> Dict[str, Callable[[str], str]]:
+    """Import the minifiers; they are only needed when building."""
+    import rcssmin
+    import rjsmin
+    return {'.css': rcssmin.cssmin, '.js': rjsmin.jsmin}
+
+
+def build(static_dir: str = STATIC_DIR) -> None:
+    """
+    Write a minified copy of every asset in ASSETS.
+
+    Args:
+        static_dir: The static folder containing the sources
+    """
+    minifiers = _minifiers()
+    for filename in ASSETS:
+        source = os.path.join(static_dir, filename)
+        target = os.path.join(static_dir, min_path(filename))
+        with open(source, encoding='utf-8') as f:
+            text = f.read()
+        minified = minifiers[os.path.splitext(filename)[1]](text)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(minified)
+        print(f"{filename}: {len(text)} -> {len(minified)} bytes ({min_path(filename)})")
+
+
+if __name__ == '__main__':
+    try:
+        build()
+    except ImportError as e:
+        sys.exit(f"Minifiers not installed ({e}); install the 'minify' extra first.")
@@ -10,2167 +10,241 @@ This module is responsible for:
 
 # Step 1: Import standard Python libraries
 import os              # For file and directory operations
-import json            # For JSON serialization/deserialization
+import functools       # For caching rendered pages
+import hashlib         # For static file versions and page ETags
+import importlib.resources  # For locating files shipped with the package
+import secrets         # For unique scan IDs
 import socket          # For network operations
-import ipaddress       # For IP address validation
+import itertools       # For the thread-safe progress counter
 import threading       # For running scans in background threads
+from concurrent.futures import ThreadPoolExecutor  # For writing export formats concurrently
 import time            # For timing operations
 from datetime import datetime  # For timestamping
-from typing import Dict, List, Tuple, Optional  # Type hints
-from dotenv import load_dotenv
+from collections import Counter, defaultdict  # For dashboard host counts and grouping issues by service
+from typing import Any, Callable, Dict, List, Tuple, Optional  # Type hints
 
 # Step 2: Import Flask framework components
-from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for, session, flash
+from flask import Flask, Response, render_template, request, jsonify, send_file, url_for, session, flash, stream_with_context
 from scanner_tool.auth import auth, init_db, login_required, admin_required, get_supabase
 
 # Step 3: Import local modules
 # These are the core components of the scanning system
-from scanner_tool.scanner_engine import ScannerEngine         # Handles actual port scanning
+from scanner_tool.scanner_engine import ScannerEngine, parse_port_range, is_ipv4, is_valid_target  # Handles actual port scanning
 from scanner_tool.threading_module import ThreadingModule     # Manages multithreaded execution
-from scanner_tool.data_export_layer import DataExportLayer    # Handles exporting results
+from scanner_tool.scan_state import ScanState, result_kind  # Per-scan state record and result shape tag
+from scanner_tool.result_store import ScanResultStore         # Bounded store of finished scans
+from scanner_tool.json_provider import ORJSONProvider, ORJSONSessionInterface, ORJSON_AVAILABLE  # Fast JSON responses and sessions
+from scanner_tool.build_assets import min_path  # Minified static file names
 
-# Load environment variables
-load_dotenv()
+# Optional HTML minifier for cached pages
+try:
+    from htmlmin import minify as minify_html
+except ImportError:  # htmlmin is optional (and fails to import on Python 3.13+)
+    minify_html = None
 
-# Step 4: Create and configure Flask app
-# The app serves templates from the templates folder and static files from the static folder
-app = Flask(__name__, template_folder='templates', static_folder='static')
-app.secret_key = os.getenv("FLASK_SECRET_KEY", "scanner_tool_secret_key_dev")  # Use environment variable
-
-# Register the auth blueprint
-app.register_blueprint(auth)
-
-# Initialize the database
-init_db()
-
-# Step 5: Initialize core components
-# These instances will be used throughout the application
-scanner_engine = ScannerEngine()       # Creates scanner engine instance
-threading_module = ThreadingModule()   # Creates threading module instance
-data_export = DataExportLayer()        # Creates data export layer instance
-
-# Step 6: Define global variables to track scan state
-# These dictionaries store information about active scans and their results
-active_scans = {}  # Maps scan_id to scan state information
-scan_results = {}  # Maps scan_id to final scan results
-
-# Step 7: Define constants
-# DEFAULT_PORTS is a list of commonly open ports to scan by default
-DEFAULT_PORTS = [21, 22, 23, 25, 53, 80, 110, 123, 135, 139, 143, 389, 443, 445, 993, 995, 1723, 3306, 3389, 5900, 8080]
-
-# Step 8: Define directory setup function
-def ensure_directories():
-    """
-    Step 8.1: Ensure required directories exist.
-    This function creates all necessary directories for the application to function properly.
-    These directories store templates, static files, and scan results.
-    """
-    # Create directories for templates
-    os.makedirs('scanner_tool/templates', exist_ok=True)
-    # Create directories for static files
-    os.makedirs('scanner_tool/static', exist_ok=True)
-    os.makedirs('scanner_tool/static/css', exist_ok=True)
-    os.makedirs('scanner_tool/static/js', exist_ok=True)
-    # Create directory for scan results
-    os.makedirs('scan_results', exist_ok=True)
-
-# Generate HTML templates
-def create_templates():
-    """Create HTML templates if they don't exist."""
-    # Index template
-    index_html = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Port Scanner</title>
-        <link rel="stylesheet" href="{{ url_for('static', filename='css/styles.css') }}">
-        <link rel="preconnect" href="https://fonts.googleapis.com">
-        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-        <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;700&display=swap" rel="stylesheet">
-    </head>
-    <body>
-        <div class="cyber-lines-top"></div>
-        <div class="cyber-lines-bottom"></div>
-        
-        <div class="container">
-            <header>
-                <div class="cyber-header">
-                    <div class="cyber-glitch" data-text="PORT·SCAN·v1.0">PORT·SCAN·v1.0</div>
-                    <h1>Multi-Threaded Port Scanner</h1>
-                    <p class="subtitle">Discover network services with precision</p>
-                    <div class="cyber-scanner"></div>
-                </div>
-            </header>
-            
-            <div class="card scan-config tech-card">
-                <div class="card-corner top-left"></div>
-                <div class="card-corner top-right"></div>
-                <div class="card-corner bottom-left"></div>
-                <div class="card-corner bottom-right"></div>
-                
-                <h2><span class="tech-icon">⚙</span> Scan Configuration</h2>
-                <div class="form-group">
-                    <label for="target">Target Host:</label>
-                    <div class="input-group">
-                        <input type="text" id="target" name="target" placeholder="Enter IP address or hostname" class="form-control tech-input">
-                        <button onclick="useLocalIP()" class="btn btn-secondary tech-btn">
-                            <span class="btn-text">Use Local IP</span>
-                            <span class="btn-icon">⟲</span>
-                        </button>
-                    </div>
-                </div>
-                
-                <div class="form-group">
-                    <label for="port-range">Port Range:</label>
-                    <div class="input-group">
-                        <input type="text" id="port-range" name="port-range" placeholder="e.g., 80,443,8000-8100" class="form-control tech-input" value="21,22,23,25,80,443,3306,8080">
-                        <div class="checkbox-wrapper tech-checkbox">
-                            <input type="checkbox" id="use-predefined" name="use-predefined" checked>
-                            <label for="use-predefined">Use Predefined Ports</label>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="form-group advanced tech-panel">
-                    <label for="threads">Threads:</label>
-                    <input type="number" id="threads" name="threads" value="10" min="1" max="100" class="form-control-sm tech-input">
-                    <div id="thread-warning" class="warning-message" style="display: none; color: #ff5722; font-size: 0.8rem; margin-top: 5px;">
-                        Warning: High thread count may be limited for optimal performance
-                    </div>
-                    
-                    <label for="timeout">Timeout (s):</label>
-                    <input type="number" id="timeout" name="timeout" value="1.0" min="0.1" max="10" step="0.1" class="form-control-sm tech-input">
-                </div>
-                
-                <div class="button-group">
-                    <button id="scan-button" onclick="startScan()" class="btn btn-primary tech-btn pulse-btn">
-                        <span class="btn-text">Start Scan</span>
-                        <span class="btn-icon">⚡</span>
-                    </button>
-                    <button id="stop-button" onclick="stopScan()" class="btn btn-danger tech-btn" disabled>
-                        <span class="btn-text">Stop Scan</span>
-                        <span class="btn-icon">✕</span>
-                    </button>
-                    <button id="export-button" onclick="showExportOptions()" class="btn btn-success tech-btn" disabled>
-                        <span class="btn-text">Export Results</span>
-                        <span class="btn-icon">↓</span>
-                    </button>
-                    <button onclick="clearResults()" class="btn btn-secondary tech-btn">
-                        <span class="btn-text">Clear</span>
-                        <span class="btn-icon">⟲</span>
-                    </button>
-                </div>
-            </div>
-            
-            <div class="progress-section tech-progress">
-                <div class="progress-label">Progress:</div>
-                <div class="progress tech-progress-bar">
-                    <div id="progress-bar" class="progress-bar"></div>
-                </div>
-                <div id="status-label" class="status-label tech-status">Ready</div>
-            </div>
-            
-            <div class="card results-section tech-card">
-                <div class="card-corner top-left"></div>
-                <div class="card-corner top-right"></div>
-                <div class="card-corner bottom-left"></div>
-                <div class="card-corner bottom-right"></div>
-                
-                <div class="tab-navigation tech-tabs">
-                    <button class="tab-button active" onclick="showTab('table-view')">
-                        <span class="tab-icon">◉</span> Table View
-                    </button>
-                    <button class="tab-button" onclick="showTab('log-view')">
-                        <span class="tab-icon">⋮</span> Log View
-                    </button>
-                </div>
-                
-                <div id="table-view" class="tab-content active">
-                    <div class="table-container tech-table">
-                        <table id="results-table">
-                            <thead>
-                                <tr>
-                                    <th>Host</th>
-                                    <th>Port</th>
-                                    <th>Status</th>
-                                    <th>Service</th>
-                                </tr>
-                            </thead>
-                            <tbody id="results-body">
-                                <!-- Results will be inserted here -->
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-                
-                <div id="log-view" class="tab-content">
-                    <div class="tech-console-header">
-                        <div class="console-controls">
-                            <span class="console-btn"></span>
-                            <span class="console-btn"></span>
-                            <span class="console-btn"></span>
-                        </div>
-                        <div class="console-title">SYSTEM CONSOLE</div>
-                    </div>
-                    <div id="log-container" class="log-container tech-console">
-                        <!-- Logs will be inserted here -->
-                    </div>
-                </div>
-            </div>
-            
-            <div id="export-modal" class="modal tech-modal">
-                <div class="modal-content tech-modal-content">
-                    <div class="modal-header">
-                        <h2>Export Options</h2>
-                        <span class="close-button" onclick="closeExportModal()">&times;</span>
-                    </div>
-                    <div class="export-options">
-                        <button onclick="exportResults('csv')" class="btn btn-primary tech-btn">
-                            <span class="btn-text">CSV File</span>
-                            <span class="btn-icon">↓</span>
-                        </button>
-                        <button onclick="exportResults('excel')" class="btn btn-primary tech-btn">
-                            <span class="btn-text">Excel File</span>
-                            <span class="btn-icon">↓</span>
-                        </button>
-                        <button onclick="exportResults('pdf')" class="btn btn-primary tech-btn">
-                            <span class="btn-text">PDF File</span>
-                            <span class="btn-icon">↓</span>
-                        </button>
-                        <button onclick="closeExportModal()" class="btn btn-secondary tech-btn">
-                            <span class="btn-text">Cancel</span>
-                            <span class="btn-icon">✕</span>
-                        </button>
-                    </div>
-                </div>
-            </div>
-            
-            <footer class="tech-footer">
-                <div class="footer-line"></div>
-                <p>PORT SCANNER v1.0.0 | <span id="current-time"></span></p>
-                <div class="tech-badge">MULTITHREADED</div>
-            </footer>
-        </div>
-        
-        <script src="{{ url_for('static', filename='js/script.js') }}"></script>
-    </body>
-    </html>
-    """
-    
-    if not os.path.exists('scanner_tool/templates/index.html'):
-        with open('scanner_tool/templates/index.html', 'w') as f:
-            f.write(index_html)
-
-# Generate CSS styles
-def create_css():
-    """Create CSS styles if they don't exist."""
-    css = """
-    /* Variables */
-    :root {
-        --primary-color: #0a0a0a;
-        --secondary-color: #00FF9C;
-        --background-color: #0a0a0a;
-        --text-color: #00FF9C;
-        --success-color: #00FF9C;
-        --warning-color: #FFD700;
-        --info-color: #00FFFF;
-        --card-bg: #0F1F0F;
-        --border-color: #00FF9C;
-        --highlight-color: #00FF9C;
-        --grid-line-color: rgba(0, 255, 156, 0.1);
-        --tech-glow: 0 0 15px rgba(0, 255, 156, 0.7);
-        --tech-accent: #00FF9C;
-        --terminal-bg: #000800;
-        --matrix-color: #00FF9C;
-    }
-    
-    /* Base Styles */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    /* Cyber elements */
-    .cyber-lines-top,
-    .cyber-lines-bottom {
-        position: fixed;
-        left: 0;
-        width: 100%;
-        height: 4px;
-        background: linear-gradient(90deg, transparent 0%, var(--highlight-color) 50%, transparent 100%);
-        z-index: 1000;
-    }
-    
-    .cyber-lines-top {
-        top: 0;
-    }
-    
-    .cyber-lines-bottom {
-        bottom: 0;
-    }
-    
-    .cyber-header {
-        position: relative;
-        margin-bottom: 20px;
-    }
-    
-    .cyber-glitch {
-        font-size: 1rem;
-        letter-spacing: 3px;
-        color: var(--tech-accent);
-        margin-bottom: 10px;
-        position: relative;
-        display: inline-block;
-        text-shadow: var(--tech-glow);
-    }
-    
-    .cyber-glitch::before,
-    .cyber-glitch::after {
-        content: attr(data-text);
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-    }
-    
-    .cyber-glitch::before {
-        left: 2px;
-        text-shadow: -2px 0 var(--secondary-color);
-        animation: glitch-1 2s infinite linear alternate-reverse;
-    }
-    
-    .cyber-glitch::after {
-        left: -2px;
-        text-shadow: 2px 0 var(--highlight-color);
-        animation: glitch-2 3s infinite linear alternate-reverse;
-    }
-    
-    @keyframes glitch-1 {
-        0%, 100% { clip-path: inset(50% 0 30% 0); }
-        20% { clip-path: inset(33% 0 33% 0); }
-        40% { clip-path: inset(10% 0 60% 0); }
-        60% { clip-path: inset(70% 0 20% 0); }
-        80% { clip-path: inset(40% 0 43% 0); }
-    }
-    
-    @keyframes glitch-2 {
-        0%, 100% { clip-path: inset(20% 0 50% 0); }
-        20% { clip-path: inset(60% 0 20% 0); }
-        40% { clip-path: inset(30% 0 40% 0); }
-        60% { clip-path: inset(50% 0 30% 0); }
-        80% { clip-path: inset(10% 0 60% 0); }
-    }
-    
-    .cyber-scanner {
-        position: absolute;
-        bottom: -10px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 50%;
-        height: 2px;
-        background: var(--highlight-color);
-        box-shadow: 0 0 10px var(--highlight-color);
-        animation: scanner-move 2s infinite;
-    }
-    
-    @keyframes scanner-move {
-        0%, 100% { transform: translateX(-100%); }
-        50% { transform: translateX(100%); }
-    }
-    
-    .tech-card {
-        position: relative;
-        border: 1px solid var(--border-color);
-        background: var(--card-bg);
-        box-shadow: 0 0 20px rgba(0, 0, 0, 0.3);
-        overflow: visible;
-    }
-    
-    .card-corner {
-        position: absolute;
-        width: 10px;
-        height: 10px;
-        border: 1px solid var(--highlight-color);
-        z-index: 1;
-    }
-    
-    .top-left {
-        top: -2px;
-        left: -2px;
-        border-right: none;
-        border-bottom: none;
-    }
-    
-    .top-right {
-        top: -2px;
-        right: -2px;
-        border-left: none;
-        border-bottom: none;
-    }
-    
-    .bottom-left {
-        bottom: -2px;
-        left: -2px;
-        border-right: none;
-        border-top: none;
-    }
-    
-    .bottom-right {
-        bottom: -2px;
-        right: -2px;
-        border-left: none;
-        border-top: none;
-    }
-    
-    .tech-icon {
-        color: var(--highlight-color);
-        margin-right: 8px;
-        text-shadow: var(--tech-glow);
-    }
-    
-    .tech-input {
-        background-color: rgba(10, 15, 20, 0.7);
-        border: 1px solid var(--border-color);
-        color: var(--text-color);
-        font-family: 'JetBrains Mono', monospace;
-        transition: all 0.3s;
-    }
-    
-    .tech-input:focus {
-        border-color: var(--highlight-color);
-        box-shadow: var(--tech-glow);
-    }
-    
-    .tech-checkbox {
-        display: flex;
-        align-items: center;
-    }
-    
-    .tech-panel {
-        background-color: rgba(0, 0, 0, 0.3);
-        border: 1px solid var(--border-color);
-        position: relative;
-    }
-    
-    .tech-panel::before {
-        content: "ADVANCED";
-        position: absolute;
-        top: -8px;
-        left: 10px;
-        font-size: 0.6rem;
-        background-color: var(--card-bg);
-        padding: 0 5px;
-        color: var(--highlight-color);
-    }
-    
-    .tech-btn {
-        background-color: var(--primary-color);
-        border: none;
-        color: white;
-        border-radius: 4px;
-        transition: all 0.3s;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .tech-btn:after {
-        content: "";
-        position: absolute;
-        top: -50%;
-        left: -60%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(60deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-        transform: rotate(30deg);
-        transition: all 0.6s;
-    }
-    
-    .tech-btn:hover:after {
-        left: 100%;
-    }
-    
-    .tech-btn:hover {
-        box-shadow: 0 0 10px rgba(2, 179, 228, 0.5);
-    }
-    
-    .btn-text, .btn-icon {
-        position: relative;
-        z-index: 2;
-    }
-    
-    .pulse-btn {
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0% {
-            box-shadow: 0 0 0 0 rgba(2, 179, 228, 0.4);
-        }
-        70% {
-            box-shadow: 0 0 0 10px rgba(2, 179, 228, 0);
-        }
-        100% {
-            box-shadow: 0 0 0 0 rgba(2, 179, 228, 0);
-        }
-    }
-    
-    .tech-progress {
-        position: relative;
-        border: 1px solid var(--border-color);
-    }
-    
-    .tech-progress::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(90deg, 
-            transparent 0%, 
-            rgba(2, 179, 228, 0.05) 50%, 
-            transparent 100%);
-        animation: progress-bg 2s infinite;
-        z-index: 0;
-    }
-    
-    @keyframes progress-bg {
-        0% { background-position: -100% 0; }
-        100% { background-position: 100% 0; }
-    }
-    
-    .tech-progress-bar {
-        height: 12px;
-        background-color: rgba(0, 0, 0, 0.3);
-        border-radius: 6px;
-        overflow: hidden;
-        position: relative;
-    }
-    
-    .tech-status {
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        background-color: rgba(0, 0, 0, 0.3);
-        border: 1px solid var(--border-color);
-    }
-    
-    .tech-tabs {
-        background-color: rgba(0, 0, 0, 0.2);
-        padding: 5px;
-        border-radius: 4px;
-    }
-    
-    .tab-icon {
-        color: var(--highlight-color);
-        margin-right: 5px;
-    }
-    
-    .tech-table {
-        border: 1px solid var(--border-color);
-    }
-    
-    .tech-table th {
-        background-color: rgba(0, 0, 0, 0.3);
-        color: var(--highlight-color);
-        text-transform: uppercase;
-        font-size: 0.7rem;
-        letter-spacing: 1px;
-    }
-    
-    .tech-console-header {
-        display: flex;
-        align-items: center;
-        background-color: rgba(0, 0, 0, 0.3);
-        padding: 5px 10px;
-        border-top-left-radius: 6px;
-        border-top-right-radius: 6px;
-    }
-    
-    .console-controls {
-        display: flex;
-        gap: 5px;
-    }
-    
-    .console-btn {
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background-color: #555;
-    }
-    
-    .console-btn:nth-child(1) {
-        background-color: #FF5F56;
-    }
-    
-    .console-btn:nth-child(2) {
-        background-color: #FFBD2E;
-    }
-    
-    .console-btn:nth-child(3) {
-        background-color: #27C93F;
-    }
-    
-    .console-title {
-        margin-left: auto;
-        margin-right: auto;
-        font-size: 0.7rem;
-        color: #999;
-    }
-    
-    .tech-console {
-        background-color: var(--terminal-bg);
-        border: 1px solid var(--border-color);
-        border-top: none;
-        border-bottom-left-radius: 6px;
-        border-bottom-right-radius: 6px;
-        font-family: 'JetBrains Mono', monospace;
-        font-size: 0.8rem;
-        line-height: 1.4;
-        padding: 10px;
-        height: 350px;
-        box-shadow: inset 0 0 20px rgba(0, 255, 156, 0.1);
-        position: relative;
-        overflow: auto;
-    }
-    
-    .tech-console::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: repeating-linear-gradient(
-            0deg,
-            transparent,
-            transparent 2px,
-            rgba(0, 255, 156, 0.03) 3px,
-            rgba(0, 255, 156, 0.03) 3px
-        );
-        pointer-events: none;
-    }
-    
-    .tech-modal {
-        background-color: rgba(0, 0, 0, 0.8);
-        backdrop-filter: blur(5px);
-    }
-    
-    .tech-modal-content {
-        background-color: var(--card-bg);
-        border: 1px solid var(--border-color);
-        box-shadow: 0 0 30px rgba(0, 0, 0, 0.5);
-        position: relative;
-    }
-    
-    .tech-modal-content::before {
-        content: "";
-        position: absolute;
-        top: -2px;
-        left: -2px;
-        right: -2px;
-        bottom: -2px;
-        border: 1px solid var(--highlight-color);
-        opacity: 0.3;
-        pointer-events: none;
-    }
-    
-    .modal-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        border-bottom: 1px solid var(--border-color);
-        padding-bottom: 15px;
-        margin-bottom: 20px;
-    }
-    
-    .tech-footer {
-        position: relative;
-        text-align: center;
-        padding: 20px 0;
-        color: #718096;
-        font-size: 0.8rem;
-    }
-    
-    .footer-line {
-        position: absolute;
-        top: 0;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 100px;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, var(--highlight-color), transparent);
-    }
-    
-    .tech-badge {
-        display: inline-block;
-        margin-top: 10px;
-        padding: 3px 10px;
-        background-color: rgba(0, 0, 0, 0.3);
-        border: 1px solid var(--border-color);
-        border-radius: 15px;
-        font-size: 0.7rem;
-        color: var(--highlight-color);
-        letter-spacing: 1px;
-    }
-    
-    body {
-        font-family: 'JetBrains Mono', 'Source Code Pro', monospace;
-        background-color: var(--background-color);
-        color: var(--text-color);
-        line-height: 1.6;
-        position: relative;
-        overflow-x: hidden;
-    }
-    
-    body::before {
-        content: "";
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            linear-gradient(var(--grid-line-color) 1px, transparent 1px),
-            linear-gradient(90deg, var(--grid-line-color) 1px, transparent 1px);
-        background-size: 20px 20px;
-        z-index: -1;
-    }
-    
-    /* Matrix rain effect in the background */
-    body::after {
-        content: "";
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(0deg, 
-            rgba(0, 255, 156, 0.03) 25%, 
-            rgba(0, 255, 156, 0.01) 50%, 
-            transparent 75%);
-        opacity: 0.5;
-        z-index: -1;
-        animation: matrix-rain 20s linear infinite;
-    }
-    
-    @keyframes matrix-rain {
-        0% { background-position: 0% 0%; }
-        100% { background-position: 0% 1000%; }
-    }
-    
-    .container {
-        max-width: 1000px;
-        margin: 0 auto;
-        padding: 20px;
-    }
-    
-    /* Header */
-    header {
-        text-align: center;
-        margin-bottom: 30px;
-        position: relative;
-        padding: 20px 0;
-    }
-    
-    header::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 100px;
-        height: 3px;
-        background: linear-gradient(90deg, var(--highlight-color), var(--secondary-color));
-        border-radius: 3px;
-    }
-    
-    h1 {
-        color: var(--highlight-color);
-        margin-bottom: 10px;
-        font-size: 2.2rem;
-        letter-spacing: 1px;
-        text-shadow: 0 0 10px rgba(2, 179, 228, 0.3);
-    }
-    
-    .subtitle {
-        color: var(--secondary-color);
-        font-style: italic;
-        font-size: 1rem;
-        opacity: 0.9;
-    }
-    
-    /* Cards */
-    .card {
-        background: var(--card-bg);
-        border-radius: 8px;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
-        padding: 25px;
-        margin-bottom: 25px;
-        border: 1px solid var(--border-color);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .card::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 3px;
-        height: 100%;
-        background: linear-gradient(to bottom, var(--highlight-color), var(--secondary-color));
-    }
-    
-    .card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
-    }
-    
-    h2 {
-        color: var(--text-color);
-        margin-bottom: 20px;
-        border-bottom: 1px solid var(--border-color);
-        padding-bottom: 15px;
-        position: relative;
-        font-size: 1.4rem;
-    }
-    
-    h2::after {
-        content: "";
-        position: absolute;
-        bottom: -1px;
-        left: 0;
-        width: 80px;
-        height: 3px;
-        background: linear-gradient(90deg, var(--highlight-color), transparent);
-    }
-    
-    /* Form Elements */
-    .form-group {
-        margin-bottom: 20px;
-    }
-    
-    label {
-        display: block;
-        margin-bottom: 8px;
-        font-weight: bold;
-        color: var(--highlight-color);
-        font-size: 0.9rem;
-        letter-spacing: 0.5px;
-    }
-    
-    .input-group {
-        display: flex;
-        gap: 10px;
-    }
-    
-    .form-control {
-        width: 100%;
-        padding: 10px 15px;
-        border: 1px solid var(--border-color);
-        border-radius: 6px;
-        font-family: inherit;
-        background-color: rgba(17, 24, 39, 0.7);
-        color: var(--text-color);
-        transition: all 0.3s;
-    }
-    
-    .form-control:focus {
-        outline: none;
-        border-color: var(--highlight-color);
-        box-shadow: 0 0 0 2px rgba(2, 179, 228, 0.2);
-    }
-    
-    .form-control-sm {
-        width: 80px;
-        padding: 8px 10px;
-        border: 1px solid var(--border-color);
-        border-radius: 6px;
-        font-family: inherit;
-        background-color: rgba(17, 24, 39, 0.7);
-        color: var(--text-color);
-    }
-    
-    .checkbox-wrapper {
-        display: flex;
-        align-items: center;
-        gap: 8px;
-    }
-    
-    .checkbox-wrapper input[type="checkbox"] {
-        appearance: none;
-        width: 18px;
-        height: 18px;
-        border: 1px solid var(--border-color);
-        border-radius: 4px;
-        background-color: rgba(17, 24, 39, 0.7);
-        position: relative;
-        cursor: pointer;
-    }
-    
-    .checkbox-wrapper input[type="checkbox"]:checked::before {
-        content: "✓";
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        font-size: 12px;
-        color: var(--highlight-color);
-    }
-    
-    .advanced {
-        display: flex;
-        gap: 20px;
-        align-items: center;
-        padding: 15px;
-        background-color: rgba(0, 0, 0, 0.2);
-        border-radius: 6px;
-        margin-top: 15px;
-    }
-    
-    /* Buttons */
-    .button-group {
-        display: flex;
-        gap: 12px;
-        margin-top: 25px;
-    }
-    
-    .btn {
-        padding: 10px 18px;
-        border: none;
-        border-radius: 6px;
-        cursor: pointer;
-        font-family: inherit;
-        font-weight: bold;
-        letter-spacing: 0.5px;
-        text-transform: uppercase;
-        font-size: 0.8rem;
-        transition: all 0.3s;
-        position: relative;
-        overflow: hidden;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        gap: 8px;
-    }
-    
-    .btn::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-        transition: left 0.7s;
-    }
-    
-    .btn:hover::before {
-        left: 100%;
-    }
-    
-    .btn-primary {
-        background-color: var(--primary-color);
-        color: white;
-        box-shadow: 0 4px 6px rgba(44, 62, 80, 0.3);
-    }
-    
-    .btn-danger {
-        background-color: var(--secondary-color);
-        color: white;
-        box-shadow: 0 4px 6px rgba(231, 76, 60, 0.3);
-    }
-    
-    .btn-success {
-        background-color: var(--success-color);
-        color: white;
-        box-shadow: 0 4px 6px rgba(39, 174, 96, 0.3);
-    }
-    
-    .btn-secondary {
-        background-color: #34495e;
-        color: white;
-        box-shadow: 0 4px 6px rgba(52, 73, 94, 0.3);
-    }
-    
-    .btn:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 10px rgba(0, 0, 0, 0.3);
-    }
-    
-    .btn:active {
-        transform: translateY(1px);
-    }
-    
-    .btn:disabled {
-        background-color: #4a5568;
-        color: #a0aec0;
-        cursor: not-allowed;
-        box-shadow: none;
-    }
-    
-    .btn:disabled:hover {
-        transform: none;
-    }
-    
-    /* Icon styles for buttons */
-    .btn::after {
-        font-family: monospace;
-        font-size: 1rem;
-    }
-    
-    .btn-primary::after {
-        content: "⚡";
-    }
-    
-    .btn-danger::after {
-        content: "✕";
-    }
-    
-    .btn-success::after {
-        content: "↓";
-    }
-    
-    /* Progress Bar */
-    .progress-section {
-        display: flex;
-        align-items: center;
-        margin-bottom: 25px;
-        gap: 15px;
-        background-color: var(--card-bg);
-        padding: 15px;
-        border-radius: 8px;
-        border: 1px solid var(--border-color);
-    }
-    
-    .progress-label {
-        flex: 0 0 auto;
-        font-weight: bold;
-        color: var(--highlight-color);
-    }
-    
-    .progress {
-        flex: 1;
-        height: 10px;
-        background-color: rgba(0, 0, 0, 0.3);
-        border-radius: 10px;
-        overflow: hidden;
-        position: relative;
-    }
-    
-    .progress-bar {
-        height: 100%;
-        background: linear-gradient(90deg, var(--highlight-color), var(--info-color));
-        transition: width 0.3s ease;
-        border-radius: 10px;
-        position: relative;
-    }
-    
-    .progress-bar::after {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(
-            90deg,
-            transparent,
-            rgba(255, 255, 255, 0.3),
-            transparent
-        );
-        animation: progress-shine 2s infinite;
-    }
-    
-    @keyframes progress-shine {
-        0% {
-            transform: translateX(-100%);
-        }
-        100% {
-            transform: translateX(100%);
-        }
-    }
-    
-    .status-label {
-        flex: 0 0 auto;
-        font-weight: bold;
-        padding: 5px 10px;
-        border-radius: 20px;
-        background-color: rgba(0, 0, 0, 0.2);
-        font-size: 0.8rem;
-        min-width: 100px;
-        text-align: center;
-    }
-    
-    /* Tabs */
-    .tab-navigation {
-        display: flex;
-        border-bottom: 1px solid var(--border-color);
-        margin-bottom: 20px;
-        gap: 5px;
-    }
-    
-    .tab-button {
-        padding: 10px 20px;
-        background: none;
-        border: none;
-        cursor: pointer;
-        opacity: 0.7;
-        border-bottom: 2px solid transparent;
-        color: var(--text-color);
-        transition: all 0.3s;
-        position: relative;
-        font-weight: bold;
-    }
-    
-    .tab-button:hover {
-        opacity: 0.9;
-        background-color: rgba(255, 255, 255, 0.05);
-    }
-    
-    .tab-button.active {
-        opacity: 1;
-        border-bottom: 2px solid var(--highlight-color);
-        color: var(--highlight-color);
-    }
-    
-    .tab-button.active::before {
-        content: "";
-        position: absolute;
-        bottom: -2px;
-        left: 0;
-        width: 100%;
-        height: 2px;
-        background: var(--highlight-color);
-        box-shadow: 0 0 10px var(--highlight-color);
-    }
-    
-    .tab-content {
-        display: none;
-        animation: fadeIn 0.5s ease;
-    }
-    
-    @keyframes fadeIn {
-        from {
-            opacity: 0;
-            transform: translateY(10px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    .tab-content.active {
-        display: block;
-    }
-    
-    /* Table */
-    .table-container {
-        overflow-x: auto;
-        border-radius: 6px;
-        border: 1px solid var(--border-color);
-    }
-    
-    table {
-        width: 100%;
-        border-collapse: collapse;
-    }
-    
-    th, td {
-        padding: 12px 15px;
-        text-align: left;
-        border-bottom: 1px solid var(--border-color);
-    }
-    
-    th {
-        background-color: rgba(0, 0, 0, 0.2);
-        font-weight: bold;
-        color: var(--highlight-color);
-        position: sticky;
-        top: 0;
-    }
-    
-    tbody tr {
-        transition: background-color 0.2s;
-    }
-    
-    tbody tr:hover {
-        background-color: rgba(255, 255, 255, 0.05);
-    }
-    
-    /* Alternating row colors */
-    tbody tr:nth-child(even) {
-        background-color: rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Log Container */
-    .log-container {
-        height: 350px;
-        overflow-y: auto;
-        padding: 15px;
-        background-color: rgba(0, 0, 0, 0.3);
-        border-radius: 6px;
-        font-size: 0.9rem;
-        font-family: 'JetBrains Mono', monospace;
-        border: 1px solid var(--border-color);
-    }
-    
-    .log-entry {
-        margin-bottom: 8px;
-        padding: 8px;
-        border-radius: 4px;
-        position: relative;
-        animation: logFadeIn 0.3s ease;
-    }
-    
-    @keyframes logFadeIn {
-        from {
-            opacity: 0;
-            transform: translateX(-10px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    .log-info {
-        color: var(--info-color);
-        border-left: 2px solid var(--info-color);
-        padding-left: 8px;
-        background-color: rgba(52, 152, 219, 0.1);
-    }
-    
-    .log-success {
-        color: var(--success-color);
-        border-left: 2px solid var(--success-color);
-        padding-left: 8px;
-        background-color: rgba(39, 174, 96, 0.1);
-    }
-    
-    .log-warning {
-        color: var(--warning-color);
-        border-left: 2px solid var(--warning-color);
-        padding-left: 8px;
-        background-color: rgba(243, 156, 18, 0.1);
-    }
-    
-    .log-error {
-        color: var(--secondary-color);
-        border-left: 2px solid var(--secondary-color);
-        padding-left: 8px;
-        background-color: rgba(231, 76, 60, 0.1);
-    }
-    
-    /* Modal */
-    .modal {
-        display: none;
-        position: fixed;
-        z-index: 1000;
-        left: 0;
-        top: 0;
-        width: 100%;
-        height: 100%;
-        background-color: rgba(0, 0, 0, 0.7);
-        backdrop-filter: blur(5px);
-        animation: fadeIn 0.3s ease;
-    }
-    
-    .modal-content {
-        background-color: var(--card-bg);
-        margin: 10% auto;
-        padding: 25px;
-        border-radius: 8px;
-        width: 400px;
-        max-width: 90%;
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.5);
-        border: 1px solid var(--border-color);
-        position: relative;
-        animation: modalSlideIn 0.4s ease;
-    }
-    
-    @keyframes modalSlideIn {
-        from {
-            opacity: 0;
-            transform: translateY(-50px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    .close-button {
-        position: absolute;
-        top: 15px;
-        right: 15px;
-        font-size: 24px;
-        cursor: pointer;
-        width: 30px;
-        height: 30px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        border-radius: 50%;
-        background-color: rgba(0, 0, 0, 0.2);
-        transition: all 0.3s;
-    }
-    
-    .close-button:hover {
-        background-color: var(--secondary-color);
-        color: white;
-        transform: rotate(90deg);
-    }
-    
-    .export-options {
-        display: flex;
-        flex-direction: column;
-        gap: 15px;
-        margin-top: 25px;
-    }
-    
-    /* Footer */
-    footer {
-        text-align: center;
-        margin-top: 40px;
-        color: #718096;
-        font-size: 0.9rem;
-        padding: 20px 0;
-        position: relative;
-    }
-    
-    footer::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 50px;
-        height: 2px;
-        background: linear-gradient(90deg, transparent, var(--highlight-color), transparent);
-    }
-    
-    /* Matrix-like background animation */
-    @keyframes matrix-effect {
-        0% {
-            background-position: 0% 0%;
-        }
-        100% {
-            background-position: 0% 100%;
-        }
-    }
-    
-    /* Typing effect */
-    .typing-effect {
-        overflow: hidden;
-        border-right: 2px solid var(--highlight-color);
-        white-space: nowrap;
-        margin: 0 auto;
-        letter-spacing: 0.1em;
-        animation: 
-            typing 3.5s steps(30, end),
-            blink-caret 0.75s step-end infinite;
-    }
-    
-    @keyframes typing {
-        from { width: 0 }
-        to { width: 100% }
-    }
-    
-    @keyframes blink-caret {
-        from, to { border-color: transparent }
-        50% { border-color: var(--highlight-color) }
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .input-group {
-            flex-direction: column;
-        }
-        
-        .button-group {
-            flex-wrap: wrap;
-        }
-        
-        .advanced {
-            flex-direction: column;
-            align-items: flex-start;
-        }
-        
-        .progress-section {
-            flex-direction: column;
-            align-items: stretch;
-        }
-        
-        .status-label {
-            align-self: flex-end;
-        }
-    }
-    
-    /* Custom Scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(0, 0, 0, 0.2);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: var(--highlight-color);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--secondary-color);
-    }
-    """
-    
-    if not os.path.exists('scanner_tool/static/css/styles.css'):
-        with open('scanner_tool/static/css/styles.css', 'w') as f:
-            f.write(css)
-
-# Generate JavaScript
-def create_js():
-    """Create JavaScript code if it doesn't exist."""
-    js = """
-    // Global variables
-    let scanActive = false;
-    let scanId = null;
-    let updateInterval = null;
-    let resultCount = 0;
-    let typingEffect = false;
-    
-    // DOM Elements
-    const targetInput = document.getElementById('target');
-    const portRangeInput = document.getElementById('port-range');
-    const threadsInput = document.getElementById('threads');
-    const timeoutInput = document.getElementById('timeout');
-    const usePredefinedCheck = document.getElementById('use-predefined');
-    const scanButton = document.getElementById('scan-button');
-    const stopButton = document.getElementById('stop-button');
-    const exportButton = document.getElementById('export-button');
-    const progressBar = document.getElementById('progress-bar');
-    const statusLabel = document.getElementById('status-label');
-    const resultsBody = document.getElementById('results-body');
-    const logContainer = document.getElementById('log-container');
-    const exportModal = document.getElementById('export-modal');
-    const currentTimeElem = document.getElementById('current-time');
-    
-    // Update current time
-    function updateTime() {
-        const now = new Date();
-        currentTimeElem.textContent = now.toLocaleString();
-    }
-    
-    // Initialize
-    document.addEventListener('DOMContentLoaded', function() {
-        updateTime();
-        setInterval(updateTime, 1000);
-        
-        // Event listeners
-        usePredefinedCheck.addEventListener('change', togglePortInput);
-        
-        // Add terminal typing effect to the header
-        const header = document.querySelector('h1');
-        applyTypingEffect(header);
-        
-        // Add some initial tech logs
-        setTimeout(() => {
-            addLogEntry('System initialized', 'info');
-            addLogEntry('Scanner engine loaded', 'info');
-            addLogEntry('Multithreading enabled', 'success');
-            addLogEntry('Ready to scan network targets', 'info');
-        }, 500);
-        
-        // Add input event listeners for "tech feeling"
-        targetInput.addEventListener('focus', () => {
-            addLogEntry(`Target input focused`, 'info');
-        });
-        
-        // Add port range visual feedback
-        portRangeInput.addEventListener('input', () => {
-            validatePortsVisually();
-        });
-        
-        // Add thread count visual feedback
-        threadsInput.addEventListener('input', () => {
-            const threads = parseInt(threadsInput.value);
-            if (!isNaN(threads)) {
-                if (threads > 20) {
-                    addLogEntry(`Warning: High thread count may impact system performance`, 'warning');
-                }
-            }
-        });
-    });
-    
-    // Apply typing effect to an element
-    function applyTypingEffect(element) {
-        if (!element || typingEffect) return;
-        
-        typingEffect = true;
-        const text = element.textContent;
-        element.textContent = '';
-        element.classList.add('typing-effect');
-        
-        let i = 0;
-        const typeInterval = setInterval(() => {
-            if (i < text.length) {
-                element.textContent += text.charAt(i);
-                i++;
-            } else {
-                clearInterval(typeInterval);
-                setTimeout(() => {
-                    element.classList.remove('typing-effect');
-                }, 1000);
-            }
-        }, 80);
-    }
-    
-    // Validate ports visually
-    function validatePortsVisually() {
-        try {
-            const portRangeText = portRangeInput.value.trim();
-            if (!portRangeText) return;
-            
-            // Count total ports
-            let portCount = 0;
-            const sections = portRangeText.split(',');
-            
-            for (const section of sections) {
-                if (section.includes('-')) {
-                    const [start, end] = section.split('-').map(p => parseInt(p.trim()));
-                    if (!isNaN(start) && !isNaN(end) && start <= end) {
-                        portCount += (end - start + 1);
-                    }
-                } else {
-                    if (!isNaN(parseInt(section.trim()))) {
-                        portCount++;
-                    }
-                }
-            }
-            
-            if (portCount > 100) {
-                addLogEntry(`Scan configuration: ${portCount} ports selected`, 'warning');
-            } else if (portCount > 0) {
-                addLogEntry(`Scan configuration: ${portCount} ports selected`, 'info');
-            }
-        } catch (e) {
-            // Silently fail
-        }
-    }
-    
-    // Tab navigation
-    function showTab(tabId) {
-        // Add tech sound effect
-        playTechSound('switch');
-        
-        // Hide all tab content
-        document.querySelectorAll('.tab-content').forEach(tab => {
-            tab.classList.remove('active');
-        });
-        
-        // Remove active class from all tab buttons
-        document.querySelectorAll('.tab-button').forEach(button => {
-            button.classList.remove('active');
-        });
-        
-        // Show selected tab
-        document.getElementById(tabId).classList.add('active');
-        
-        // Set active class on clicked button
-        event.currentTarget.classList.add('active');
-        
-        addLogEntry(`View switched to ${tabId.replace('-', ' ')}`, 'info');
-    }
-    
-    // Toggle port input based on checkbox
-    function togglePortInput() {
-        if (usePredefinedCheck.checked) {
-            portRangeInput.value = '21,22,23,25,80,443,3306,8080';
-            addLogEntry('Using predefined ports', 'info');
-        } else {
-            portRangeInput.value = '';
-            addLogEntry('Custom port configuration enabled', 'info');
-        }
-        
-        // Add tech sound effect
-        playTechSound('toggle');
-    }
-    
-    // Get local IP address
-    function useLocalIP() {
-        // Add tech sound effect
-        playTechSound('process');
-        
-        addLogEntry('Detecting local IP address...', 'info');
-        
-        fetch('/api/local-ip')
-            .then(response => response.json())
-            .then(data => {
-                if (data.ip) {
-                    targetInput.value = data.ip;
-                    addLogEntry(`Local IP detected: ${data.ip}`, 'success');
-                    
-                    // Visual feedback
-                    targetInput.classList.add('highlight-success');
-                    setTimeout(() => {
-                        targetInput.classList.remove('highlight-success');
-                    }, 1000);
-                }
-            })
-            .catch(error => {
-                addLogEntry(`Error detecting local IP: ${error}`, 'error');
-            });
-    }
-    
-    // Play tech sound effect
-    function playTechSound(type) {
-        // This could be implemented with actual sounds if desired
-        // For now we'll just add a visual effect
-        const body = document.body;
-        
-        switch(type) {
-            case 'process':
-                body.classList.add('processing');
-                setTimeout(() => body.classList.remove('processing'), 300);
-                break;
-            case 'success':
-                body.classList.add('success-flash');
-                setTimeout(() => body.classList.remove('success-flash'), 300);
-                break;
-            case 'error':
-                body.classList.add('error-flash');
-                setTimeout(() => body.classList.remove('error-flash'), 300);
-                break;
-            case 'switch':
-            case 'toggle':
-                // Just visual feedback in the log
-                break;
-        }
-    }
-    
-    // Validate input before starting scan
-    function validateInput() {
-        const target = targetInput.value.trim();
-        const portRange = portRangeInput.value.trim();
-        const threads = parseInt(threadsInput.value);
-        const timeout = parseFloat(timeoutInput.value);
-        
-        if (!target) {
-            addLogEntry('Error: Target host required', 'error');
-            playTechSound('error');
-            targetInput.classList.add('highlight-error');
-            setTimeout(() => targetInput.classList.remove('highlight-error'), 1000);
-            return false;
-        }
-        
-        if (!portRange) {
-            addLogEntry('Error: Port range required', 'error');
-            playTechSound('error');
-            portRangeInput.classList.add('highlight-error');
-            setTimeout(() => portRangeInput.classList.remove('highlight-error'), 1000);
-            return false;
-        }
-        
-        if (isNaN(threads) || threads < 1) {
-            addLogEntry('Error: Thread count must be at least 1', 'error');
-            playTechSound('error');
-            threadsInput.classList.add('highlight-error');
-            setTimeout(() => threadsInput.classList.remove('highlight-error'), 1000);
-            return false;
-        }
-        
-        if (isNaN(timeout) || timeout <= 0) {
-            addLogEntry('Error: Timeout must be greater than 0', 'error');
-            playTechSound('error');
-            timeoutInput.classList.add('highlight-error');
-            setTimeout(() => timeoutInput.classList.remove('highlight-error'), 1000);
-            return false;
-        }
-        
-        return true;
-    }
-    
-    // Start scan
-    function startScan() {
-        if (!validateInput()) return;
-        
-        // Add tech sound effect
-        playTechSound('process');
-        
-        const scanData = {
-            target: targetInput.value.trim(),
-            port_range: portRangeInput.value.trim(),
-            threads: parseInt(threadsInput.value),
-            timeout: parseFloat(timeoutInput.value)
-        };
-        
-        // Update UI
-        scanButton.disabled = true;
-        stopButton.disabled = false;
-        exportButton.disabled = true;
-        statusLabel.textContent = 'Scanning...';
-        progressBar.style.width = '0%';
-        
-        // Clear previous results
-        clearResults(false);
-        
-        // Matrix-like visual effect during scan
-        document.body.classList.add('scanning-mode');
-        
-        // Log scan start
-        addLogEntry(`Initializing scan engine...`, 'info');
-        addLogEntry(`Target: ${scanData.target}`, 'info');
-        addLogEntry(`Preparing ${scanData.threads} scanner threads`, 'info');
-        addLogEntry(`Timeout set to ${scanData.timeout} seconds`, 'info');
-        addLogEntry(`Scan initiated - connecting to target system`, 'success');
-        
-        // Start scan
-        fetch('/api/scan/start', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify(scanData)
-        })
-        .then(response => response.json())
-        .then(data => {
-            if (data.error) {
-                addLogEntry(`Error: ${data.error}`, 'error');
-                playTechSound('error');
-                resetScanUI();
-                return;
-            }
-            
-            scanId = data.scan_id;
-            scanActive = true;
-            
-            // Add scanning indicator to status
-            statusLabel.innerHTML = 'Scanning <span class="scan-pulse">⚡</span>';
-            
-            // Start polling for updates
-            updateInterval = setInterval(updateScanProgress, 500);
-        })
-        .catch(error => {
-            addLogEntry(`Connection error: ${error}`, 'error');
-            playTechSound('error');
-            resetScanUI();
-        });
-    }
-    
-    // Stop scan
-    function stopScan() {
-        if (!scanActive || !scanId) return;
-        
-        // Add tech sound effect
-        playTechSound('process');
-        
-        addLogEntry('User interrupt signal received', 'warning');
-        addLogEntry('Terminating scanner threads...', 'warning');
-        
-        fetch(`/api/scan/${scanId}/stop`, {
-            method: 'POST'
-        })
-        .then(response => response.json())
-        .then(data => {
-            addLogEntry('Scan process terminated by user', 'warning');
-            document.body.classList.remove('scanning-mode');
-            resetScanUI();
-        })
-        .catch(error => {
-            addLogEntry(`Error stopping scan: ${error}`, 'error');
-        });
-        
-        clearInterval(updateInterval);
-        scanActive = false;
-    }
-    
-    // Update scan progress
-    function updateScanProgress() {
-        if (!scanActive || !scanId) return;
-        
-        fetch(`/api/scan/${scanId}/status`)
-            .then(response => response.json())
-            .then(data => {
-                // Update progress bar
-                progressBar.style.width = `${data.progress}%`;
-                
-                // Add new log entries
-                if (data.logs && data.logs.length > 0) {
-                    data.logs.forEach(log => {
-                        addLogEntry(log.message, log.level);
-                    });
-                }
-                
-                // Update results table
-                if (data.results) {
-                    updateResultsTable(data.results);
-                }
-                
-                // Check if scan is complete
-                if (data.status === 'completed' || data.status === 'failed' || data.status === 'stopped') {
-                    clearInterval(updateInterval);
-                    scanActive = false;
-                    document.body.classList.remove('scanning-mode');
-                    
-                    if (data.status === 'completed') {
-                        statusLabel.textContent = `Completed in ${data.duration.toFixed(2)}s`;
-                        progressBar.style.width = '100%';
-                        
-                        // Play success sound
-                        playTechSound('success');
-                        
-                        addLogEntry(`Scan completed in ${data.duration.toFixed(2)} seconds`, 'success');
-                        addLogEntry(`Found ${resultCount} open ports`, 'success');
-                        
-                        // Enable export button if we have results
-                        if (data.results && Object.keys(data.results).length > 0) {
-                            exportButton.disabled = false;
-                            addLogEntry('Export functionality enabled', 'info');
-                        }
-                    } else if (data.status === 'failed') {
-                        statusLabel.textContent = 'Scan Failed';
-                        addLogEntry('Scan process failed', 'error');
-                        playTechSound('error');
-                    } else {
-                        statusLabel.textContent = 'Stopped';
-                    }
-                    
-                    scanButton.disabled = false;
-                    stopButton.disabled = true;
-                }
-            })
-            .catch(error => {
-                addLogEntry(`Connection error: ${error}`, 'error');
-                clearInterval(updateInterval);
-                document.body.classList.remove('scanning-mode');
-                resetScanUI();
-            });
-    }
-    
-    // Update results table
-    function updateResultsTable(results) {
-        const host = targetInput.value.trim();
-        const currentPortCount = Object.keys(results).length;
-        
-        // Only update if we have new results
-        if (currentPortCount > resultCount) {
-            const newPorts = currentPortCount - resultCount;
-            playTechSound('success');
-            addLogEntry(`Discovered ${newPorts} new open port${newPorts > 1 ? 's' : ''}`, 'success');
-            
-            // Clear and rebuild the table for animation effect
-            resultsBody.innerHTML = '';
-            
-            // Update with new result count
-            resultCount = currentPortCount;
-            
-            // Populate table with animation delay
-            let delay = 0;
-            for (const port in results) {
-                const service = results[port];
-                
-                const row = document.createElement('tr');
-                row.style.animation = `fadeIn 0.3s ease ${delay}s both`;
-                row.innerHTML = `
-                    <td>${host}</td>
-                    <td>${port}</td>
-                    <td><span class="status-badge">Open</span></td>
-                    <td>${service}</td>
-                `;
-                
-                resultsBody.appendChild(row);
-                delay += 0.05;
-            }
-        }
-    }
-    
-    // Add log entry
-    function addLogEntry(message, level) {
-        const timestamp = new Date().toLocaleTimeString();
-        const logEntry = document.createElement('div');
-        logEntry.className = `log-entry log-${level}`;
-        
-        // Add console-like prefix based on log level
-        let prefix = '>';
-        switch(level) {
-            case 'info': prefix = 'ℹ'; break;
-            case 'success': prefix = '✓'; break;
-            case 'warning': prefix = '⚠'; break;
-            case 'error': prefix = '✗'; break;
-        }
-        
-        logEntry.innerHTML = `<span class="log-time">[${timestamp}]</span> <span class="log-prefix">${prefix}</span> ${message}`;
-        
-        logContainer.appendChild(logEntry);
-        logContainer.scrollTop = logContainer.scrollHeight; // Auto-scroll to bottom
-    }
-    
-    // Reset scan UI
-    function resetScanUI() {
-        scanButton.disabled = false;
-        stopButton.disabled = true;
-        scanActive = false;
-        clearInterval(updateInterval);
-        document.body.classList.remove('scanning-mode');
-    }
-    
-    // Clear results
-    function clearResults(clearLogs = true) {
-        // Add tech sound effect
-        playTechSound('process');
-        
-        // Clear table
-        resultsBody.innerHTML = '';
-        resultCount = 0;
-        
-        // Reset progress
-        progressBar.style.width = '0%';
-        
-        // Disable export button
-        exportButton.disabled = true;
-        
-        // Clear logs if requested
-        if (clearLogs) {
-            logContainer.innerHTML = '';
-            addLogEntry('System reset: Results and logs cleared', 'info');
-        }
-        
-        // Update status
-        statusLabel.textContent = 'Ready';
-    }
-    
-    // Show export options modal
-    function showExportOptions() {
-        if (resultsBody.innerHTML === '') {
-            addLogEntry('Error: No results to export', 'error');
-            playTechSound('error');
-            return;
-        }
-        
-        // Add tech sound effect
-        playTechSound('process');
-        addLogEntry('Preparing export options...', 'info');
-        
-        exportModal.style.display = 'block';
-    }
-    
-    // Close export modal
-    function closeExportModal() {
-        // Add tech sound effect
-        playTechSound('toggle');
-        exportModal.style.display = 'none';
-    }
-    
-    // Export results
-    function exportResults(format) {
-        // Add tech sound effect
-        playTechSound('process');
-        
-        addLogEntry(`Preparing ${format.toUpperCase()} export...`, 'info');
-        
-        fetch(`/api/export/${format}?scan_id=${scanId}`)
-            .then(response => {
-                if (response.ok) {
-                    return response.blob();
-                }
-                throw new Error('Export failed');
-            })
-            .then(blob => {
-                // Create file name
-                const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-                const host = targetInput.value.trim();
-                const fileName = `${host}_scan_${timestamp}.${format}`;
-                
-                // Create download link
-                const url = window.URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = fileName;
-                document.body.appendChild(a);
-                a.click();
-                
-                // Clean up
-                window.URL.revokeObjectURL(url);
-                document.body.removeChild(a);
-                
-                playTechSound('success');
-                addLogEntry(`Export successful: ${fileName}`, 'success');
-                closeExportModal();
-            })
-            .catch(error => {
-                addLogEntry(`Export error: ${error}`, 'error');
-                playTechSound('error');
-            });
-    }
-    
-    // Add some CSS classes for the tech effects
-    document.head.insertAdjacentHTML('beforeend', `
-        <style>
-            .scanning-mode {
-                animation: scanner-pulse 2s infinite;
-            }
-            
-            @keyframes scanner-pulse {
-                0% { background-color: var(--background-color); }
-                50% { background-color: #111827; }
-                100% { background-color: var(--background-color); }
-            }
-            
-            .processing {
-                animation: processing-flash 0.3s;
-            }
-            
-            @keyframes processing-flash {
-                0% { background-color: var(--background-color); }
-                50% { background-color: rgba(2, 179, 228, 0.1); }
-                100% { background-color: var(--background-color); }
-            }
-            
-            .success-flash {
-                animation: success-flash 0.3s;
-            }
-            
-            @keyframes success-flash {
-                0% { background-color: var(--background-color); }
-                50% { background-color: rgba(39, 174, 96, 0.1); }
-                100% { background-color: var(--background-color); }
-            }
-            
-            .error-flash {
-                animation: error-flash 0.3s;
-            }
-            
-            @keyframes error-flash {
-                0% { background-color: var(--background-color); }
-                50% { background-color: rgba(231, 76, 60, 0.1); }
-                100% { background-color: var(--background-color); }
-            }
-            
-            .highlight-error {
-                animation: highlight-error 1s;
-            }
-            
-            @keyframes highlight-error {
-                0% { border-color: var(--border-color); }
-                50% { border-color: var(--secondary-color); box-shadow: 0 0 10px rgba(231, 76, 60, 0.5); }
-                100% { border-color: var(--border-color); }
-            }
-            
-            .highlight-success {
-                animation: highlight-success 1s;
-            }
-            
-            @keyframes highlight-success {
-                0% { border-color: var(--border-color); }
-                50% { border-color: var(--success-color); box-shadow: 0 0 10px rgba(39, 174, 96, 0.5); }
-                100% { border-color: var(--border-color); }
-            }
-            
-            .scan-pulse {
-                display: inline-block;
-                animation: scan-pulse 1s infinite;
-            }
-            
-            @keyframes scan-pulse {
-                0% { opacity: 0.5; transform: scale(1); }
-                50% { opacity: 1; transform: scale(1.2); }
-                100% { opacity: 0.5; transform: scale(1); }
-            }
-            
-            .status-badge {
-                display: inline-block;
-                padding: 2px 8px;
-                border-radius: 12px;
-                background-color: var(--success-color);
-                color: white;
-                font-size: 0.8rem;
-                font-weight: bold;
-            }
-            
-            .log-time {
-                color: #718096;
-            }
-            
-            .log-prefix {
-                display: inline-block;
-                width: 20px;
-                text-align: center;
-                margin-right: 5px;
-            }
-        </style>
-    `);
-    
-    // Close modal when clicking outside of it
-    window.onclick = function(event) {
-        if (event.target === exportModal) {
-            closeExportModal();
-        }
-    };
+# Optional response compression
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Load environment variables (once per process)
+from scanner_tool._env import load_env
+load_env()
+
+# Step 4: Create and configure Flask app
+# The app serves templates from the templates folder and static files from the static folder
+app = Flask(__name__, template_folder='templates', static_folder='static')
+app.secret_key = os.getenv("FLASK_SECRET_KEY", "scanner_tool_secret_key_dev")  # Use environment variable
+
+# Serialize jsonify() responses and the session cookie with orjson when it is installed
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+    app.session_interface = ORJSONSessionInterface()
+
+# Gzip text responses when flask-compress is installed
+if Compress is not None:
+    Compress(app)
+
+# Register the auth blueprint
+app.register_blueprint(auth)
+
+# Database and asset setup run from create_app() (Step 15), not at import
+
+# Step 5: Initialize core components
+# These instances will be used throughout the application
+scanner_engine = ScannerEngine()       # Creates scanner engine instance
+threading_module = ThreadingModule()   # Creates threading module instance
+
+# The export layer pulls in openpyxl and fpdf, so it is created on first export
+_data_export = None
+_data_export_lock = threading.Lock()
+
+def get_data_export():
+    """
+    Step 5.1: Return the shared DataExportLayer, importing and creating it on first use.
+    Workers that only serve pages and status polls never load the export libraries.
+    """
+    global _data_export
+    if _data_export is None:
+        with _data_export_lock:
+            if _data_export is None:
+                from scanner_tool.data_export_layer import DataExportLayer  # Handles exporting results
+                _data_export = DataExportLayer()
+    return _data_export
+
+# Step 6: Define global variables to track scan state
+# These dictionaries store information about active scans and their results
+active_scans: Dict[str, ScanState] = {}  # Maps scan_id to scan state information
+
+# Step 6.1: Locks guarding per-scan state, sharded by scan_id
+# Each scan always maps to the same shard, so concurrent scans rarely contend
+SCAN_LOCK_SHARDS = 16
+_scan_locks = [threading.RLock() for _ in range(SCAN_LOCK_SHARDS)]
+
+def scan_lock(scan_id: str) -> threading.RLock:
+    """Return the lock guarding the state of the given scan."""
+    return _scan_locks[hash(scan_id) % SCAN_LOCK_SHARDS]
+
+# Step 6.2: Bounded store of finished scan results
+# Scans leave memory after SCAN_RESULTS_TTL seconds or once SCAN_RESULTS_MAX newer
+# scans have finished; evicted results are archived to disk for later exports
+SCAN_RESULTS_MAX = 256
+SCAN_RESULTS_TTL = 3600
+
+# Step 6.2.1: Cleartext services counted as vulnerabilities in live scan stats
+VULNERABLE_SERVICES = frozenset(('telnet', 'ftp'))
+VULNERABLE_PORTS = {21: 'ftp', 23: 'telnet'}  # Default port of each service above
+
+# Step 6.2.1.1: Dashboard security issue (title, description) raised for each vulnerable service
+VULNERABLE_SERVICE_ISSUES = {
+    'telnet': ('Telnet Security Risk',
+               'Telnet (unencrypted protocol) found on {count} host(s). Consider replacing with SSH for secure remote access.'),
+    'ftp': ('FTP Security Risk',
+            'FTP (unencrypted protocol) found on {count} host(s). Consider using SFTP or FTPS for secure file transfers.'),
+}
+
+# Step 6.2.2: Common port to service mappings, used when results carry only port numbers
+PORT_SERVICES = {
+    21: 'FTP', 22: 'SSH', 23: 'Telnet', 25: 'SMTP',
+    53: 'DNS', 80: 'HTTP', 443: 'HTTPS', 3306: 'MySQL',
+    3389: 'RDP', 5900: 'VNC', 8080: 'HTTP-Proxy'
+}
+
+# Step 6.3: Files already exported per (scan_id, format), reused on repeat exports
+export_files: Dict[Tuple[str, str], str] = {}
+
+# Step 6.4: Open ports of each exported scan, filtered once and shared by every format
+export_open_ports: Dict[str, Dict[int, Dict]] = {}
+
+# Step 6.5: Dashboard totals over the summarized scans (ScanState.summary), kept current as scans finish and are evicted
+dashboard_stats = {'total_scans': 0, 'open_ports': 0, 'vulnerabilities': 0}
+dashboard_hosts: Counter = Counter()  # Summarized scans per target
+dashboard_stats_lock = threading.Lock()
+
+# Step 6.6: Version of the dashboard data, bumped after every change to the scans it lists
+dashboard_version = 0
+dashboard_changed = threading.Condition(dashboard_stats_lock)  # Notified on every bump
+
+def bump_dashboard_version():
+    """Mark cached dashboard responses as stale and wake dashboard streams. Call after the change is in place."""
+    global dashboard_version
+    with dashboard_changed:
+        dashboard_version += 1
+        dashboard_changed.notify_all()
+
+def update_dashboard_stats(summary: Dict[str, Any]):
     """
+    Add a scan summary to the dashboard totals.
     
-    if not os.path.exists('scanner_tool/static/js/script.js'):
-        with open('scanner_tool/static/js/script.js', 'w') as f:
-            f.write(js)
+    Args:
+        summary: Output of summarize_results()
+    """
+    with dashboard_stats_lock:
+        dashboard_stats['total_scans'] += 1
+        dashboard_stats['open_ports'] += summary['open_ports_count']
+        dashboard_stats['vulnerabilities'] += len(summary['vulnerabilities'])
+        dashboard_hosts[summary['target']] += 1
+
+def _forget_scan(scan_id: str):
+    """
+    Drop the results and logs of a finished scan whose results were evicted to the archive.
+    Its state stays in active_scans so the dashboard and the details endpoint still know
+    the scan; the results are read back from the archive through scan_results.
+    """
+    with scan_lock(scan_id):
+        scan_state = active_scans.get(scan_id)
+        if scan_state is not None and scan_state.status != 'running':
+            scan_state.archived = True
+            scan_state.results = {}
+            scan_state.logs.clear()
+        for key in [key for key in list(export_files) if key[0] == scan_id]:
+            export_files.pop(key, None)
+        export_open_ports.pop(scan_id, None)
+    bump_dashboard_version()
+
+scan_results = ScanResultStore(maxsize=SCAN_RESULTS_MAX, ttl=SCAN_RESULTS_TTL, on_evict=_forget_scan)  # Maps scan_id to final scan results
+
+# Step 7: Define constants
+# DEFAULT_PORTS and parse_port_range() are shared with the scanner engine
+
+# Step 8: Define directory setup function
+def ensure_directories():
+    """
+    Step 8.1: Ensure required directories exist.
+    Templates and static files ship with the package, so only the directory for
+    scan results and exports is created at runtime.
+    """
+    # Create directory for scan results
+    os.makedirs('scan_results', exist_ok=True)
+
+# Templates, stylesheet and script are shipped as package data (see pyproject.toml)
+# rather than generated at runtime
+PACKAGED_ASSETS = (
+    'templates/scanner.html',
+    'templates/index_dash.html',
+    'static/css/styles.css',
+    'static/css/dashboard.css',
+    'static/js/script.js',
+)
+
+def packaged_assets_present() -> bool:
+    """Check that the templates and static files shipped with the package are installed."""
+    package_root = importlib.resources.files('scanner_tool')
+    return all(package_root.joinpath(path).is_file() for path in PACKAGED_ASSETS)
 
 # Step 9: Define helper functions
+# Seconds the detected local IP address is reused before detecting it again
+LOCAL_IP_TTL = 300
+
 def get_local_ip():
     """
     Step 9.1: Get the local IP address of the machine.
     This helps users scan their own machine easily.
+    The address is detected at most once per LOCAL_IP_TTL seconds.
     """
-    try:
-        # Create a dummy socket to get local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        # Connect to Google's DNS (doesn't actually send data)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
-    except Exception:
-        # Return localhost if unable to determine IP
-        return "127.0.0.1"
+    return _detect_local_ip(int(time.monotonic() // LOCAL_IP_TTL))
 
-def parse_port_range(port_range: str) -> List[int]:
+@functools.lru_cache(maxsize=1)
+def _detect_local_ip(ttl_bucket: int) -> str:
     """
-    Step 10: Parse port range string into a list of port numbers.
-    This converts user input like "80,443,8000-8100" into a list of ports to scan.
+    Step 9.1.1: Detect the local IP address (cached per TTL window).
     
     Args:
-        port_range: String representing port range (e.g., "80,443,8000-8100")
+        ttl_bucket: Current TTL window; a new value forces a fresh lookup
         
     Returns:
-        List[int]: List of port numbers to scan
-    """
-    ports = []
-    # Step 10.1: Return default ports if no input provided
-    if not port_range:
-        return DEFAULT_PORTS
-    
-    # Step 10.2: Parse the port range string    
-    sections = port_range.split(',')
-    for section in sections:
-        section = section.strip()
-        if '-' in section:
-            # Handle ranges like "8000-8100"
-            start, end = map(int, section.split('-'))
-            ports.extend(range(start, end + 1))
-        else:
-            # Handle individual ports like "80"
-            ports.append(int(section))
-    
-    # Step 10.3: Remove duplicates and sort
-    return sorted(list(set(ports)))
+        str: The machine's outbound IPv4 address, or 127.0.0.1
+    """
+    try:
+        # Create a dummy socket to get local IP
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            # Connect to Google's DNS (doesn't actually send data)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except Exception:
+        # Return localhost if unable to determine IP
+        return "127.0.0.1"
 
 def scan_worker(scan_id: str, target: str, ports: List[int], thread_count: int, timeout: float):
     """
@@ -2185,18 +259,15 @@ def scan_worker(scan_id: str, target: str, ports: List[int], thread_count: int,
         timeout: Socket timeout in seconds
     """
     try:
-        # Step 11.1: Initialize scan state
-        active_scans[scan_id] = {
-            'status': 'running',     # Scan is now running
-            'progress': 0,           # 0% progress initially
-            'start_time': datetime.now(),  # Record start time
-            'logs': [],              # Empty log list
-            'results': {}            # Empty results dict
-        }
+        # Step 11.1: Scan state was created by the start endpoint
+        scan_state = active_scans[scan_id]
         
-        # Step 11.2: Resolve target hostname to IP address
+        # Step 11.2: Resolve target hostname to IP address once for the whole scan
         try:
-            ip_address = socket.gethostbyname(target)
+            ip_address = scanner_engine.resolve_target(target)
+            if not is_ipv4(ip_address):
+                raise ValueError("name did not resolve to an IPv4 address")
+            scan_state.address = ip_address
             if ip_address != target:
                 # Log hostname resolution if successful
                 add_log(scan_id, f"Resolved {target} to {ip_address}", "info")
@@ -2210,23 +281,36 @@ def scan_worker(scan_id: str, target: str, ports: List[int], thread_count: int,
         scanner_engine.timeout = timeout
         
         # Step 11.4: Set up progress tracking
+        # next() on itertools.count is atomic, so worker threads share it without a lock
         total_ports = len(ports)
-        completed_ports = 0
+        completed_ports = itertools.count(1)
+        last_progress = [0]
         
         # Step 11.5: Define progress callback function
         def update_progress(port_number, status):
-            nonlocal completed_ports
-            completed_ports += 1
             # Calculate percentage progress
-            progress = int((completed_ports / total_ports) * 100)
-            
-            # Update progress in scan state
-            active_scans[scan_id]['progress'] = progress
+            progress = next(completed_ports) * 100 // total_ports
             
-            # Log status for open ports
-            if status:
-                service = scanner_engine.fetch_service_info(port_number)
-                add_log(scan_id, f"Port {port_number} is open: {service}", "success")
+            # Update progress in scan state only when the percentage changes
+            # (at most ~100 writes per scan instead of one per port)
+            if progress != last_progress[0]:
+                last_progress[0] = progress
+                scan_state.progress = progress
+        
+        # Step 11.5.1: Record each open port as soon as it is inspected
+        # so streamed updates can show results before the scan finishes
+        def record_result(port_number, record):
+            # Log open ports (the record already carries the service name);
+            # the result and its log entry share one lock acquisition
+            entry = log_entry(f"Port {port_number} is open: {record['service']}", "success")
+            vulnerable = port_number in VULNERABLE_PORTS or record['service'].lower() in VULNERABLE_SERVICES
+            with scan_lock(scan_id):
+                if port_number not in scan_state.results:
+                    # Keep the live stats current so status polls don't recount results
+                    scan_state.open_port_count += 1
+                    scan_state.vulnerable_count += vulnerable
+                scan_state.results[port_number] = record
+                scan_state.append_log(entry)
         
         # Step 11.6: Execute the scan using the scanner engine
         # This is where the ScannerEngine and ThreadingModule work together
@@ -2235,11 +319,15 @@ def scan_worker(scan_id: str, target: str, ports: List[int], thread_count: int,
             ports,                      # Ports to scan
             threading_module,           # Threading module for parallel scanning
             thread_count,               # Number of threads to use
-            progress_callback=update_progress  # Callback for progress updates
+            progress_callback=update_progress,  # Callback for progress updates
+            address=scan_state.address,  # Address resolved above
+            result_callback=record_result  # Incremental results
         )
         
         # Step 11.7: Store scan results
-        active_scans[scan_id]['results'] = scan_results
+        with scan_lock(scan_id):
+            scan_state.results = scan_results
+            scan_state.result_kind = result_kind(scan_results)
         
         # Step 11.8: Log completion status
         if scan_results:
@@ -2266,14 +354,30 @@ def add_log(scan_id: str, message: str, level: str = "info"):
         level: Log level (info, success, warning, error)
     """
     if scan_id in active_scans:
-        # Create log entry with timestamp
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'message': message,
-            'level': level
-        }
+        # Create log entry with timestamp (outside the lock)
+        entry = log_entry(message, level)
         # Add to scan's log list
-        active_scans[scan_id]['logs'].append(log_entry)
+        with scan_lock(scan_id):
+            active_scans[scan_id].append_log(entry)
+
+def log_entry(message: str, level: str = "info") -> Dict[str, Any]:
+    """
+    Step 12.1: Build a timestamped log entry.
+    The timestamp is Unix time in seconds; a float is far cheaper to create
+    per entry than a formatted datetime.
+    
+    Args:
+        message: Log message
+        level: Log level (info, success, warning, error)
+        
+    Returns:
+        Dict[str, Any]: Entry as stored in ScanState.logs
+    """
+    return {
+        'timestamp': time.time(),
+        'message': message,
+        'level': level
+    }
 
 def complete_scan(scan_id: str, status: str):
     """
@@ -2285,15 +389,258 @@ def complete_scan(scan_id: str, status: str):
         status: Final status (completed, failed, stopped)
     """
     if scan_id in active_scans:
-        # Update scan status
-        active_scans[scan_id]['status'] = status
-        # Record end time
-        active_scans[scan_id]['end_time'] = datetime.now()
+        with scan_lock(scan_id):
+            scan_state = active_scans[scan_id]
+            # Update scan status
+            scan_state.status = status
+            # Record end time
+            scan_state.end_time = datetime.now()
+        
+        # Store results in the bounded results store for later access
+        # (outside the lock: storing may evict and lock other scans)
+        results = scan_state.results  # Kept here: eviction (e.g. zero TTL) empties scan_state.results
+        scan_results[scan_id] = results
+        export_open_ports.pop(scan_id, None)
+        
+        # Summarize once for the dashboard; results don't change after this point
+        try:
+            summary = summarize_results(scan_id, scan_state.target, results, scan_state.result_kind)
+        except Exception as e:
+            app.logger.error("Error summarizing scan results for %s: %s", scan_id, e)
+            summary = summarize_results(scan_id, scan_state.target, {}, 'ports')
+        with scan_lock(scan_id):
+            if active_scans.get(scan_id) is scan_state and scan_state.summary is None:
+                scan_state.summary = summary
+                update_dashboard_stats(summary)
+        bump_dashboard_version()
+
+def scan_results_of(scan_id: str, scan_state: ScanState) -> Dict[int, Dict[str, Any]]:
+    """
+    Results of a scan, read back from the archive once they were evicted from memory.
+    
+    Args:
+        scan_id: Unique ID for the scan
+        scan_state: State of the scan
+        
+    Returns:
+        Dict[int, Dict[str, Any]]: Results keyed by port number
+    """
+    if scan_state.archived:
+        return scan_results.get(scan_id, {})
+    return scan_state.results
+
+def get_open_ports(scan_id: str) -> Dict[int, Dict]:
+    """
+    Step 13.1: Open ports of a finished scan, keyed by port number.
+    Filtered once per scan, so exporting in several formats doesn't repeat the work.
+    
+    Args:
+        scan_id: Unique ID for the scan
+        
+    Returns:
+        Dict[int, Dict]: Open ports and their details (empty if none)
+    """
+    open_ports = export_open_ports.get(scan_id)
+    if open_ports is None:
+        # The engine only returns open ports, so entries without a status count as open
+        results = scan_results.get(scan_id, {})
+        # Keys are already ints for in-process and archived scans; only cast string keys
+        if isinstance(next(iter(results), None), str):
+            open_ports = {int(port): data for port, data in results.items() if data.get('status', 'open') == 'open'}
+        else:
+            open_ports = {port: data for port, data in results.items() if data.get('status', 'open') == 'open'}
+        # Scans already evicted to the archive have no eviction left to clear the entry
+        scan_state = active_scans.get(scan_id)
+        if scan_state is not None and not scan_state.archived:
+            export_open_ports[scan_id] = open_ports
+    return open_ports
+
+def summarize_results(scan_id: str, target: str, results: Any, kind: str) -> Dict[str, Any]:
+    """
+    Step 13.2: Dashboard summary of a scan: target, open port count, services and vulnerabilities.
+    
+    Args:
+        scan_id: Unique ID for the scan
+        target: Host that was scanned
+        results: Results keyed by port number, or a list of result dicts or port numbers
+        kind: Shape of the results, from result_kind()
+        
+    Returns:
+        Dict[str, Any]: Summary used by the dashboard
+    """
+    
+    # Normalize to parallel columns of open port numbers and their services
+    if kind == 'ports':
+        # The engine only returns open ports, keyed by port number
+        open_ports = [port for port, data in results.items() if data.get('status', 'open') == 'open']
+        services = [results[port].get('service') or '' for port in open_ports]
+    elif kind == 'dicts':
+        rows = [r for r in results if r.get('status') == 'open']
+        open_ports = [r.get('port') for r in rows]
+        services = [r.get('service') or '' for r in rows]
+    elif kind == 'ints':
+        # All ports in this list are considered open
+        open_ports = list(results)
+        services = [PORT_SERVICES.get(port, '') for port in open_ports]
+    else:
+        app.logger.warning("Unexpected scan results format for scan_id %s: %s", scan_id, type(results))
+        open_ports, services = [], []
+    
+    # Same rule as the live vulnerability count in scan_worker()
+    vulnerabilities = [
+        {
+            'port': port,
+            'service': service if service in VULNERABLE_SERVICES else VULNERABLE_PORTS[port],
+            'severity': 'high'
+        }
+        for port, service in zip(open_ports, map(str.lower, services))
+        if service in VULNERABLE_SERVICES or port in VULNERABLE_PORTS
+    ]
+    
+    return {
+        'target': target,
+        'open_ports_count': len(open_ports),
+        'services': list(itertools.islice(filter(None, dict.fromkeys(services)), 3)),  # First 3 distinct services, for display
+        'vulnerabilities': vulnerabilities
+    }
+
+@functools.lru_cache(maxsize=256)
+def _render_page(template_name: str, username: Optional[str]) -> Tuple[str, str]:
+    """
+    Render a template once per signed-in user and compute its ETag.
+
+    The pages only vary with the username shown in the header, so the
+    username is part of the cache key. Comments and runs of whitespace are
+    stripped once here when htmlmin is installed. Must be called inside a request.
+
+    Args:
+        template_name: Template to render
+        username: Username from the session (None when absent)
+
+    Returns:
+        Tuple[str, str]: Rendered HTML and its ETag
+    """
+    html = render_template(template_name)
+    if minify_html is not None:
+        html = minify_html(html, remove_comments=True)
+    return html, hashlib.blake2b(html.encode(), digest_size=8).hexdigest()
+
+def cached_page(template_name: str):
+    """
+    Serve a rendered page from the cache, answering 304 when the client's
+    If-None-Match still matches. Templates are re-rendered in debug mode so
+    edits show up without a restart.
+
+    Args:
+        template_name: Template to render
+
+    Returns:
+        Response: HTML response (or 304 Not Modified)
+    """
+    username = session.get('username')
+    if app.debug:
+        html, etag = _render_page.__wrapped__(template_name, username)
+    else:
+        html, etag = _render_page(template_name, username)
+    response = app.response_class(html, mimetype='text/html')
+    response.set_etag(etag)
+    # Revalidate on every visit so login_required still runs before a 304
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+# Cache lifetime for versioned static files (one year)
+STATIC_MAX_AGE = 31536000
+
+@functools.lru_cache(maxsize=256)
+def static_version(filename: str) -> Optional[str]:
+    """
+    Short content hash of a static file, computed once per process.
+    
+    Args:
+        filename: Path relative to the static folder
+        
+    Returns:
+        Optional[str]: First 8 hex digits of the SHA-1, or None if the file is missing
+    """
+    try:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()[:8]
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=256)
+def static_asset(filename: str) -> str:
+    """
+    Prefer the minified copy written by build_assets, when there is one.
+    
+    Args:
+        filename: Path relative to the static folder
         
-        # Store results in the global results dictionary for later access
-        scan_results[scan_id] = active_scans[scan_id]['results']
+    Returns:
+        str: The .min variant if it exists, otherwise filename
+    """
+    minified = min_path(filename)
+    if os.path.exists(os.path.join(app.static_folder, minified)):
+        return minified
+    return filename
+
+@app.url_defaults
+def add_static_version(endpoint: str, values: Dict):
+    """
+    Append ?v=<content hash> to url_for('static', ...) so each URL names one
+    version of the file and can be cached forever, swapping in the minified
+    build of the file if present. Skipped in debug mode so edited files are
+    picked up without a restart.
+    """
+    if endpoint == 'static' and 'filename' in values and not app.debug and not values['filename'].startswith('..'):
+        values['filename'] = static_asset(values['filename'])
+        version = static_version(values['filename'])
+        if version:
+            values.setdefault('v', version)
+
+@app.after_request
+def cache_versioned_static(response):
+    """
+    Mark versioned static responses immutable so browsers stop revalidating them.
+    """
+    if request.endpoint == 'static' and 'v' in request.args and response.status_code == 200:
+        response.cache_control.no_cache = None  # Set by send_static_file
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    return response
 
 # Step 14: Define Flask routes
+# Approved feedback is shared by the landing page and the public API, and
+# changes rarely; keep the last query result for a short time
+APPROVED_FEEDBACK_TTL = 30
+_approved_feedback = {'expires': 0.0, 'data': []}
+_approved_feedback_lock = threading.Lock()
+
+def get_approved_feedback_list() -> List[Dict]:
+    """
+    Step 11.0: Approved feedback, newest first, cached for APPROVED_FEEDBACK_TTL seconds.
+    
+    Returns:
+        List[Dict]: Approved feedback rows from Supabase
+    """
+    with _approved_feedback_lock:
+        if time.monotonic() < _approved_feedback['expires']:
+            return _approved_feedback['data']
+    # Query outside the lock; concurrent misses just refresh the same value
+    supabase = get_supabase()
+    response = supabase.table('feedback').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
+    data = response.data or []
+    with _approved_feedback_lock:
+        _approved_feedback['data'] = data
+        _approved_feedback['expires'] = time.monotonic() + APPROVED_FEEDBACK_TTL
+    return data
+
+def invalidate_approved_feedback():
+    """Drop the cached approved feedback after an admin changes it."""
+    with _approved_feedback_lock:
+        _approved_feedback['expires'] = 0.0
+
 @app.route('/')
 def index():
     """
@@ -2301,13 +648,10 @@ def index():
     This page shows a list of approved feedback items.
     """
     try:
-        # Fetch approved feedback from Supabase
-        supabase = get_supabase()
-        response = supabase.table('feedback').select('*').eq('is_approved', True).order('created_at', desc=True).limit(6).execute()
-        
-        approved_feedback = response.data if response.data else []
+        # Latest approved feedback (cached, shared with /api/feedback/approved)
+        approved_feedback = get_approved_feedback_list()[:6]
     except Exception as e:
-        app.logger.error(f"Error fetching approved feedback: {e}")
+        app.logger.error("Error fetching approved feedback: %s", e)
         approved_feedback = []
         
     return render_template('landing.html', feedback=approved_feedback)
@@ -2392,6 +736,7 @@ def approve_feedback(feedback_id):
         result = supabase.table('feedback').update({"is_approved": True}).eq('id', feedback_id).execute()
         
         if result.data and len(result.data) > 0:
+            invalidate_approved_feedback()
             return jsonify({'status': 'success', 'message': 'Feedback approved'})
         else:
             return jsonify({'status': 'error', 'message': 'Feedback not found'}), 404
@@ -2409,6 +754,7 @@ def delete_feedback(feedback_id):
         result = supabase.table('feedback').delete().eq('id', feedback_id).execute()
         
         if result.data and len(result.data) > 0:
+            invalidate_approved_feedback()
             return jsonify({'status': 'success', 'message': 'Feedback deleted'})
         else:
             return jsonify({'status': 'error', 'message': 'Feedback not found'}), 404
@@ -2420,11 +766,11 @@ def delete_feedback(feedback_id):
 def get_approved_feedback():
     """API endpoint to get approved feedback for public display."""
     try:
-        # Fetch approved feedback from Supabase
-        supabase = get_supabase()
-        feedback = supabase.table('feedback').select('*').eq('is_approved', True).order('created_at', desc=True).execute()
-        
-        return jsonify({'status': 'success', 'feedback': feedback.data})
+        # Approved feedback (cached), with an ETag so unchanged lists return 304
+        response = jsonify({'status': 'success', 'feedback': get_approved_feedback_list()})
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Error retrieving feedback: {str(e)}'}), 500
 
@@ -2488,53 +834,56 @@ def api_export_history():
             'message': f'Error retrieving export history: {str(e)}'
         }), 500
 
-@app.route('/api/export/<int:export_id>/download', methods=['GET'])
-@login_required
-def download_export(export_id):
-    """Download a previously exported file."""
-    try:
-        with sqlite3.connect(os.path.join(os.path.dirname(__file__), 'users.db')) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM scan_exports WHERE id = ?", (export_id,))
-            export = cursor.fetchone()
-            
-            if not export:
-                return jsonify({'error': 'Export not found'}), 404
-            
-            # Check if user has permission (is the owner)
-            user_id = session.get('user_id')
-            if export['user_id'] and export['user_id'] != user_id:
-                return jsonify({'error': 'Permission denied'}), 403
-            
-            filepath = export['file_path']
-            
-            # Check if file exists
-            if not os.path.exists(filepath):
-                return jsonify({'error': 'Export file not found'}), 404
-            
-            # Send file as download attachment
-            return send_from_directory(
-                os.path.dirname(os.path.abspath(filepath)),
-                os.path.basename(filepath),
-                as_attachment=True
-            )
-            
+@app.route('/api/export/<int:export_id>/download', methods=['GET'])
+@login_required
+def download_export(export_id):
+    """Download a previously exported file."""
+    try:
+        # Export history lives in Supabase (see api_export_history); the shared
+        # client keeps its HTTP connections open across requests
+        supabase = get_supabase()
+        response = supabase.table('scan_exports').select('user_id, file_path').eq('id', export_id).limit(1).execute()
+        export = response.data[0] if response.data else None
+        
+        if not export:
+            return jsonify({'error': 'Export not found'}), 404
+        
+        # Check if user has permission (is the owner)
+        user_id = session.get('user_id')
+        if export['user_id'] and export['user_id'] != user_id:
+            return jsonify({'error': 'Permission denied'}), 403
+        
+        filepath = export['file_path']
+        
+        # Check if file exists
+        if not filepath or not os.path.exists(filepath):
+            return jsonify({'error': 'Export file not found'}), 404
+        
+        # Send file as download attachment; conditional adds ETag/Last-Modified
+        # checks and Range support so repeat and resumed downloads are cheap
+        return send_file(
+            os.path.abspath(filepath),
+            as_attachment=True,
+            download_name=os.path.basename(filepath),
+            conditional=True,
+            etag=True
+        )
+        
     except Exception as e:
-        app.logger.error(f"Error downloading export: {e}")
+        app.logger.error("Error downloading export: %s", e)
         return jsonify({'error': f'Download failed: {str(e)}'}), 500
 
 @app.route('/scanner')
 @login_required
 def scanner_page():
     """Render the scanner page."""
-    return render_template('scanner.html')
+    return cached_page('scanner.html')
 
 @app.route('/dashboard')
 @login_required
 def dashboard():
     """Render the dashboard page."""
-    return render_template('index_dash.html')
+    return cached_page('index_dash.html')
 
 @app.route('/api/local-ip', methods=['GET'])
 def api_local_ip():
@@ -2552,7 +901,6 @@ def api_start_scan():
     """
     # Step 14.3.1: Get JSON data from request
     data = request.json
-    import multiprocessing
     
     # Step 14.3.2: Validate input
     if not data or 'target' not in data:
@@ -2564,10 +912,12 @@ def api_start_scan():
     thread_count = int(data.get('threads', 10))
     timeout = float(data.get('timeout', 1.0))
     
-    # Step 14.3.4: Validate and limit thread count based on CPU resources
+    if not is_valid_target(target):
+        return jsonify({'error': 'Invalid target host'}), 400
+    
+    # Step 14.3.4: Validate and limit thread count based on CPU and file descriptor resources
     # This prevents excessive resource usage
-    cpu_count = multiprocessing.cpu_count()
-    max_recommended_threads = cpu_count * 2
+    max_recommended_threads = threading_module.MAX_THREAD_COUNT
     
     # Define the warning function outside the condition to ensure it's always available
     def add_thread_warning(scan_id, original_count, max_count):
@@ -2598,8 +948,15 @@ def api_start_scan():
     except ValueError:
         return jsonify({'error': 'Invalid port range'}), 400
     
-    # Step 14.3.6: Generate unique scan ID using timestamp and target
-    scan_id = f"{int(time.time())}_{target}"
+    # Step 14.3.6: Generate unique scan ID from a random prefix and the target
+    # (a per-second timestamp let two quick scans of one target overwrite each other;
+    # hex has no '_', so the target can still be recovered from the ID)
+    scan_id = f"{secrets.token_hex(6)}_{target}"
+    
+    # Register the scan before starting the worker so early logs and status polls find it
+    with scan_lock(scan_id):
+        active_scans[scan_id] = ScanState(target=target)
+    bump_dashboard_version()
     
     # Step 14.3.7: Show thread warning if needed
     if should_warn:
@@ -2614,8 +971,53 @@ def api_start_scan():
     )
     scan_thread.start()
     
-    # Step 14.3.9: Return scan ID to client for status tracking
-    return jsonify({'scan_id': scan_id})
+    # Step 14.3.9: Return scan ID and the thread count actually used
+    return jsonify({
+        'scan_id': scan_id,
+        'threads': thread_count,
+        'thread_limit': max_recommended_threads
+    })
+
+def scan_status_payload(scan_id: str, scan_data: ScanState, logs_index: int = 0) -> Dict:
+    """
+    Build the status update shared by polling and the event stream.
+    
+    Args:
+        scan_id: Unique ID for the scan
+        scan_data: State of the scan
+        logs_index: Number of log entries the client already has
+        
+    Returns:
+        Dict: Status, progress, new log entries and (once finished) results
+    """
+    # Calculate scan duration if scan is complete
+    duration = scan_data.duration
+    
+    # Get new logs since last fetch (for incremental updates)
+    # Slice and count under the scan's lock so the returned index matches the logs sent
+    with scan_lock(scan_id):
+        log_count = scan_data.log_count
+        new_logs = scan_data.logs_since(logs_index)
+    
+    # Prepare response with current status
+    response = {
+        'status': scan_data.status,          # running, completed, failed, or stopped
+        'progress': scan_data.progress,      # percentage complete (0-100)
+        'logs': new_logs,                    # new log entries since last fetch
+        'logs_index': log_count,             # current log index for next update
+        'duration': duration,                # scan duration in seconds
+        'real_time_stats': {
+            # Counted by scan_worker as ports are found
+            'open_ports': scan_data.open_port_count,
+            'vulnerabilities': scan_data.vulnerable_count
+        }
+    }
+    
+    # Include results if scan is complete
+    if scan_data.status in ['completed', 'failed', 'stopped']:
+        response['results'] = scan_results_of(scan_id, scan_data)
+    
+    return response
 
 @app.route('/api/scan/<scan_id>/status', methods=['GET'])
 def api_scan_status(scan_id):
@@ -2627,59 +1029,71 @@ def api_scan_status(scan_id):
     if scan_id not in active_scans:
         return jsonify({'error': 'Scan not found'}), 404
     
-    # Step 14.4.2: Get scan data
-    scan_data = active_scans[scan_id]
-    
-    # Step 14.4.3: Add CPU core information if not already present
-    if 'cpu_cores' not in scan_data:
-        import multiprocessing
-        scan_data['cpu_cores'] = multiprocessing.cpu_count()
-        scan_data['max_recommended_threads'] = scan_data['cpu_cores'] * 2
-    
-    # Step 14.4.4: Calculate scan duration if scan is complete
-    duration = 0
-    if 'end_time' in scan_data and scan_data['start_time']:
-        duration = (scan_data['end_time'] - scan_data['start_time']).total_seconds()
-    
-    # Step 14.4.5: Get new logs since last fetch (for incremental updates)
+    # Step 14.4.2: Get new logs since last fetch (for incremental updates)
     logs_index = int(request.args.get('logs_index', 0))
-    new_logs = scan_data['logs'][logs_index:] if logs_index < len(scan_data['logs']) else []
-    
-    # Calculate real-time statistics for open ports and vulnerabilities
-    current_results = scan_data.get('results', [])
-    open_ports_count = 0
-    vulnerabilities_count = 0
-    
-    # Process current results for statistics
-    if isinstance(current_results, list):
-        if all(isinstance(r, dict) for r in current_results):
-            open_ports_count = len([r for r in current_results if r.get('status') == 'open'])
-            # Check for vulnerable services
-            vulnerabilities_count = len([r for r in current_results if r.get('service', '').lower() in ['telnet', 'ftp']])
-        else:
-            open_ports_count = len(current_results)  # If it's a list of port numbers
-            # Check for vulnerable ports
-            vulnerabilities_count = len([p for p in current_results if p in [21, 23]])  # FTP and Telnet ports
-    
-    # Step 14.4.6: Prepare response with current status
-    response = {
-        'status': scan_data['status'],       # running, completed, failed, or stopped
-        'progress': scan_data['progress'],   # percentage complete (0-100)
-        'logs': new_logs,                    # new log entries since last fetch
-        'logs_index': len(scan_data['logs']), # current log index for next update
-        'duration': duration,                # scan duration in seconds
-        'real_time_stats': {
-            'open_ports': open_ports_count,
-            'vulnerabilities': vulnerabilities_count
-        }
-    }
+    scan_data = active_scans[scan_id]
     
-    # Step 14.4.7: Include results if scan is complete
-    if scan_data['status'] in ['completed', 'failed', 'stopped']:
-        response['results'] = scan_data['results']
+    # Step 14.4.3: Answer 304 before building the payload if the client already has it
+    # Everything in the payload derives from these fields, so they make a cheap weak ETag
+    etag = f"{scan_data.status}-{scan_data.progress}-{scan_data.log_count}-{len(scan_data.results)}-{logs_index}"
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(scan_status_payload(scan_id, scan_data, logs_index))
+    response.set_etag(etag, weak=True)
+    # The client sends If-None-Match itself; keep the browser cache out of the way
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+# Seconds between checks of a streamed scan, and between keep-alive comments
+SCAN_STREAM_INTERVAL = 0.5
+SCAN_STREAM_KEEPALIVE = 15
+
+@app.route('/api/scan/<scan_id>/stream')
+def api_scan_stream(scan_id):
+    """
+    Step 14.4.4: Stream scan updates as Server-Sent Events.
+    One connection replaces status polling; each event carries only the log
+    entries and open ports added since the previous one.
+    """
+    if scan_id not in active_scans:
+        return jsonify({'error': 'Scan not found'}), 404
     
-    # Step 14.4.8: Return JSON response to client
-    return jsonify(response)
+    def generate():
+        logs_index = 0
+        last_progress = None
+        sent_ports = set()
+        last_sent = time.monotonic()
+        while True:
+            scan_data = active_scans.get(scan_id)
+            if scan_data is None:
+                return
+            finished = scan_data.status != 'running'
+            if (finished or scan_data.progress != last_progress or scan_data.log_count > logs_index
+                    or len(scan_data.results) > len(sent_ports)):
+                payload = scan_status_payload(scan_id, scan_data, logs_index)
+                logs_index = payload['logs_index']
+                # Send only the open ports the client hasn't received yet
+                with scan_lock(scan_id):
+                    new_results = {port: record for port, record in scan_data.results.items()
+                                   if port not in sent_ports}
+                sent_ports.update(new_results)
+                payload['results'] = new_results
+                last_progress = scan_data.progress
+                last_sent = time.monotonic()
+                yield f"data: {app.json.dumps(payload)}\n\n"
+                if finished:
+                    return
+            elif time.monotonic() - last_sent >= SCAN_STREAM_KEEPALIVE:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+            time.sleep(SCAN_STREAM_INTERVAL)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/api/scan/<scan_id>/stop', methods=['POST'])
 def api_stop_scan(scan_id):
@@ -2697,6 +1111,137 @@ def api_stop_scan(scan_id):
     # Step 14.5.3: Return stopped status to client
     return jsonify({'status': 'stopped'})
 
+# Formats written to files by the export layer
+EXPORT_FORMATS = ('csv', 'excel', 'pdf', 'json')
+
+# Pool for writing several formats of one scan at once (see api_export_all)
+_export_pool = ThreadPoolExecutor(max_workers=len(EXPORT_FORMATS), thread_name_prefix='export')
+
+def export_scan_file(scan_id: str, format_type: str, open_ports: Dict[int, Dict], target_host: str) -> str:
+    """
+    Step 14.6.1: Write one export file for a scan, reusing an earlier file of the same format.
+    
+    Args:
+        scan_id: Unique ID for the scan
+        format_type: One of EXPORT_FORMATS
+        open_ports: Open ports to export
+        target_host: Host that was scanned
+        
+    Returns:
+        str: Path to the export file, or "" if the export failed
+    """
+    # Results don't change once a scan has finished
+    export_key = (scan_id, format_type)
+    with scan_lock(scan_id):
+        filepath = export_files.get(export_key, "")
+    if filepath and os.path.exists(filepath):
+        app.logger.info("Reusing %s export for %s: %s", format_type, scan_id, filepath)
+        return filepath
+    
+    exporter = get_data_export()
+    export = {
+        'csv': exporter.export_to_csv,
+        'excel': exporter.export_to_excel,
+        'pdf': exporter.export_to_pdf,
+        'json': exporter.export_to_json,
+    }[format_type]
+    filepath = export(open_ports, target_host)
+    if filepath:
+        with scan_lock(scan_id):
+            export_files[export_key] = filepath
+    return filepath
+
+def export_download_url(filepath: str) -> str:
+    """
+    Step 14.6.2: URL the browser downloads an export file from.
+    
+    Args:
+        filepath: Path returned by export_scan_file()
+        
+    Returns:
+        str: Static URL for the file
+    """
+    return url_for(
+        'static',
+        filename=os.path.relpath(filepath, app.static_folder)
+        if filepath.startswith(app.static_folder)
+        else f'../scan_results/{os.path.basename(filepath)}'
+    )
+
+@app.route('/api/export/all', methods=['GET'])
+def api_export_all():
+    """
+    API endpoint that exports a scan in every format at once.
+    The formats are written concurrently so the quick CSV/JSON exports overlap
+    with Excel and PDF, and their history records go to Supabase in one insert.
+    """
+    scan_id = request.args.get('scan_id')
+    if not scan_id or scan_id not in scan_results:
+        return jsonify({
+            'status': 'error',
+            'message': 'Invalid or missing scan ID'
+        }), 400
+    
+    target_host = active_scans[scan_id].target if scan_id in active_scans else scan_id.split('_', 1)[-1]
+    open_ports = get_open_ports(scan_id)
+    if not open_ports:
+        return jsonify({
+            'status': 'error',
+            'message': 'No open ports found to export'
+        }), 404
+    
+    futures = {
+        format_type: _export_pool.submit(export_scan_file, scan_id, format_type, open_ports, target_host)
+        for format_type in EXPORT_FORMATS
+    }
+    
+    exports = []
+    failed = []
+    history = []  # Export history records, inserted together once all formats are written
+    user_id = session.get('user_id')
+    exporter = get_data_export()
+    for format_type, future in futures.items():
+        try:
+            filepath = future.result()
+        except Exception as e:
+            app.logger.error("%s export error: %s", format_type, e)
+            filepath = ""
+        if not filepath:
+            failed.append(format_type)
+            continue
+        exporter.store_export_history(
+            scan_id=scan_id,
+            target_host=target_host,
+            export_format=format_type,
+            file_path=filepath,
+            user_id=user_id,
+            scan_results=open_ports,
+            batch=history  # Sent together below
+        )
+        exports.append({
+            'format': format_type,
+            'download_url': export_download_url(filepath),
+            'filename': os.path.basename(filepath)
+        })
+    
+    try:
+        exporter.flush_export_history(history)
+    except Exception as export_error:
+        app.logger.error("Failed to store export history in Supabase: %s", export_error)
+    
+    if not exports:
+        return jsonify({
+            'status': 'error',
+            'message': 'Failed to export scan results'
+        }), 500
+    
+    return jsonify({
+        'status': 'success',
+        'message': f'Scan results exported to {len(exports)} formats',
+        'exports': exports,
+        'failed': failed
+    })
+
 @app.route('/api/export/<format_type>', methods=['GET'])
 def api_export_results(format_type):
     """
@@ -2713,38 +1258,26 @@ def api_export_results(format_type):
             'message': 'Invalid or missing scan ID'
         }), 400
     
-    # Get target host and results
-    results = scan_results.get(scan_id, {})
-    target_host = active_scans.get(scan_id, {}).get('target', 'unknown')
+    # Get target host and open ports
+    target_host = active_scans[scan_id].target if scan_id in active_scans else scan_id.split('_', 1)[-1]
     
     # Check if we have open ports to export
-    open_ports = {}
-    for port, data in results.items():
-        if data.get('status') == 'open':
-            open_ports[int(port)] = data
-    
+    open_ports = get_open_ports(scan_id)
     if not open_ports:
         return jsonify({
             'status': 'error',
             'message': 'No open ports found to export'
         }), 404
     
+    if format_type.lower() not in EXPORT_FORMATS:
+        return jsonify({
+            'status': 'error',
+            'message': f'Unsupported export format: {format_type}'
+        }), 400
+    
     try:
         # Export the results based on the requested format
-        filepath = ""
-        if format_type.lower() == 'csv':
-            filepath = data_export.export_to_csv(open_ports, target_host)
-        elif format_type.lower() == 'excel':
-            filepath = data_export.export_to_excel(open_ports, target_host)
-        elif format_type.lower() == 'pdf':
-            filepath = data_export.export_to_pdf(open_ports, target_host)
-        elif format_type.lower() == 'json':
-            filepath = data_export.export_to_json(open_ports, target_host)
-        else:
-            return jsonify({
-                'status': 'error',
-                'message': f'Unsupported export format: {format_type}'
-            }), 400
+        filepath = export_scan_file(scan_id, format_type.lower(), open_ports, target_host)
         
         if not filepath:
             return jsonify({
@@ -2759,7 +1292,7 @@ def api_export_results(format_type):
         user_id = session.get('user_id')
         try:
             # Attempt to store the export history in Supabase
-            data_export.store_export_history(
+            get_data_export().store_export_history(
                 scan_id=scan_id,
                 target_host=target_host,
                 export_format=format_type.lower(),
@@ -2767,164 +1300,263 @@ def api_export_results(format_type):
                 user_id=user_id,  # May be None if user is not logged in
                 scan_results=open_ports
             )
-            app.logger.info(f"Export history stored in Supabase: {scan_id}, {format_type}")
+            app.logger.info("Export history stored in Supabase: %s, %s", scan_id, format_type)
         except Exception as export_error:
-            app.logger.error(f"Failed to store export history in Supabase: {str(export_error)}")
+            app.logger.error("Failed to store export history in Supabase: %s", export_error)
             # Continue with the export even if Supabase storage fails
         
         # Return the download link
-        download_url = url_for(
-            'static',
-            filename=os.path.relpath(filepath, app.static_folder)
-            if filepath.startswith(app.static_folder)
-            else f'../scan_results/{filename}'
-        )
-        
         return jsonify({
             'status': 'success',
             'message': f'Scan results exported to {format_type.upper()}',
-            'download_url': download_url,
+            'download_url': export_download_url(filepath),
             'filename': filename
         })
         
     except Exception as e:
-        app.logger.error(f"Export error: {str(e)}")
+        app.logger.error("Export error: %s", e)
         return jsonify({
             'status': 'error',
             'message': f'Export error: {str(e)}'
         }), 500
 
+# Formats that can be streamed row by row, with their MIME types
+STREAM_EXPORT_TYPES = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+}
+
+@app.route('/api/export/<format_type>/stream', methods=['GET'])
+def api_export_stream(format_type):
+    """
+    API endpoint that streams a CSV or JSON export straight to the client.
+    Nothing is written to disk, so the first bytes go out immediately and memory
+    stays at one row; Excel and PDF still go through api_export_results().
+    
+    Args:
+        format_type: The format to export to (csv or json)
+    """
+    format_type = format_type.lower()
+    if format_type not in STREAM_EXPORT_TYPES:
+        return jsonify({
+            'status': 'error',
+            'message': f'Unsupported stream format: {format_type}'
+        }), 400
+    
+    scan_id = request.args.get('scan_id')
+    if not scan_id or scan_id not in scan_results:
+        return jsonify({
+            'status': 'error',
+            'message': 'Invalid or missing scan ID'
+        }), 400
+    
+    target_host = active_scans[scan_id].target if scan_id in active_scans else scan_id.split('_', 1)[-1]
+    open_ports = get_open_ports(scan_id)
+    if not open_ports:
+        return jsonify({
+            'status': 'error',
+            'message': 'No open ports found to export'
+        }), 404
+    
+    exporter = get_data_export()
+    chunks = exporter.stream_csv(open_ports, target_host) if format_type == 'csv' else exporter.stream_json(open_ports, target_host)
+    filename = f"{target_host}_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format_type}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=STREAM_EXPORT_TYPES[format_type],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+# Seconds a built dashboard response may be served again while no scan changes
+DASHBOARD_CACHE_TTL = 2
+
+# Seconds a dashboard stream stays open before the client is asked to reconnect;
+# kept under the function timeout on serverless deployments
+DASHBOARD_STREAM_MAX_AGE = 25 if os.environ.get('VERCEL') else 240
+# Milliseconds EventSource waits before reconnecting after the stream closes
+DASHBOARD_STREAM_RETRY_MS = 2000
+_dashboard_cache = {'version': -1, 'expires': 0.0, 'body': b'', 'etag': ''}
+
 @app.route('/api/dashboard/scans')
 @login_required
 def api_dashboard_data():
     """
     API endpoint to get dashboard data including all scans, statistics, and security issues.
-    This provides data for the real-time dashboard.
+    This provides data for the real-time dashboard. The serialized response is reused
+    until a scan starts, finishes or is evicted, with an ETag so unchanged polls return 304.
+    With ?limit=N only the N most recent scans are returned, for clients that fetch
+    the stats and security issues from their own endpoints.
     """
-    # Collect all completed scans (from both active_scans and scan_results)
-    all_scans = []
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        return dashboard_section_response(f'scans{limit}', lambda: recent_dashboard_scans(limit))
+    
+    body, etag = dashboard_body()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+@app.route('/api/dashboard/stream')
+@login_required
+def api_dashboard_stream():
+    """
+    Stream the dashboard data as Server-Sent Events.
+    An event is sent on connect and then only when dashboard_version changes,
+    so idle dashboards cost no work between scan events. Each stream closes after
+    DASHBOARD_STREAM_MAX_AGE seconds and EventSource reconnects, so no connection
+    holds a worker indefinitely. A closed tab is noticed at the next write
+    (at most SCAN_STREAM_KEEPALIVE seconds later), when the server closes the generator.
+    """
+    def generate():
+        closes_at = time.monotonic() + DASHBOARD_STREAM_MAX_AGE
+        version = -1
+        yield f"retry: {DASHBOARD_STREAM_RETRY_MS}\n\n"
+        while True:
+            remaining = closes_at - time.monotonic()
+            if remaining <= 0:
+                return
+            with dashboard_changed:
+                changed = dashboard_changed.wait_for(lambda: dashboard_version != version,
+                                                     timeout=min(SCAN_STREAM_KEEPALIVE, remaining))
+                version = dashboard_version
+            if not changed:
+                yield ": keep-alive\n\n"
+                continue
+            body, _ = dashboard_body()
+            # Pretty-printed (debug) JSON spans lines; each needs its own data: prefix
+            data = body.decode().strip().replace('\n', '\ndata: ')
+            yield f"data: {data}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def dashboard_body() -> Tuple[bytes, str]:
+    """
+    Serialized dashboard data and its ETag, rebuilt only when stale.
     
-    # Add completed scans from scan_results
-    for scan_id, results in scan_results.items():
-        if scan_id in active_scans:
-            scan_data = active_scans[scan_id]
-            
-            # Extract target from scan_id (format: timestamp_target)
-            target = scan_id.split('_', 1)[1] if '_' in scan_id else 'unknown'
-            
-            # Count open ports - safely handle different result formats
-            try:
-                # Check if results is a list of dictionaries with 'status' key
-                if isinstance(results, list) and all(isinstance(r, dict) for r in results):
-                    open_ports_count = len([r for r in results if r.get('status') == 'open'])
-                # If results is a simple list of port numbers
-                elif isinstance(results, list) and all(isinstance(r, int) for r in results):
-                    open_ports_count = len(results)  # All ports in this list are considered open
-                else:
-                    # For any other format, default to 0
-                    app.logger.warning(f"Unexpected scan results format for scan_id {scan_id}: {type(results)}")
-                    open_ports_count = 0
-            except Exception as e:
-                app.logger.error(f"Error processing scan results for {scan_id}: {str(e)}")
-                open_ports_count = 0
-            
-            # Extract services - safely handle different result formats
-            services = []
-            try:
-                if isinstance(results, list) and all(isinstance(r, dict) for r in results):
-                    for result in results:
-                        if result.get('service') and result.get('service') not in services:
-                            services.append(result.get('service'))
-                # If we have a custom service mapping based on port numbers
-                elif isinstance(results, list) and all(isinstance(r, int) for r in results):
-                    # Common port to service mappings
-                    port_services = {
-                        21: 'FTP', 22: 'SSH', 23: 'Telnet', 25: 'SMTP', 
-                        53: 'DNS', 80: 'HTTP', 443: 'HTTPS', 3306: 'MySQL',
-                        3389: 'RDP', 5900: 'VNC', 8080: 'HTTP-Proxy'
-                    }
-                    for port in results:
-                        if port in port_services and port_services[port] not in services:
-                            services.append(port_services[port])
-            except Exception as e:
-                app.logger.error(f"Error extracting services for {scan_id}: {str(e)}")
-            
-            # Identify potential vulnerabilities - safely handle different result formats
-            vulnerabilities = []
-            try:
-                common_vulnerable_services = ['telnet', 'ftp']
-                common_vulnerable_ports = {23: 'telnet', 21: 'ftp'}
-                
-                if isinstance(results, list) and all(isinstance(r, dict) for r in results):
-                    # Process dictionary-based results
-                    for result in results:
-                        service = result.get('service', '').lower()
-                        if service in common_vulnerable_services:
-                            vulnerabilities.append({
-                                'port': result.get('port'),
-                                'service': service,
-                                'severity': 'high'
-                            })
-                elif isinstance(results, list) and all(isinstance(r, int) for r in results):
-                    # Process port number list results
-                    for port in results:
-                        if port in common_vulnerable_ports:
-                            vulnerabilities.append({
-                                'port': port,
-                                'service': common_vulnerable_ports[port],
-                                'severity': 'high'
-                            })
-            except Exception as e:
-                app.logger.error(f"Error identifying vulnerabilities for {scan_id}: {str(e)}")
-            
+    Returns:
+        Tuple[bytes, str]: JSON body and ETag
+    """
+    with dashboard_stats_lock:
+        version = dashboard_version
+        cached = _dashboard_cache['version'] == version and time.monotonic() < _dashboard_cache['expires']
+        body, etag = _dashboard_cache['body'], _dashboard_cache['etag']
+    
+    if not cached:
+        # Build outside the lock; a change during the build bumps the version past this one
+        body = jsonify(build_dashboard_data()).get_data()
+        etag = f"{version}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"
+        with dashboard_stats_lock:
+            _dashboard_cache.update(version=version, expires=time.monotonic() + DASHBOARD_CACHE_TTL,
+                                    body=body, etag=etag)
+    return body, etag
+
+def build_dashboard_data() -> Dict[str, Any]:
+    """
+    Assemble the dashboard data from the scan summaries and running scans.
+    
+    Returns:
+        Dict[str, Any]: Scans, statistics and security issues
+    """
+    all_scans = dashboard_scans()
+    return {
+        'scans': all_scans,
+        'statistics': dashboard_statistics(),
+        'security_issues': dashboard_security_issues(all_scans)
+    }
+
+def dashboard_scans() -> List[Dict[str, Any]]:
+    """
+    Dashboard entries of the finished scans (from their precomputed summaries) and running scans.
+    
+    Returns:
+        List[Dict[str, Any]]: One entry per scan
+    """
+    all_scans = []
+    add_scan = all_scans.append  # Bound once; called for every scan
+    for scan_id, scan_data in list(active_scans.items()):
+        summary = scan_data.summary
+        if summary is not None:
             # Create scan entry
-            scan_info = {
+            add_scan({
                 'scan_id': scan_id,
-                'target': target,
-                'timestamp': scan_data.get('start_time').isoformat() if scan_data.get('start_time') else None,
-                'status': scan_data.get('status', 'unknown'),
-                'open_ports_count': open_ports_count,
-                'services': services[:3],  # Limit to 3 services for display
-                'vulnerabilities': vulnerabilities
-            }
-            
-            all_scans.append(scan_info)
-    
-    # Also include running scans that might not have results yet
-    for scan_id, scan_data in active_scans.items():
-        if scan_id not in scan_results and scan_data.get('status') == 'running':
-            # Extract target from scan_id
-            target = scan_id.split('_', 1)[1] if '_' in scan_id else 'unknown'
-            
+                'target': summary['target'],
+                'timestamp': scan_data.start_time_iso,
+                'status': scan_data.status,
+                'open_ports_count': summary['open_ports_count'],
+                'services': summary['services'],
+                'vulnerabilities': summary['vulnerabilities']
+            })
+        elif scan_data.status == 'running':
             # Create scan entry for running scan
-            scan_info = {
+            add_scan({
                 'scan_id': scan_id,
-                'target': target,
-                'timestamp': scan_data.get('start_time').isoformat() if scan_data.get('start_time') else None,
+                'target': scan_data.target,
+                'timestamp': scan_data.start_time_iso,
                 'status': 'running',
                 'open_ports_count': 0,
                 'services': [],
                 'vulnerabilities': []
-            }
-            
-            all_scans.append(scan_info)
-    
-    # Calculate statistics
-    total_scans = len(all_scans)
-    active_hosts = len(set([scan['target'] for scan in all_scans]))
-    
-    # Count total open ports across all scans
-    open_ports = sum([scan['open_ports_count'] for scan in all_scans])
+            })
+    return all_scans
+
+def recent_dashboard_scans(limit: int) -> List[Dict[str, Any]]:
+    """
+    The most recent dashboard entries, newest first.
     
-    # Count total vulnerabilities
-    vulnerabilities = sum([len(scan.get('vulnerabilities', [])) for scan in all_scans])
+    Args:
+        limit: Maximum number of entries
+        
+    Returns:
+        List[Dict[str, Any]]: Up to limit scan entries
+    """
+    all_scans = dashboard_scans()
+    all_scans.sort(key=lambda scan: scan['timestamp'] or '', reverse=True)
+    return all_scans[:max(limit, 0)]
+
+def dashboard_statistics() -> Dict[str, int]:
+    """
+    Dashboard totals: the running totals of finished scans plus the scans still running.
     
-    # Generate security recommendations based on scan results
-    security_issues = []
+    Returns:
+        Dict[str, int]: Scan, host, open port and vulnerability counts
+    """
+    with dashboard_stats_lock:
+        total_scans = dashboard_stats['total_scans']
+        open_ports = dashboard_stats['open_ports']
+        vulnerabilities = dashboard_stats['vulnerabilities']
+        hosts = set(dashboard_hosts)
+    
+    # Running scans have no summary yet and count with zero ports
+    for scan_data in list(active_scans.values()):
+        if scan_data.summary is None and scan_data.status == 'running':
+            total_scans += 1
+            hosts.add(scan_data.target)
+    
+    return {
+        'total_scans': total_scans,
+        'active_hosts': len(hosts),
+        'open_ports': open_ports,
+        'vulnerabilities': vulnerabilities
+    }
+
+def dashboard_security_issues(all_scans: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Security recommendations drawn from the dashboard scan entries.
     
+    Args:
+        all_scans: Output of dashboard_scans()
+        
+    Returns:
+        List[Dict[str, str]]: Issues with a title and description
+    """
     # Add default recommendations if there are no scans
     if not all_scans:
-        security_issues = [
+        return [
             {
                 'title': 'Welcome to PortSentinel',
                 'description': 'Start by running a scan on your local network to identify open ports and potential vulnerabilities.'
@@ -2934,142 +1566,219 @@ def api_dashboard_data():
                 'description': 'Regular scanning helps maintain network security. Use the "New Scan" button to begin.'
             }
         ]
-    else:
-        # Check for hosts with many open ports
-        for scan in all_scans:
-            if scan['open_ports_count'] > 10:
-                security_issues.append({
-                    'title': f'Open Port Alert for {scan["target"]}',
-                    'description': f'Host {scan["target"]} has {scan["open_ports_count"]} open ports. Consider closing unnecessary services and implementing firewall rules.'
-                })
+    
+    # Collect security findings in a single pass
+    security_issues = []
+    vulnerable_hosts = defaultdict(set)
+    ssh_hosts = []
+    for scan in all_scans:
+        target = scan['target']
         
-        # Check for common vulnerable services
-        vulnerable_services = {}
-        for scan in all_scans:
-            for vuln in scan.get('vulnerabilities', []):
-                service = vuln.get('service')
-                if service:
-                    if service not in vulnerable_services:
-                        vulnerable_services[service] = []
-                    vulnerable_services[service].append(scan['target'])
+        # Check for hosts with many open ports
+        if scan['open_ports_count'] > 10:
+            security_issues.append({
+                'title': f'Open Port Alert for {target}',
+                'description': f'Host {target} has {scan["open_ports_count"]} open ports. Consider closing unnecessary services and implementing firewall rules.'
+            })
         
-        for service, hosts in vulnerable_services.items():
-            if service == 'telnet':
-                security_issues.append({
-                    'title': 'Telnet Security Risk',
-                    'description': f'Telnet (unencrypted protocol) found on {len(hosts)} host(s). Consider replacing with SSH for secure remote access.'
-                })
-            elif service == 'ftp':
-                security_issues.append({
-                    'title': 'FTP Security Risk',
-                    'description': f'FTP (unencrypted protocol) found on {len(hosts)} host(s). Consider using SFTP or FTPS for secure file transfers.'
-                })
+        # Group hosts by vulnerable service
+        for vuln in scan['vulnerabilities']:
+            vulnerable_hosts[vuln['service']].add(target)
         
         # Check for hosts with SSH
-        ssh_hosts = []
-        for scan in all_scans:
-            if 'SSH' in scan.get('services', []):
-                ssh_hosts.append(scan['target'])
-        
-        if ssh_hosts:
+        if 'SSH' in scan['services']:
+            ssh_hosts.append(target)
+    
+    # Check for common vulnerable services
+    for service, service_hosts in vulnerable_hosts.items():
+        if service in VULNERABLE_SERVICE_ISSUES:
+            title, description = VULNERABLE_SERVICE_ISSUES[service]
             security_issues.append({
-                'title': 'SSH Security',
-                'description': f'{len(ssh_hosts)} host(s) have SSH (port 22) open. Ensure key-based authentication is enabled and password auth is disabled.'
+                'title': title,
+                'description': description.format(count=len(service_hosts))
             })
     
-    response = {
-        'scans': all_scans,
-        'statistics': {
-            'total_scans': total_scans,
-            'active_hosts': active_hosts,
-            'open_ports': open_ports,
-            'vulnerabilities': vulnerabilities
-        },
-        'security_issues': security_issues
-    }
+    if ssh_hosts:
+        security_issues.append({
+            'title': 'SSH Security',
+            'description': f'{len(ssh_hosts)} host(s) have SSH (port 22) open. Ensure key-based authentication is enabled and password auth is disabled.'
+        })
+    
+    return security_issues
+
+def dashboard_section_response(section: str, build: Callable[[], Any]) -> Response:
+    """
+    JSON response for one dashboard section, tagged with the dashboard version.
+    A client that already has this version gets a 304 without the section being built.
     
-    return jsonify(response)
+    Args:
+        section: Name of the section, part of the ETag
+        build: Callable returning the section data
+        
+    Returns:
+        Response: JSON response or 304 Not Modified
+    """
+    with dashboard_stats_lock:
+        etag = f"{section}-{dashboard_version}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(build())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/dashboard/stats')
+@login_required
+def api_dashboard_stats():
+    """API endpoint for the dashboard totals alone; cheap enough to poll often."""
+    return dashboard_section_response('stats', dashboard_statistics)
+
+@app.route('/api/dashboard/security-issues')
+@login_required
+def api_dashboard_security_issues():
+    """API endpoint for the dashboard security recommendations alone."""
+    return dashboard_section_response('issues', lambda: dashboard_security_issues(dashboard_scans()))
 
 @app.route('/api/scan/<scan_id>/details')
 @login_required
 def api_scan_details(scan_id):
     """
     API endpoint to get detailed information about a specific scan.
-    This provides data for the scan details modal.
+    This provides data for the scan details modal. Details of finished scans
+    never change, so their serialized body is built once and reused.
     """
     # Check if scan exists
-    if scan_id not in active_scans:
-        # Return a helpful error message instead of just "Scan not found"
-        return jsonify({
-            'error': 'Scan not found. The scan may have been deleted or has not been started.',
-            'scan_id': scan_id
-        }), 404
+    scan_data = active_scans.get(scan_id)
+    if scan_data is not None:
+        if scan_data.summary is None:
+            # Still running (or finishing); build fresh
+            return jsonify(build_scan_details(scan_id, scan_data))
+        try:
+            # Status and end time are part of the key: a stopped scan completes once more
+            body = _scan_details_body(scan_id, scan_data.status, scan_data.end_time)
+            return Response(body, mimetype=app.json.mimetype)
+        except KeyError:
+            pass  # Evicted since the lookup above
+    
+    # Return a helpful error message instead of just "Scan not found"
+    return jsonify({
+        'error': 'Scan not found. The scan may have been deleted or has not been started.',
+        'scan_id': scan_id
+    }), 404
+
+@functools.lru_cache(maxsize=SCAN_RESULTS_MAX)
+def _scan_details_body(scan_id: str, status: str, end_time: Optional[datetime]) -> bytes:
+    """
+    Serialized details of a finished scan, cached per (scan_id, status, end_time).
+    Must be called inside a request.
     
-    scan_data = active_scans[scan_id]
+    Args:
+        scan_id: Unique ID for the scan
+        status: Final status of the scan (part of the cache key)
+        end_time: When the scan finished (part of the cache key)
+        
+    Returns:
+        bytes: JSON body
+    """
+    return jsonify(build_scan_details(scan_id, active_scans[scan_id])).get_data()
+
+def build_scan_details(scan_id: str, scan_data: ScanState) -> Dict[str, Any]:
+    """
+    Detailed information about a scan, with results in a consistent format for the client.
     
+    Args:
+        scan_id: Unique ID for the scan
+        scan_data: State of the scan
+        
+    Returns:
+        Dict[str, Any]: Target, timing, status and results
+    """
     # Calculate scan duration
-    duration = 0
-    if 'end_time' in scan_data and scan_data['start_time']:
-        try:
-            duration = (scan_data['end_time'] - scan_data['start_time']).total_seconds()
-        except Exception as e:
-            app.logger.error(f"Error calculating duration: {str(e)}")
-    
-    # Extract target from scan_id
-    target = scan_id.split('_', 1)[1] if '_' in scan_id else 'unknown'
+    duration = scan_data.duration
     
     # Get results, defaulting to empty list if not available
-    raw_results = scan_data.get('results', [])
+    raw_results = scan_results_of(scan_id, scan_data)
+    kind = scan_data.result_kind
     
     # Process results to ensure they're in a consistent format for the client
     processed_results = []
     try:
-        # Common port to service mappings
-        port_services = {
-            21: 'FTP', 22: 'SSH', 23: 'Telnet', 25: 'SMTP', 
-            53: 'DNS', 80: 'HTTP', 443: 'HTTPS', 3306: 'MySQL',
-            3389: 'RDP', 5900: 'VNC', 8080: 'HTTP-Proxy'
-        }
+        # Results keyed by port number, as returned by the scanner engine
+        if kind == 'ports':
+            processed_results = [{'port': port, 'status': 'open', **data} for port, data in raw_results.items()]
         
         # Check if results is a list of dictionaries
-        if isinstance(raw_results, list) and all(isinstance(r, dict) for r in raw_results):
+        elif kind == 'dicts':
             processed_results = raw_results
         
         # Check if results is a list of port numbers
-        elif isinstance(raw_results, list) and all(isinstance(r, int) for r in raw_results):
-            for port in raw_results:
-                result = {
-                    'port': port,
-                    'status': 'open',
-                    'service': port_services.get(port, 'Unknown'),
-                    'banner': None
-                }
-                processed_results.append(result)
+        elif kind == 'ints':
+            service_of = PORT_SERVICES.get
+            processed_results = [
+                {'port': port, 'status': 'open', 'service': service_of(port, 'Unknown'), 'banner': None}
+                for port in raw_results
+            ]
         
         # Handle any other format
         else:
-            app.logger.warning(f"Unexpected results format for scan_id {scan_id}: {type(raw_results)}")
+            app.logger.warning("Unexpected results format for scan_id %s: %s", scan_id, type(raw_results))
     except Exception as e:
-        app.logger.error(f"Error processing scan details for {scan_id}: {str(e)}")
+        app.logger.error("Error processing scan details for %s: %s", scan_id, e)
     
     # Create response with detailed scan information
     response = {
         'scan_id': scan_id,
-        'target': target,
-        'timestamp': scan_data.get('start_time').isoformat() if scan_data.get('start_time') else None,
+        'target': scan_data.target,
+        'timestamp': scan_data.start_time_iso,
         'duration': duration,
-        'status': scan_data.get('status', 'unknown'),
+        'status': scan_data.status,
         'results': processed_results
     }
     
-    return jsonify(response)
+    return response
+
+# Step 15: One-time setup, run by create_app() or the `flask init` command
+def setup_assets():
+    """
+    Step 15.1: Create the results directory and check the packaged assets.
+    Nothing is generated at runtime, so this works on a read-only package install.
+    """
+    ensure_directories()   # Create required directories
+    
+    if not packaged_assets_present():
+        app.logger.error("Missing packaged assets, expected: %s", ', '.join(PACKAGED_ASSETS))
+
+_bootstrapped = False
+
+def _bootstrap():
+    """
+    Step 15.2: Initialize the database and assets once per process.
+    """
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    init_db()
+    setup_assets()
+    _bootstrapped = True
+
+def create_app() -> Flask:
+    """
+    Step 15.3: Return the configured app after running one-time setup.
+    Entry points (run(), the WSGI module, the root main.py) call this instead of
+    relying on import side effects.
+    
+    Returns:
+        Flask: The application instance
+    """
+    _bootstrap()
+    return app
 
-# Step 15: Run setup on import
-# These functions create necessary directories and files when the module is imported
-ensure_directories()   # Create required directories
-create_templates()     # Generate HTML templates
-create_css()           # Generate CSS styles
-create_js()            # Generate JavaScript code
+@app.cli.command('init')
+def init_command():
+    """Create runtime directories and check assets: flask --app scanner_tool.flask_web_interface init"""
+    _bootstrap()
+    print("Scanner assets initialized.")
 
 def run():
     """
@@ -3078,7 +1787,7 @@ def run():
     """
     # Step 16.1: Run the Flask app with specified host and port
     # host='0.0.0.0' makes the app accessible from any network interface
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    create_app().run(host='0.0.0.0', port=5000, debug=True)
 
 # Step 17: Module execution check
 if __name__ == "__main__":
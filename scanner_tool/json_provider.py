@@ -0,0 +1,110 @@
+"""
+JSON Provider - Serializes Flask JSON responses and sessions with orjson when available
+
+Scan status polling returns the full results mapping on every request, so
+serialization cost grows with the number of open ports. orjson encodes the
+dicts, lists and strings involved in C; the standard library provider is
+used when orjson is not installed.
+
+The session cookie is decoded on every authenticated request. Its contents
+(ids, tokens, username, admin flag and expiry, flashed messages) are plain
+JSON, so the cookie payload is encoded with orjson as well instead of Flask's
+tagged JSON serializer.
+"""
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SecureCookieSessionInterface
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Results are keyed by integer port numbers, so OPT_NON_STR_KEYS is always
+    set. Types orjson does not handle natively fall back to Flask's default
+    conversion.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize obj to a JSON string.
+
+        Args:
+            obj: Object to serialize
+            **kwargs: Ignored; accepted for compatibility with json.dumps
+
+        Returns:
+            str: JSON document
+        """
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Build a JSON response (used by jsonify) straight from orjson's bytes,
+        skipping the decode to str and re-encode that dumps() would cost.
+
+        Args:
+            *args: A single object, or several treated as a list
+            **kwargs: Treated as a dict
+
+        Returns:
+            Response: application/json response
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        # Pretty-print under the same rule as Flask's default provider
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize a JSON string or bytes.
+
+        Args:
+            s: JSON document
+            **kwargs: Ignored; accepted for compatibility with json.loads
+
+        Returns:
+            Any: Decoded object
+        """
+        return orjson.loads(s)
+
+
+class ORJSONSessionSerializer:
+    """
+    Session payload serializer for itsdangerous backed by orjson.
+
+    Unlike Flask's tagged serializer it does not round-trip tuples, bytes or
+    datetimes; flashed (category, message) pairs come back as lists, which
+    templates unpack the same way.
+    """
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize the session dict to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes) -> Any:
+        """Deserialize a session payload."""
+        return orjson.loads(s)
+
+
+class ORJSONSessionInterface(SecureCookieSessionInterface):
+    """
+    Signed-cookie sessions serialized with orjson.
+
+    Sessions are not permanent, so Flask only sends Set-Cookie when a request
+    modifies the session; read-only requests such as status polls send none.
+    """
+
+    serializer = ORJSONSessionSerializer()
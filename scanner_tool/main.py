@@ -4,34 +4,31 @@ Multithreaded Port Scanner - Main Entry Point
 A terminal-based network port scanning application with multithreading capabilities.
 """
 
-import os
 import sys
 import socket
 import argparse
 import logging
 import platform
-import uuid
 from datetime import datetime
-from typing import List, Dict, Union, Tuple
-from dotenv import load_dotenv
-from supabase import create_client, Client
+from typing import List, Dict
 
 # Import local modules
-from scanner_engine import ScannerEngine
+from scanner_engine import ScannerEngine, parse_port_range, is_ipv4
 from threading_module import ThreadingModule
 from data_export_layer import DataExportLayer
 
 # Import third-party libraries for terminal display
 import colorama
-from colorama import Fore, Back, Style
+from colorama import Fore
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
 from rich.text import Text
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (once per process)
+from _env import load_env
+load_env()
 
 # Initialize colorama for cross-platform color support
 colorama.init(autoreset=True)
@@ -46,7 +43,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-DEFAULT_PORTS = [21, 22, 23, 25, 53, 80, 110, 123, 135, 139, 143, 389, 443, 445, 993, 995, 1723, 3306, 3389, 5900, 8080]
 VERSION = "1.0.0"
 BANNER = f"""
 {Fore.BLUE}╔══════════════════════════════════════════════════════════╗
@@ -101,6 +97,9 @@ class PortScanner:
         Returns:
             bool: True if host is valid, False otherwise
         """
+        # IPv4 literals need no DNS lookup
+        if is_ipv4(host):
+            return True
         try:
             socket.gethostbyname(host)
             return True
@@ -117,19 +116,7 @@ class PortScanner:
         Returns:
             List[int]: List of port numbers to scan
         """
-        ports = []
-        if not port_range:
-            return DEFAULT_PORTS
-            
-        sections = port_range.split(',')
-        for section in sections:
-            if '-' in section:
-                start, end = map(int, section.split('-'))
-                ports.extend(range(start, end + 1))
-            else:
-                ports.append(int(section))
-        
-        return sorted(list(set(ports)))  # Remove duplicates and sort
+        return parse_port_range(port_range)
     
     def display_scan_summary(self, host: str, open_ports: Dict[int, Dict], start_time: datetime):
         """
@@ -0,0 +1,134 @@
+"""
+Result Store - Bounded in-memory cache of finished scan results
+
+Finished scans are kept in memory for quick access by the dashboard and the
+export endpoints. The cache holds at most `maxsize` scans for at most `ttl`
+seconds; evicted scans are written to disk as gzipped JSON so exports of older
+scans keep working after they leave memory.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters allowed in archive file names
+_UNSAFE_CHARS_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+class ScanResultStore:
+    """
+    LRU cache of scan results with a time-to-live, spilling evicted entries to disk.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600, directory: str = 'scan_results/archive',
+                 on_evict: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the store.
+
+        Args:
+            maxsize: Maximum number of scans kept in memory
+            ttl: Seconds a scan stays in memory after it was stored
+            directory: Where evicted scans are written
+            on_evict: Optional callback, called with the scan_id of each evicted scan
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = directory
+        self.on_evict = on_evict
+        self._data: 'OrderedDict[str, Tuple[float, Dict[int, Dict[str, Any]]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, scan_id: str, results: Dict[int, Dict[str, Any]]):
+        """Store the results of a scan, evicting the oldest entries if needed."""
+        with self._lock:
+            self._data[scan_id] = (time.monotonic() + self.ttl, results)
+            self._data.move_to_end(scan_id)
+            evicted = self._evict_locked()
+        self._archive(evicted)
+
+    def __contains__(self, scan_id: str) -> bool:
+        """Check memory first, then the on-disk archive."""
+        with self._lock:
+            if scan_id in self._data:
+                return True
+        return os.path.exists(self._path(scan_id))
+
+    def get(self, scan_id: str, default: Any = None) -> Any:
+        """
+        Get the results of a scan, loading them from the archive if evicted.
+
+        Args:
+            scan_id: Unique ID for the scan
+            default: Value returned when the scan is unknown
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Results keyed by port number, or default
+        """
+        with self._lock:
+            entry = self._data.get(scan_id)
+            if entry is not None:
+                self._data.move_to_end(scan_id)
+                return entry[1]
+        return self._load(scan_id, default)
+
+    def items(self) -> List[Tuple[str, Dict[int, Dict[str, Any]]]]:
+        """Snapshot of the scans currently held in memory, oldest first."""
+        with self._lock:
+            evicted = self._evict_locked()
+            snapshot = [(scan_id, entry[1]) for scan_id, entry in self._data.items()]
+        self._archive(evicted)
+        return snapshot
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([scan_id for scan_id, _ in self.items()])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _evict_locked(self) -> List[Tuple[str, Dict[int, Dict[str, Any]]]]:
+        """Remove expired and overflow entries. Caller must hold the lock."""
+        evicted = []
+        now = time.monotonic()
+        while self._data:
+            scan_id, (expires, results) = next(iter(self._data.items()))
+            if expires > now and len(self._data) <= self.maxsize:
+                break
+            del self._data[scan_id]
+            evicted.append((scan_id, results))
+        return evicted
+
+    def _archive(self, evicted: List[Tuple[str, Dict[int, Dict[str, Any]]]]):
+        """Write evicted scans to disk (outside the lock) and notify the callback."""
+        for scan_id, results in evicted:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with gzip.open(self._path(scan_id), 'wt', encoding='utf-8') as f:
+                    json.dump(results, f)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Could not archive scan {scan_id}: {e}")
+            if self.on_evict:
+                self.on_evict(scan_id)
+
+    def _load(self, scan_id: str, default: Any) -> Any:
+        """Read an archived scan, restoring integer port keys."""
+        try:
+            with gzip.open(self._path(scan_id), 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return default
+        if not isinstance(data, dict):
+            return data
+        return {int(port) if port.isdigit() else port: info for port, info in data.items()}
+
+    def _path(self, scan_id: str) -> str:
+        """Archive path for a scan."""
+        return os.path.join(self.directory, f"{_UNSAFE_CHARS_RE.sub('_', scan_id)}.json.gz")
@@ -0,0 +1,89 @@
+"""
+Scan State - Holds the state of scans started from the web interface
+
+Each scan is tracked by a slotted ScanState record instead of a plain dict, which
+keeps per-scan memory small and turns field lookups into attribute access.
+"""
+
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+# Log entries kept per scan; older entries are dropped once a scan logs more
+LOG_HISTORY = 1000
+
+
+def result_kind(results: Any) -> str:
+    """
+    Tag the shape of a scan's results once, so readers dispatch on the tag
+    instead of type-checking every entry on each request.
+
+    Args:
+        results: Results of a scan
+
+    Returns:
+        str: 'ports' (dict keyed by port number), 'dicts' (list of result dicts),
+             'ints' (list of open port numbers) or 'other'
+    """
+    if isinstance(results, dict):
+        return 'ports'
+    if isinstance(results, list):
+        if not results or isinstance(results[0], dict):
+            return 'dicts'
+        if isinstance(results[0], int):
+            return 'ints'
+    return 'other'
+
+
+@dataclass(slots=True)
+class ScanState:
+    """State of a single scan, kept (without results and logs once archived) for the dashboard."""
+    target: str                                   # Host the scan was started against
+    address: Optional[str] = None                 # Target address, resolved once at scan start
+    status: str = 'running'                       # running, completed, failed, or stopped
+    progress: int = 0                             # Percentage complete (0-100)
+    start_time: datetime = field(default_factory=datetime.now)
+    start_time_iso: str = field(init=False)       # start_time in ISO format, as sent to the dashboard
+    end_time: Optional[datetime] = None
+    logs: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=LOG_HISTORY))
+    log_count: int = 0                            # Entries ever logged; the index clients resume from
+    results: Dict[int, Dict[str, Any]] = field(default_factory=dict)  # Open ports and their details
+    result_kind: str = 'ports'                    # Shape of results, see result_kind()
+    open_port_count: int = 0                      # Open ports found so far
+    vulnerable_count: int = 0                     # Open ports running cleartext services (FTP, Telnet)
+    summary: Optional[Dict[str, Any]] = None      # Dashboard summary, set once when the scan finishes
+    archived: bool = False                        # Results and logs dropped from memory; results are in the archive
+
+    def __post_init__(self):
+        """Format the start time once; it never changes."""
+        self.start_time_iso = self.start_time.isoformat()
+
+    def append_log(self, entry: Dict[str, Any]):
+        """Add a log entry. Caller must hold the scan's lock."""
+        self.logs.append(entry)
+        self.log_count += 1
+
+    def logs_since(self, index: int) -> List[Dict[str, Any]]:
+        """
+        Log entries added after the first `index`, oldest first. Caller must hold the scan's lock.
+
+        Args:
+            index: Number of entries the client already has (a previous log_count)
+
+        Returns:
+            List[Dict[str, Any]]: New entries still held in the buffer
+        """
+        new = min(self.log_count - index, len(self.logs))
+        if new <= 0:
+            return []
+        # Walk from the newest end so the cost depends only on the number returned
+        return list(itertools.islice(reversed(self.logs), new))[::-1]
+
+    @property
+    def duration(self) -> float:
+        """Scan duration in seconds, or 0 while the scan is still running."""
+        if self.end_time is None:
+            return 0
+        return (self.end_time - self.start_time).total_seconds()
@@ -6,15 +6,18 @@ It is responsible for testing if ports are open and identifying service informat
 """
 
 # Step 1: Import necessary modules
+import asyncio         # For non-blocking connects during port discovery
 import socket          # For creating network connections to test ports
 import logging         # For logging scan progress and errors
 from typing import List, Dict, Callable, Optional, Tuple, TYPE_CHECKING, Any  # Type hints
-import time            # For timing operations
 import random          # For randomizing port scan order to avoid detection
 import ssl             # For SSL/TLS certificate grabbing
 import re              # For parsing banner responses
 import struct          # For handling binary data in protocol responses
-import ipaddress       # For IP address validation
+import ipaddress       # For IPv6 target validation
+import functools       # For memoizing service name lookups
+import sys             # For detecting gevent's monkey patching
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout  # For bounded DNS lookups
 
 from colorama import Fore  # For colored terminal output
 
@@ -72,6 +75,161 @@ SERVICE_MAP = {
     8080: "HTTP-Proxy"
 }
 
+# Step 4.1: Define the default port set
+# A frozenset gives O(1) membership tests; the sorted tuple is built once so callers
+# can copy it instead of re-sorting on every request
+DEFAULT_PORTS = frozenset((21, 22, 23, 25, 53, 80, 110, 123, 135, 139, 143, 389, 443, 445, 993, 995, 1723, 3306, 3389, 5900, 8080))
+DEFAULT_PORT_LIST = tuple(sorted(DEFAULT_PORTS))
+
+# One section of a port list: a port or an inclusive range such as "8000-8100"
+_PORT_SPEC_RE = re.compile(r'(\d{1,5})(?:\s*-\s*(\d{1,5}))?')
+MAX_PORT = 65535
+
+def parse_port_range(port_range: str) -> List[int]:
+    """
+    Parse a port range string into a sorted list of unique port numbers.
+    
+    Args:
+        port_range: String representing port range (e.g., "80,443,8000-8100")
+        
+    Returns:
+        List[int]: New list of port numbers to scan (safe for callers to shuffle)
+        
+    Raises:
+        ValueError: If a section is not a port or range of ports in 1-65535,
+            or a range starts after it ends
+    """
+    if not port_range:
+        return list(DEFAULT_PORT_LIST)
+    
+    # Collect each section as an inclusive (start, end) interval
+    intervals = []
+    for section in port_range.split(','):
+        # Validate and split the section in one regex match
+        match = _PORT_SPEC_RE.fullmatch(section.strip())
+        if match is None:
+            raise ValueError(f"Invalid port specification: {section.strip()!r}")
+        start = int(match[1])
+        end = int(match[2]) if match[2] else start
+        if start < 1 or end > MAX_PORT:
+            raise ValueError(f"Ports must be between 1 and {MAX_PORT}: {section.strip()!r}")
+        if start > end:
+            raise ValueError(f"Invalid range (start > end): {section.strip()!r}")
+        intervals.append((start, end))
+    
+    # Merge overlapping intervals, then expand each with list.extend(range(...)),
+    # which runs in C; no set of every port and no sort over the full list
+    intervals.sort()
+    ports: List[int] = []
+    next_port = None  # One past the last port already added
+    for start, end in intervals:
+        if next_port is not None and start < next_port:
+            start = next_port
+        if start <= end:
+            ports.extend(range(start, end + 1))
+            next_port = end + 1
+    return ports
+
+# Step 4.2: Precompiled target validation patterns
+_IPV4_RE = re.compile(r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$')
+_HOSTNAME_RE = re.compile(r'^(?=.{1,253}$)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*\.?$')
+
+def is_ipv4(value: str) -> bool:
+    """
+    Check whether a string is a dotted-quad IPv4 address.
+    
+    Args:
+        value: String to check
+        
+    Returns:
+        bool: True if value is an IPv4 address
+    """
+    match = _IPV4_RE.match(value)
+    return bool(match) and all(int(octet) < 256 for octet in match.groups())
+
+def is_valid_target(value: str) -> bool:
+    """
+    Check whether a string is an IPv4 address or a well-formed hostname.
+    IPv6 literals (the only inputs containing ':') go through the ipaddress module.
+    
+    Args:
+        value: Target entered by the user
+        
+    Returns:
+        bool: True if value can be used as a scan target
+    """
+    if _IPV4_RE.match(value):
+        return is_ipv4(value)
+    if ':' in value:
+        try:
+            ipaddress.ip_address(value)
+            return True
+        except ValueError:
+            return False
+    return bool(_HOSTNAME_RE.match(value))
+
+# Step 4.2.1: DNS resolution runs on a small shared pool so a slow resolver can
+# be abandoned after RESOLVE_TIMEOUT instead of holding up the scan
+RESOLVE_TIMEOUT = 3.0
+_resolver_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='resolve')
+
+# Step 4.3: Socket options for probe sockets
+# Linger (1, 0) makes close() send RST, so probes don't leave ports in TIME_WAIT
+_LINGER_RST = struct.pack('ii', 1, 0)
+
+def make_scan_socket() -> socket.socket:
+    """
+    Create a TCP socket tuned for short-lived connect probes.
+    
+    Returns:
+        socket.socket: IPv4 TCP socket with RST-on-close, address reuse and no
+        Nagle delay (plus quick ACKs where the platform supports them)
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError as e:
+        logger.debug(f"Could not tune probe socket: {e}")
+    return s
+
+def gevent_patched() -> bool:
+    """
+    Whether gevent has monkey-patched the socket module (see scanner_tool.wsgi).
+    Patched threads are greenlets sharing one OS thread, so each scan can't run
+    its own asyncio event loop.
+    
+    Returns:
+        bool: True under the gevent entry point
+    """
+    monkey = sys.modules.get('gevent.monkey')
+    return monkey is not None and monkey.is_module_patched('socket')
+
+@functools.lru_cache(maxsize=2048)
+def lookup_service(port: int, proto: str = 'tcp') -> str:
+    """
+    Resolve a port number to a service name, memoized per (port, proto).
+    getservbyport() re-reads /etc/services on every call, and the same ports
+    are looked up on every scan.
+    
+    Args:
+        port: The port number
+        proto: Transport protocol name
+        
+    Returns:
+        str: The service name, or "Unknown" if it can't be identified
+    """
+    # Check our own map for common services first
+    if port in SERVICE_MAP:
+        return SERVICE_MAP[port]
+    try:
+        return socket.getservbyport(port, proto)
+    except (OSError, OverflowError):
+        return "Unknown"
+
 class ScannerEngine:
     """
     Core scanning engine that handles port scanning and service identification.
@@ -87,6 +245,8 @@ class ScannerEngine:
         self.timeout = 1.0  # Default socket timeout in seconds
         self.banner_timeout = 3.0  # Longer timeout for banner grabbing
         self.ssl_timeout = 5.0  # Even longer timeout for SSL certificate retrieval
+        self.max_concurrency = 256  # Connect attempts in flight during port discovery
+        self.resolved_hosts: Dict[str, str] = {}  # Hostname -> IPv4 address from the latest scan
         
     def test_port(self, host: str, port: int) -> bool:
         """
@@ -102,8 +262,8 @@ class ScannerEngine:
         """
         try:
             # Step 6.1: Create a new socket for this connection attempt
-            # AF_INET specifies IPv4, SOCK_STREAM specifies TCP connection
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # IPv4 TCP socket that resets on close instead of lingering in TIME_WAIT
+            s = make_scan_socket()
             s.settimeout(self.timeout)  # Set socket timeout
             
             # Step 6.2: Attempt to connect to the port
@@ -119,6 +279,35 @@ class ScannerEngine:
             logger.debug(f"Error scanning port {port}: {e}")
             return False
             
+    def resolve_target(self, host: str, timeout: float = RESOLVE_TIMEOUT) -> str:
+        """
+        Step 6.4: Resolve the target once per scan.
+        Probes and banner grabs connect to the stored address instead of doing a
+        blocking DNS lookup per connection; the hostname is still used for the
+        HTTP Host header and TLS SNI.
+        
+        Args:
+            host: The hostname or IP address to scan
+            timeout: Seconds to wait for DNS before giving up
+            
+        Returns:
+            str: IPv4 address (the input unchanged if it can't be resolved in time)
+        """
+        if is_ipv4(host):
+            return host
+        lookup = _resolver_pool.submit(socket.getaddrinfo, host, None, socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            address = lookup.result(timeout=timeout)[0][4][0]
+        except FutureTimeout:
+            # The lookup keeps running on the pool; its result is just not waited for
+            logger.debug(f"Resolving {host} timed out after {timeout}s")
+            return host
+        except (OSError, IndexError) as e:
+            logger.debug(f"Could not resolve {host}: {e}")
+            return host
+        self.resolved_hosts[host] = address
+        return address
+    
     def fetch_service_info(self, port: int) -> str:
         """
         Step 7: Fetch service information for a specific port number.
@@ -130,16 +319,8 @@ class ScannerEngine:
         Returns:
             str: The service name associated with the port
         """
-        try:
-            # Step 7.1: First check our own map for common services (faster)
-            if port in SERVICE_MAP:
-                return SERVICE_MAP[port]
-                
-            # Step 7.2: Then try socket.getservbyport for less common services
-            return socket.getservbyport(port)
-        except (socket.error, OSError):
-            # Return "Unknown" if service can't be identified
-            return "Unknown"
+        # Step 7.1: SERVICE_MAP first, then a cached socket.getservbyport lookup
+        return lookup_service(port)
     
     def grab_banner(self, host: str, port: int, service: str) -> Dict[str, Any]:
         """
@@ -228,7 +409,7 @@ class ScannerEngine:
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(self.banner_timeout)
-            s.connect((host, port))
+            s.connect((self.resolved_hosts.get(host, host), port))
             
             # Some protocols send data immediately upon connection
             banner = ""
@@ -278,7 +459,7 @@ class ScannerEngine:
             # Create socket and connect
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(self.banner_timeout)
-            s.connect((host, port))
+            s.connect((self.resolved_hosts.get(host, host), port))
             
             # Wrap socket with SSL if needed
             if use_ssl:
@@ -351,7 +532,7 @@ class ScannerEngine:
             context.check_hostname = False
             context.verify_mode = ssl.CERT_NONE
             
-            with socket.create_connection((host, port), timeout=2) as sock:
+            with socket.create_connection((self.resolved_hosts.get(host, host), port), timeout=2) as sock:
                 with context.wrap_socket(sock, server_hostname=host) as ssock:
                     cert = ssock.getpeercert(binary_form=False)
                     if not cert:
@@ -399,440 +580,132 @@ class ScannerEngine:
         
         return ssl_info
     
-    def scan_port_worker(self, host: str, port: int, progress_callback: Optional[Callable] = None) -> Tuple[int, bool, str, Dict[str, Any]]:
+    async def _probe_port(self, host: str, port: int, semaphore: asyncio.Semaphore) -> bool:
         """
-        Step 8: Worker function that scans a single port.
-        This is the function that will be executed by each thread.
+        Step 8.7: Test a port with a non-blocking connect on the running event loop.
         
         Args:
             host: The hostname or IP address to scan
             port: The port number to scan
-            progress_callback: Optional callback function to update progress
+            semaphore: Bounds the number of connects in flight
             
         Returns:
-            Tuple[int, bool, str, Dict[str, Any]]: Port number, open status, service name, and banner information
+            bool: True if port is open, False otherwise
         """
-        # Step 8.1: Test if port is open
-        is_open = self.test_port(host, port)
-        
-        # Step 8.2: Get service info if port is open
-        service = self.fetch_service_info(port) if is_open else ""
-        
-        # Step 8.3: Grab banner information if port is open
-        banner_info = {}
-        if is_open:
-            banner_info = self.grab_banner(host, port, service)
-        
-        # Step 8.4: Call progress callback if provided
-        # This updates the UI with scan progress
-        if progress_callback:
-            progress_callback(port, is_open)
-            
-        # Step 8.5: Log open ports for debugging
-        if is_open:
-            version_info = f" ({banner_info.get('version', '')})" if banner_info.get('version') else ""
-            logger.info(f"Port {port} is {Fore.GREEN}open{Fore.RESET} ({service}{version_info})")
-            
-        # Step 8.6: Return results tuple for this port
-"""
-Scanner Engine Module - Core scanning functionality
-
-This module provides the core scanning functionality for the port scanner application.
-It is responsible for testing if ports are open and identifying service information.
-"""
-
-# Step 1: Import necessary modules
-import socket          # For creating network connections to test ports
-import logging         # For logging scan progress and errors
-from typing import List, Dict, Callable, Optional, Tuple, TYPE_CHECKING, Any  # Type hints
-import time            # For timing operations
-import random          # For randomizing port scan order to avoid detection
-import ssl             # For SSL/TLS certificate grabbing
-import re              # For parsing banner responses
-import struct          # For handling binary data in protocol responses
-
-from colorama import Fore  # For colored terminal output
-
-# Step 2: Set up type checking to avoid circular imports
-if TYPE_CHECKING:
-    from scanner_tool.threading_module import ThreadingModule
-
-# Step 3: Configure logging
-logger = logging.getLogger(__name__)
-
-# Step 4: Define common service to port mappings dictionary
-# This provides a quick lookup for common services without relying on socket.getservbyport()
-SERVICE_MAP = {
-    # FTP
-    21: "FTP",
-    # SSH
-    22: "SSH",
-    # Telnet
-    23: "Telnet",
-    # SMTP
-    25: "SMTP",
-    # DNS
-    53: "DNS",
-    # HTTP
-    80: "HTTP",
-    # POP3
-    110: "POP3",
-    # NTP
-    123: "NTP",
-    # NetBIOS
-    137: "NetBIOS",
-    138: "NetBIOS",
-    139: "NetBIOS",
-    # IMAP
-    143: "IMAP",
-    # LDAP
-    389: "LDAP",
-    # HTTPS
-    443: "HTTPS",
-    # SMB
-    445: "SMB",
-    # IMAPS
-    993: "IMAPS",
-    # POP3S
-    995: "POP3S",
-    # PPTP
-    1723: "PPTP",
-    # MySQL
-    3306: "MySQL",
-    # RDP
-    3389: "RDP",
-    # VNC
-    5900: "VNC",
-    # HTTP Proxy
-    8080: "HTTP-Proxy"
-}
-
-class ScannerEngine:
-    """
-    Core scanning engine that handles port scanning and service identification.
-    This class contains methods to test individual ports and scan multiple ports
-    using multithreading for improved performance.
-    """
+        async with semaphore:
+            s = make_scan_socket()
+            s.setblocking(False)
+            try:
+                await asyncio.wait_for(asyncio.get_running_loop().sock_connect(s, (host, port)), self.timeout)
+                return True
+            except (OSError, asyncio.TimeoutError):
+                return False
+            finally:
+                s.close()
     
-    def __init__(self):
+    async def _discover(self, host: str, ports: List[int], concurrency: int,
+                        progress_callback: Optional[Callable]) -> List[int]:
         """
-        Step 5: Initialize the scanner engine with default timeout.
-        The timeout determines how long to wait for a response when testing a port.
+        Step 8.8: Probe all ports concurrently and collect the open ones.
+        Closed ports are reported to the progress callback as they finish; open
+        ports are reported after their banner has been grabbed.
         """
-        self.timeout = 1.0  # Default socket timeout in seconds
-        self.banner_timeout = 3.0  # Longer timeout for banner grabbing
-        self.ssl_timeout = 5.0  # Even longer timeout for SSL certificate retrieval
+        semaphore = asyncio.Semaphore(concurrency)
         
-    def test_port(self, host: str, port: int) -> bool:
-        """
-        Step 6: Test if a specific port is open on the target host.
-        This is the most basic operation - connecting to a specific port to see if it responds.
+        async def probe(port: int) -> Optional[int]:
+            if await self._probe_port(host, port, semaphore):
+                return port
+            if progress_callback:
+                progress_callback(port, False)
+            return None
         
-        Args:
-            host: The hostname or IP address to scan
-            port: The port number to scan
-            
-        Returns:
-            bool: True if port is open, False otherwise
-        """
-        try:
-            # Step 6.1: Create a new socket for this connection attempt
-            # AF_INET specifies IPv4, SOCK_STREAM specifies TCP connection
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(self.timeout)  # Set socket timeout
-            
-            # Step 6.2: Attempt to connect to the port
-            # connect_ex returns 0 if connection succeeds, error code otherwise
-            result = s.connect_ex((host, port))
-            s.close()  # Always close socket to free resources
-            
-            # Step 6.3: Return True if connection succeeded (port is open)
-            return result == 0
-            
-        except Exception as e:
-            # Log errors but continue scanning other ports
-            logger.debug(f"Error scanning port {port}: {e}")
-            return False
-            
-    def fetch_service_info(self, port: int) -> str:
+        found = await asyncio.gather(*(probe(port) for port in ports))
+        return [port for port in found if port is not None]
+    
+    def _discover_blocking(self, host: str, ports: List[int], concurrency: int,
+                           progress_callback: Optional[Callable]) -> List[int]:
+        """
+        Step 8.8.1: Probe the ports with blocking connects on a pool of workers.
+        Under gevent the workers are greenlets and every connect yields to the hub,
+        which gives the same concurrency as the event loop without one per scan.
+        """
+        open_ports = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='discover') as pool:
+            for port, is_open in zip(ports, pool.map(self.test_port, [host] * len(ports), ports)):
+                if is_open:
+                    open_ports.append(port)
+                elif progress_callback:
+                    progress_callback(port, False)
+        return open_ports
+    
+    def discover_open_ports(self, host: str, ports: List[int],
+                            progress_callback: Optional[Callable] = None,
+                            max_sockets: Optional[int] = None) -> List[int]:
         """
-        Step 7: Fetch service information for a specific port number.
-        This helps identify what service might be running on an open port.
+        Step 8.9: Find open ports using one event loop instead of a thread per port.
+        Under gevent the loop would clash with other scans' loops on the shared
+        OS thread, so the blocking probes on greenlets are used instead.
         
         Args:
-            port: The port number
+            host: The hostname or IP address to scan
+            ports: List of port numbers to scan
+            progress_callback: Optional callback, called for each closed port
+            max_sockets: Optional cap on sockets open at once (file descriptor budget)
             
         Returns:
-            str: The service name associated with the port
-        """
-        try:
-            # Step 7.1: First check our own map for common services (faster)
-            if port in SERVICE_MAP:
-                return SERVICE_MAP[port]
-                
-            # Step 7.2: Then try socket.getservbyport for less common services
-            return socket.getservbyport(port)
-        except (socket.error, OSError):
-            # Return "Unknown" if service can't be identified
-            return "Unknown"
+            List[int]: Open ports, in probe order
+        """
+        concurrency = min(self.max_concurrency, len(ports))
+        if max_sockets is not None:
+            concurrency = min(concurrency, max_sockets)
+        concurrency = max(1, concurrency)
+        if gevent_patched():
+            return self._discover_blocking(host, ports, concurrency, progress_callback)
+        return asyncio.run(self._discover(host, ports, concurrency, progress_callback))
     
-    def grab_banner(self, host: str, port: int, service: str) -> Dict[str, Any]:
+    @staticmethod
+    def port_record(service: str, banner_info: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Grab service banner, version information, and other details from an open port.
+        Step 8.11: Build the result entry stored for an open port.
         
         Args:
-            host: The hostname or IP address of the target
-            port: The port number that is open
             service: The identified service name
+            banner_info: Output of grab_banner()
             
         Returns:
-            Dict[str, Any]: Banner information including version, server details, etc.
-        """
-        banner_info = {
-            "banner": "",
-            "version": "",
-            "server": "",
-            "ssl_cert": {}
+            Dict[str, Any]: Service, banner, version, server and SSL certificate details
+        """
+        return {
+            "service": service,
+            "banner": banner_info.get("banner", ""),
+            "version": banner_info.get("version", ""),
+            "server": banner_info.get("server", ""),
+            "ssl_cert": banner_info.get("ssl_cert", {})
         }
-        
-        try:
-            # Handle SSL/TLS services first
-            if service in ["HTTPS", "IMAPS", "POP3S", "SMTPS"] or port in [443, 465, 636, 993, 995]:
-                ssl_info = self.get_ssl_info(host, port)
-                if ssl_info:
-                    banner_info["ssl_cert"] = ssl_info
-            
-            # Handle HTTP/HTTPS
-            if service in ["HTTP", "HTTPS"] or port in [80, 443, 8080, 8443]:
-                http_info = self.grab_http_banner(host, port, service == "HTTPS" or port == 443)
-                if http_info:
-                    banner_info.update(http_info)
-            
-            # Handle FTP
-            elif service == "FTP" or port == 21:
-                ftp_banner = self.grab_protocol_banner(host, port)
-                if ftp_banner:
-                    banner_info["banner"] = ftp_banner
-                    # Extract version from FTP banner if available
-                    version_match = re.search(r'(\d+\.\d+\.\d+)', ftp_banner)
-                    if version_match:
-                        banner_info["version"] = version_match.group(1)
-            
-            # Handle SSH
-            elif service == "SSH" or port == 22:
-                ssh_banner = self.grab_protocol_banner(host, port)
-                if ssh_banner:
-                    banner_info["banner"] = ssh_banner
-                    # Extract SSH version
-                    version_match = re.search(r'SSH-(\d+\.\d+)-([^\s]+)', ssh_banner)
-                    if version_match:
-                        banner_info["version"] = f"{version_match.group(1)} {version_match.group(2)}"
-            
-            # Handle SMTP
-            elif service == "SMTP" or port == 25:
-                smtp_banner = self.grab_protocol_banner(host, port)
-                if smtp_banner:
-                    banner_info["banner"] = smtp_banner
-                    # Extract SMTP server and version
-                    server_match = re.search(r'ESMTP ([^\s]+)', smtp_banner)
-                    if server_match:
-                        banner_info["server"] = server_match.group(1)
-            
-            # Handle other services with a generic banner grab
-            elif not banner_info["banner"]:
-                generic_banner = self.grab_protocol_banner(host, port)
-                if generic_banner:
-                    banner_info["banner"] = generic_banner
-            
-        except Exception as e:
-            logger.debug(f"Error grabbing banner for {host}:{port} - {e}")
-        
-        return banner_info
     
-    def grab_protocol_banner(self, host: str, port: int) -> str:
+    def inspect_open_port(self, host: str, port: int, progress_callback: Optional[Callable] = None,
+                          result_callback: Optional[Callable] = None) -> Tuple[int, bool, str, Dict[str, Any]]:
         """
-        Grab a generic protocol banner by connecting and reading the initial response.
+        Step 8.10: Identify the service and grab the banner of a port known to be open.
         
         Args:
-            host: The hostname or IP address to connect to
-            port: The port number to connect to
-            
-        Returns:
-            str: The banner string if available, empty string otherwise
-        """
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(self.banner_timeout)
-            s.connect((host, port))
-            
-            # Some protocols send data immediately upon connection
-            banner = ""
-            try:
-                # Wait for up to 2 seconds for initial data
-                s.settimeout(2.0)
-                data = s.recv(1024)
-                if data:
-                    banner = data.decode('utf-8', errors='ignore').strip()
-            except socket.timeout:
-                # For protocols that don't send data immediately, try sending a newline
-                try:
-                    s.send(b"\r\n")
-                    s.settimeout(2.0)
-                    data = s.recv(1024)
-                    if data:
-                        banner = data.decode('utf-8', errors='ignore').strip()
-                except:
-                    pass
-            finally:
-                s.close()
-                
-            return banner
-        except Exception as e:
-            logger.debug(f"Error grabbing protocol banner for {host}:{port} - {e}")
-            return ""
-    
-    def grab_http_banner(self, host: str, port: int, use_ssl: bool = False) -> Dict[str, str]:
-        """
-        Grab HTTP server information by sending a HTTP HEAD request.
-        
-        Args:
-            host: The hostname or IP address to connect to
-            port: The port number to connect to
-            use_ssl: Whether to use SSL/TLS for the connection
+            host: The hostname or IP address to scan
+            port: An open port number
+            progress_callback: Optional callback function to update progress
+            result_callback: Optional callback, called with (port, record) as soon as the port is inspected
             
         Returns:
-            Dict[str, str]: HTTP server information
+            Tuple[int, bool, str, Dict[str, Any]]: Same shape as scan_port_worker()
         """
-        http_info = {
-            "banner": "",
-            "server": "",
-            "version": ""
-        }
-        
-        try:
-            # Create socket and connect
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(self.banner_timeout)
-            s.connect((host, port))
-            
-            # Wrap socket with SSL if needed
-            if use_ssl:
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                try:
-                    s = context.wrap_socket(s, server_hostname=host)
-                except Exception as e:
-                    logger.debug(f"SSL wrapping failed for {host}:{port} - {e}")
-                    s.close()
-                    return http_info
-            
-            # Send HTTP HEAD request
-            s.send(f"HEAD / HTTP/1.1\r\nHost: {host}\r\nUser-Agent: Port Scanner\r\nConnection: close\r\n\r\n".encode())
-            
-            # Receive and process response
-            response = b""
-            while True:
-                try:
-                    chunk = s.recv(4096)
-                    if not chunk:
-                        break
-                    response += chunk
-                    
-                    # Avoid reading too much data
-                    if len(response) > 8192:
-                        break
-                except socket.timeout:
-                    break
-            
-            s.close()
-            
-            if response:
-                # Decode response and extract headers
-                resp_text = response.decode('utf-8', errors='ignore')
-                http_info["banner"] = resp_text.split('\r\n\r\n')[0]  # Just the headers
-                
-                # Extract server information
-                server_match = re.search(r'Server: ([^\r\n]+)', resp_text)
-                if server_match:
-                    server = server_match.group(1).strip()
-                    http_info["server"] = server
-                    
-                    # Try to extract version from server header
-                    version_match = re.search(r'(\d+\.\d+\.\d+)', server)
-                    if version_match:
-                        http_info["version"] = version_match.group(1)
-        
-        except Exception as e:
-            logger.debug(f"Error grabbing HTTP banner for {host}:{port} - {e}")
-        
-        return http_info
-    
-    def get_ssl_info(self, host: str, port: int) -> Dict[str, Any]:
-        """Get SSL certificate information for a host:port."""
-        ssl_info = {
-            "valid": False,
-            "issued_to": "Unknown",
-            "issued_by": "Unknown",
-            "valid_from": "",
-            "valid_until": "",
-            "version": "",
-            "serial_number": "",
-            "signature_algorithm": ""
-        }
-        
-        try:
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            
-            with socket.create_connection((host, port), timeout=2) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    cert = ssock.getpeercert(binary_form=False)
-                    if not cert:
-                        return ssl_info
-                    
-                    ssl_info["valid"] = True
-                    
-                    # Get subject (issued to)
-                    if 'subject' in cert and cert['subject']:
-                        subject_parts = []
-                        for field in cert['subject']:
-                            for key, value in field:
-                                if key in ['commonName', 'organizationName', 'organizationalUnitName']:
-                                    subject_parts.append(value)
-                        ssl_info["issued_to"] = " / ".join(filter(None, subject_parts))
-                    
-                    # Get issuer
-                    if 'issuer' in cert and cert['issuer']:
-                        issuer_parts = []
-                        for field in cert['issuer']:
-                            for key, value in field:
-                                if key in ['commonName', 'organizationName']:
-                                    issuer_parts.append(value)
-                        ssl_info["issued_by"] = " / ".join(filter(None, issuer_parts))
-                    
-                    # Get validity dates
-                    if 'notBefore' in cert:
-                        ssl_info["valid_from"] = cert['notBefore']
-                    if 'notAfter' in cert:
-                        ssl_info["valid_until"] = cert['notAfter']
-                    
-                    # Get version and serial number
-                    if 'version' in cert:
-                        ssl_info["version"] = f"v{cert['version']}"
-                    if 'serialNumber' in cert:
-                        ssl_info["serial_number"] = cert['serialNumber']
-                    
-                    # Get signature algorithm
-                    if 'signatureAlgorithm' in cert:
-                        ssl_info["signature_algorithm"] = cert['signatureAlgorithm']
-                    
-        except (socket.error, ssl.SSLError, ssl.CertificateError) as e:
-            logger.debug(f"Error grabbing SSL information for {host}:{port} - {e}")
-            ssl_info["error"] = str(e)
-        
-        return ssl_info
+        service = self.fetch_service_info(port)
+        banner_info = self.grab_banner(host, port, service)
+        if result_callback:
+            result_callback(port, self.port_record(service, banner_info))
+        if progress_callback:
+            progress_callback(port, True)
+        version_info = f" ({banner_info.get('version', '')})" if banner_info.get('version') else ""
+        logger.info(f"Port {port} is {Fore.GREEN}open{Fore.RESET} ({service}{version_info})")
+        return port, True, service, banner_info
     
     def scan_port_worker(self, host: str, port: int, progress_callback: Optional[Callable] = None) -> Tuple[int, bool, str, Dict[str, Any]]:
         """
@@ -877,7 +750,9 @@ class ScannerEngine:
         ports: List[int], 
         threading_module: 'ThreadingModule', 
         thread_count: int = 10,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        address: Optional[str] = None,
+        result_callback: Optional[Callable] = None
     ) -> Dict[int, Dict[str, Any]]:
         """
         Step 9: Scan a list of ports on the target host using multithreading.
@@ -889,21 +764,22 @@ class ScannerEngine:
             threading_module: ThreadingModule instance for managing threads
             thread_count: Number of threads to use for scanning
             progress_callback: Optional callback function to update progress
+            address: Address already resolved for host by resolve_target(), if any
+            result_callback: Optional callback, called with (port, record) for each open port as it is found
             
         Returns:
             Dict[int, Dict[str, Any]]: Dictionary of open ports with service and banner information
         """
         # Step 9.1: Import multiprocessing to get CPU count
         import multiprocessing
-        import os
         
         # Step 9.2: Get the number of CPU cores available
         # This helps determine optimal thread count
         cpu_count = multiprocessing.cpu_count()
         
-        # Step 9.3: Calculate optimal thread count based on CPU cores
-        # For I/O bound operations like network scanning, 2x CPU cores is optimal
-        max_recommended_threads = cpu_count * 2
+        # Step 9.3: Take the thread limit from the threading module
+        # It is derived from the CPU count and the file descriptor budget
+        max_recommended_threads = threading_module.MAX_THREAD_COUNT
         
         # Step 9.4: Cap the user-specified thread count to the optimal value
         # Too many threads can degrade performance
@@ -926,29 +802,25 @@ class ScannerEngine:
         # This makes the scan less detectable as an attack
         random.shuffle(ports)
         
-        # Step 9.7: Create scanning tasks
-        # Each task is a tuple of (function, arguments)
-        tasks = []
-        for port in ports:
-            tasks.append((self.scan_port_worker, (host, port, progress_callback)))
+        # Step 9.7: Find open ports with non-blocking connects on one event loop
+        # Thousands of probes share a single thread instead of one thread per port
+        # The target is resolved once here rather than on every connect
+        if address is None:
+            address = self.resolve_target(host)
+        open_port_numbers = self.discover_open_ports(address, ports, progress_callback,
+                                                     max_sockets=threading_module.MAX_SOCKETS)
         
-        # Step 9.8: Execute scans with threads
-        # This is where the ThreadingModule does the heavy lifting
-        results = threading_module.execute_tasks(tasks, effective_thread_count)
+        # Step 9.8: Grab banners for the open ports with threads
+        # Banner grabbing does blocking reads and SSL handshakes, so the ThreadingModule handles it
+        tasks = [(self.inspect_open_port, (host, port, progress_callback, result_callback)) for port in open_port_numbers]
+        results = threading_module.execute_tasks(tasks, effective_thread_count) if tasks else []
         
         # Step 9.9: Collect results of open ports
         open_ports = {}
         for port, is_open, service, banner_info in results:
             if is_open:
                 # Store service and banner information in a structured format
-                port_data = {
-                    "service": service,
-                    "banner": banner_info.get("banner", ""),
-                    "version": banner_info.get("version", ""),
-                    "server": banner_info.get("server", ""),
-                    "ssl_cert": banner_info.get("ssl_cert", {})
-                }
-                open_ports[port] = port_data
+                open_ports[port] = self.port_record(service, banner_info)
                 
         # Step 9.10: Return dictionary of open ports and their detailed information
         return open_ports
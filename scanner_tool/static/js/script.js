@@ -1,10 +1,17 @@
 // Global variables
     let scanActive = false;
     let scanId = null;
-    let updateInterval = null;
+    let updateInterval = null; // Timer for the next status poll
+    let polling = false; // Polling fallback in use instead of the event stream
+    let pollPaused = false; // Next poll deferred until the tab is visible again
+    const POLL_INTERVAL_MS = 500;
+    const JSON_HEADERS = { 'Content-Type': 'application/json' }; // Shared by JSON POSTs
+    let scanEvents = null; // EventSource for streamed scan updates
+    let serverThreadLimit = null; // Thread cap reported by the server
     let resultCount = 0; // Track the number of found ports
     let currentLogIndex = 0;
-    let typingEffect = false;
+    let lastStatusEtag = null; // ETag of the last polled status, sent back as If-None-Match
+    let lastPortCount = 0; // Port count last reported by validatePortsVisually
 
     // DOM Elements
     const targetInput = document.getElementById('target');
@@ -22,33 +29,57 @@
     const exportModal = document.getElementById('export-modal');
     const threadWarning = document.getElementById('thread-warning');
     const currentTimeElem = document.getElementById('current-time');
+    const scanOverlay = document.getElementById('scan-overlay');
+    let tabContents = []; // Cached on DOMContentLoaded
+    let tabButtons = [];
 
-    // Update current time
+    // Update current time once per second, on the second; paused while the tab is hidden
+    const timeFormat = new Intl.DateTimeFormat(undefined, { dateStyle: 'short', timeStyle: 'medium' });
+    let timeTimer = null;
     function updateTime() {
         const now = new Date();
-        currentTimeElem.textContent = now.toLocaleString();
+        currentTimeElem.textContent = timeFormat.format(now);
+        timeTimer = setTimeout(updateTime, 1000 - now.getMilliseconds());
     }
     
-    // Play sound effect (optional - silent if audio not supported)
-    function playTechSound(type) {
-        // Function stub - sound effects disabled for now
-        console.log(`Sound effect: ${type}`);
-    }
-
+    document.addEventListener('visibilitychange', () => {
+        clearTimeout(timeTimer);
+        timeTimer = null;
+        if (!document.hidden) updateTime();
+    });
+    
     // Initialize
     document.addEventListener('DOMContentLoaded', function() {
-        updateTime();
-        setInterval(updateTime, 1000);
+        tabContents = document.querySelectorAll('.tab-content');
+        tabButtons = document.querySelectorAll('.tab-button');
+        
+        // One delegated listener for all tab buttons
+        const tabNavigation = document.querySelector('.tab-navigation');
+        if (tabNavigation) {
+            tabNavigation.addEventListener('click', e => {
+                const button = e.target.closest('[data-tab]');
+                if (button) showTab(button.dataset.tab, button);
+            });
+        }
+        if (!document.hidden) updateTime();
 
         // Event listeners
         usePredefinedCheck.addEventListener('change', togglePortInput);
 
+        // Resume status polling when a backgrounded tab becomes visible again
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden && pollPaused) {
+                pollPaused = false;
+                updateScanProgress();
+            }
+        });
+
         // Check thread count on input to show warnings
         threadsInput.addEventListener('input', function() {
             const threadCount = parseInt(this.value);
-            // Estimate CPU cores for client-side warning (actual value comes from server later)
+            // Use the server's cap once known, otherwise estimate from CPU cores
             const estimatedCores = 8;
-            const recommendedMax = estimatedCores * 2;
+            const recommendedMax = serverThreadLimit || estimatedCores * 2;
 
             if (threadCount > recommendedMax) {
                 threadWarning.style.display = 'block';
@@ -57,10 +88,6 @@
             }
         });
 
-        // Add terminal typing effect to the header
-        const header = document.querySelector('h1');
-        applyTypingEffect(header);
-        
         // Add some initial tech logs
         setTimeout(() => {
             addLogEntry('System initialized', 'info');
@@ -74,10 +101,8 @@
             addLogEntry(`Target input focused`, 'info');
         });
         
-        // Add port range visual feedback
-        portRangeInput.addEventListener('input', () => {
-            validatePortsVisually();
-        });
+        // Add port range visual feedback (once typing pauses)
+        portRangeInput.addEventListener('input', debounce(validatePortsVisually, 150));
         
         // Add thread count visual feedback
         threadsInput.addEventListener('input', () => {
@@ -90,23 +115,31 @@
         });
     });
 
+    // Start or stop the animations that only run during a scan; the
+    // will-change hint is held only for as long as the bar is moving
+    function setScanAnimations(active) {
+        progressBar.classList.toggle('idle', !active);
+        progressBar.style.willChange = active ? 'width' : 'auto';
+        if (scanOverlay) scanOverlay.classList.toggle('active', active);
+    }
+
     // Tab navigation
-    function showTab(tabId) {
+    function showTab(tabId, button) {
         // Hide all tab content
-        document.querySelectorAll('.tab-content').forEach(tab => {
+        tabContents.forEach(tab => {
             tab.classList.remove('active');
         });
 
         // Remove active class from all tab buttons
-        document.querySelectorAll('.tab-button').forEach(button => {
-            button.classList.remove('active');
+        tabButtons.forEach(tabButton => {
+            tabButton.classList.remove('active');
         });
 
         // Show selected tab
         document.getElementById(tabId).classList.add('active');
 
         // Set active class on clicked button
-        event.currentTarget.classList.add('active');
+        if (button) button.classList.add('active');
     }
 
     // Toggle port input based on checkbox
@@ -118,16 +151,10 @@
             portRangeInput.value = '';
             addLogEntry('Custom port configuration enabled', 'info');
         }
-        
-        // Add tech sound effect
-        playTechSound('toggle');
     }
 
     // Get local IP address
     function useLocalIP() {
-        // Add tech sound effect
-        playTechSound('process');
-        
         addLogEntry('Detecting local IP address...', 'info');
         
         fetch('/api/local-ip')
@@ -196,6 +223,7 @@
         exportButton.disabled = true;
         statusLabel.textContent = 'Scanning...';
         progressBar.style.width = '0%';
+        setScanAnimations(true);
 
         // Clear previous results
         clearResults(false);
@@ -214,9 +242,7 @@
         // Start scan
         fetch('/api/scan/start', {
             method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
+            headers: JSON_HEADERS,
             body: JSON.stringify(scanData)
         })
         .then(response => response.json())
@@ -229,9 +255,20 @@
 
             scanId = data.scan_id;
             scanActive = true;
+            currentLogIndex = 0;
+            lastStatusEtag = null;
+
+            // Show the thread cap the server applied
+            if (data.thread_limit) {
+                serverThreadLimit = data.thread_limit;
+                if (data.threads < scanData.threads) {
+                    threadWarning.innerHTML = `<span class="warning-icon">⚠</span> Limited to ${Number(data.threads)} threads (server maximum ${Number(data.thread_limit)})`;
+                    threadWarning.style.display = 'block';
+                }
+            }
 
-            // Start polling for updates
-            updateInterval = setInterval(updateScanProgress, 500);
+            // Start receiving updates
+            startProgressUpdates();
         })
         .catch(error => {
             addLogEntry('Error starting scan: ' + error, 'error');
@@ -255,81 +292,146 @@
             addLogEntry('Error stopping scan: ' + error, 'error');
         });
 
-        clearInterval(updateInterval);
+        stopProgressUpdates();
         scanActive = false;
     }
 
-    // Update scan progress
-    function updateScanProgress() {
-        if (!scanActive || !scanId) return;
-
-        fetch(`/api/scan/${scanId}/status`)
-            .then(response => response.json())
-            .then(data => {
-                // Show CPU cores information and thread limit if available
-                if (data.cpu_cores && !window.threadInfoShown) {
-                    const maxRecommended = data.max_recommended_threads || (data.cpu_cores * 2);
-                    addLogEntry(`System has ${data.cpu_cores} CPU cores. Maximum recommended threads: ${maxRecommended}`, 'info');
-
-                    // If user specified more threads than recommended, show a warning
-                    const userThreads = parseInt(threadsInput.value);
-                    if (userThreads > maxRecommended) {
-                        addLogEntry(`Your specified ${userThreads} threads exceeds the recommended maximum of ${maxRecommended}. The scan will use a limited thread count for optimal performance.`, 'warning');
-                    }
-
-                    window.threadInfoShown = true;
-                }
+    // Receive scan updates over Server-Sent Events, polling when unavailable
+    function startProgressUpdates() {
+        if (!window.EventSource) {
+            startPolling();
+            return;
+        }
 
-                // Update progress bar
-                progressBar.style.width = `${data.progress}%`;
+        scanEvents = new EventSource(`/api/scan/${scanId}/stream`);
+        scanEvents.onmessage = event => handleScanUpdate(JSON.parse(event.data));
+        scanEvents.onerror = () => {
+            // Stream dropped (e.g. behind a buffering proxy): fall back to polling
+            scanEvents.close();
+            scanEvents = null;
+            if (scanActive) {
+                startPolling();
+            }
+        };
+    }
 
-                // Add new log entries
-                if (data.logs && data.logs.length > 0) {
-                    data.logs.forEach(log => {
-                        addLogEntry(log.message, log.level);
-                    });
-                }
+    // Poll the status endpoint; each poll schedules the next one when it finishes
+    function startPolling() {
+        polling = true;
+        pollPaused = false;
+        updateScanProgress();
+    }
 
-                // Update results table
-                if (data.results) {
-                    updateResultsTable(data.results);
-                }
-                
-                // Update dashboard statistics if we're on the same page
-                if (data.real_time_stats) {
-                    updateDashboardStats(data.real_time_stats);
-                }
+    // Schedule the next poll, or pause until the tab is visible again
+    function scheduleNextPoll() {
+        if (!polling || !scanActive) return;
+        if (document.hidden) {
+            pollPaused = true;
+            return;
+        }
+        // rAF lets the browser throttle polls along with rendering
+        updateInterval = setTimeout(() => requestAnimationFrame(updateScanProgress), POLL_INTERVAL_MS);
+    }
 
-                // Check if scan is complete
-                if (data.status === 'completed' || data.status === 'failed' || data.status === 'stopped') {
-                    clearInterval(updateInterval);
-                    scanActive = false;
-
-                    if (data.status === 'completed') {
-                        statusLabel.textContent = `Completed in ${data.duration.toFixed(2)}s`;
-                        progressBar.style.width = '100%';
-
-                        // Enable export button if we have results
-                        if (data.results && Object.keys(data.results).length > 0) {
-                            exportButton.disabled = false;
-                        }
-                    } else if (data.status === 'failed') {
-                        statusLabel.textContent = 'Scan Failed';
-                    } else {
-                        statusLabel.textContent = 'Stopped';
-                    }
+    // Stop receiving scan updates
+    function stopProgressUpdates() {
+        if (scanEvents) {
+            scanEvents.close();
+            scanEvents = null;
+        }
+        polling = false;
+        pollPaused = false;
+        clearTimeout(updateInterval);
+    }
 
-                    scanButton.disabled = false;
-                    stopButton.disabled = true;
-                }
+    // Update scan progress by polling
+    function updateScanProgress() {
+        if (!polling || !scanActive || !scanId) return;
+
+        const headers = lastStatusEtag ? { 'If-None-Match': lastStatusEtag } : {};
+        fetch(`/api/scan/${scanId}/status?logs_index=${currentLogIndex}`, { headers })
+            .then(response => {
+                if (response.status === 304) return null; // Nothing changed since the last poll
+                lastStatusEtag = response.headers.get('ETag');
+                return response.json();
+            })
+            .then(data => {
+                if (data !== null) handleScanUpdate(data);
             })
+            .then(scheduleNextPoll)
             .catch(error => {
                 addLogEntry('Error updating scan status: ' + error, 'error');
-                clearInterval(updateInterval);
+                stopProgressUpdates();
                 resetScanUI();
             });
     }
 
+    // Apply a status update from the stream or a poll
+    function handleScanUpdate(data) {
+        if (data.logs_index !== undefined) {
+            currentLogIndex = data.logs_index;
+        }
+
+        // Show CPU cores information and thread limit if available
+        if (data.cpu_cores && !window.threadInfoShown) {
+            const maxRecommended = data.max_recommended_threads || (data.cpu_cores * 2);
+            addLogEntry(`System has ${data.cpu_cores} CPU cores. Maximum recommended threads: ${maxRecommended}`, 'info');
+
+            // If user specified more threads than recommended, show a warning
+            const userThreads = parseInt(threadsInput.value);
+            if (userThreads > maxRecommended) {
+                addLogEntry(`Your specified ${userThreads} threads exceeds the recommended maximum of ${maxRecommended}. The scan will use a limited thread count for optimal performance.`, 'warning');
+            }
+
+            window.threadInfoShown = true;
+        }
+
+        // Update progress bar
+        progressBar.style.width = `${data.progress}%`;
+
+        // Add new log entries
+        if (data.logs && data.logs.length > 0) {
+            data.logs.forEach(log => {
+                addLogEntry(log.message, log.level);
+            });
+        }
+
+        // Update results table
+        if (data.results) {
+            updateResultsTable(data.results);
+        }
+        
+        // Update dashboard statistics if we're on the same page
+        if (data.real_time_stats) {
+            updateDashboardStats(data.real_time_stats);
+        }
+
+        // Check if scan is complete
+        if (data.status === 'completed' || data.status === 'failed' || data.status === 'stopped') {
+            stopProgressUpdates();
+            scanActive = false;
+            setScanAnimations(false);
+
+            if (data.status === 'completed') {
+                statusLabel.textContent = `Completed in ${data.duration.toFixed(2)}s`;
+                progressBar.style.width = '100%';
+
+                // Enable export button if we have results
+                // (streamed updates carry only new ports, so count rendered rows)
+                if (resultCount > 0) {
+                    exportButton.disabled = false;
+                }
+            } else if (data.status === 'failed') {
+                statusLabel.textContent = 'Scan Failed';
+            } else {
+                statusLabel.textContent = 'Stopped';
+            }
+
+            scanButton.disabled = false;
+            stopButton.disabled = true;
+        }
+    }
+
     // Update dashboard statistics if we're on the dashboard page
     function updateDashboardStats(stats) {
         // Check if dashboard elements exist (we might be on the scanner page)
@@ -345,100 +447,110 @@
         }
     }
 
+    // Ports already shown in the results table
+    const renderedPorts = new Set();
+
+    // Create a table cell with plain text content
+    function textCell(text, className) {
+        const cell = document.createElement('td');
+        if (className) cell.className = className;
+        cell.textContent = text;
+        return cell;
+    }
+
     // Update results table with banner grabbing information
+    // Only ports not yet in the table get a new row; existing rows are left alone
     function updateResultsTable(results) {
         const host = targetInput.value.trim();
-        const currentPortCount = Object.keys(results).length;
-
-        // Only update if we have new results
-        if (currentPortCount > resultCount) {
-            const newPorts = currentPortCount - resultCount;
-            playTechSound('success');
-            addLogEntry(`Discovered ${newPorts} new open port${newPorts > 1 ? 's' : ''}`, 'success');
-
-            // Clear and rebuild the table for animation effect
-            resultsBody.innerHTML = '';
-
-            // Update with new result count
-            resultCount = currentPortCount;
+        const fragment = document.createDocumentFragment();
+        let newPorts = 0;
+
+        for (const port of Object.keys(results)) {
+            if (renderedPorts.has(port)) continue;
+            renderedPorts.add(port);
+            newPorts++;
+
+            // Get full port data (either string or object with banner information)
+            const portData = results[port];
+
+            // Parse port data to extract service, version, and server details
+            let service, version, server, banner, sslCert;
+
+            // Check if port data is enhanced format (object) or legacy format (string)
+            if (typeof portData === 'string') {
+                // Legacy format - just a service name string
+                service = portData;
+                version = '';
+                server = '';
+            } else {
+                // Enhanced format - object with detailed banner information
+                service = portData.service || '';
+                version = portData.version || '';
+                server = portData.server || '';
+                banner = portData.banner || '';
+                sslCert = portData.ssl_cert || {};
+            }
 
-            // Populate table with animation delay
-            let delay = 0;
-            for (const port in results) {
-                // Get full port data (either string or object with banner information)
-                const portData = results[port];
+            // Create the table row with all available information
+            const row = document.createElement('tr');
+            row.className = 'row-new';
+            row.style.setProperty('--i', Math.min(newPorts - 1, 10)); // Short stagger within a batch
+
+            // Add status indicator with color coding
+            const statusCell = textCell('Open', 'port-open');
+            const statusIndicator = document.createElement('span');
+            statusIndicator.className = 'status-indicator status-open';
+            statusCell.prepend(statusIndicator);
+
+            // Create details button for viewing banner information
+            const detailsCell = document.createElement('td');
+            const hasDetails = banner || (sslCert && Object.values(sslCert).some(v => v));
+            if (hasDetails) {
+                const detailsBtn = document.createElement('button');
+                detailsBtn.className = 'btn btn-sm btn-info';
+                detailsBtn.textContent = 'View';
+                detailsBtn.addEventListener('click', () => showDetailsModal(port, escape(JSON.stringify(portData))));
+                detailsCell.appendChild(detailsBtn);
+            }
 
-                // Parse port data to extract service, version, and server details
-                let service, version, server, banner, sslCert;
+            row.append(
+                textCell(host),
+                textCell(port),
+                statusCell,
+                textCell(service),
+                textCell(version),
+                textCell(server),
+                detailsCell
+            );
+
+            // Add banner information to log view
+            if (banner) {
+                addLogEntry(`Port ${port} banner: ${banner}`, 'info');
+            }
 
-                // Check if port data is enhanced format (object) or legacy format (string)
-                if (typeof portData === 'string') {
-                    // Legacy format - just a service name string
-                    service = portData;
-                    version = '';
-                    server = '';
-                } else {
-                    // Enhanced format - object with detailed banner information
-                    service = portData.service || '';
-                    version = portData.version || '';
-                    server = portData.server || '';
-                    banner = portData.banner || '';
-                    sslCert = portData.ssl_cert || {};
-
-                    // Log banner data for debugging if needed
-                    console.log("Port data JSON:", encodeURIComponent(JSON.stringify(portData)));
-                    console.log("Parsed port data:", portData);
+            // Add SSL certificate information to log view if available
+            if (sslCert && Object.keys(sslCert).length > 0) {
+                let sslInfo = '';
+                for (const [key, value] of Object.entries(sslCert)) {
+                    if (value) {
+                        const formattedKey = key.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
+                        sslInfo += `${formattedKey}: ${value}, `;
+                    }
                 }
 
-                // Create the table row with all available information
-                const row = document.createElement('tr');
-                row.style.animation = `fadeIn 0.3s ease ${delay}s both`;
-
-                // Build row with service and version information
-                // This also adds server information if available
-                // Create details button for viewing banner information
-                const hasDetails = banner || (sslCert && Object.values(sslCert).some(v => v));
-                const detailsBtn = hasDetails ? 
-                    `<button class="btn btn-sm btn-info" onclick="showDetailsModal(${port}, '${escape(JSON.stringify(portData))}')">View</button>` : 
-                    '';
-                
-                // Add status indicator with color coding
-                const statusIndicator = '<span class="status-indicator status-open"></span>';
-                
-                row.innerHTML = `
-                    <td>${host}</td>
-                    <td>${port}</td>
-                    <td class="port-open">${statusIndicator}Open</td>
-                    <td>${service}</td>
-                    <td>${version || ''}</td>
-                    <td>${server || ''}</td>
-                    <td>${detailsBtn}</td>
-                `;
-
-                // Add banner information to log view
-                if (banner) {
-                    addLogEntry(`Port ${port} banner: ${banner}`, 'info');
+                if (sslInfo) {
+                    sslInfo = sslInfo.slice(0, -2); // Remove trailing comma and space
+                    addLogEntry(`Port ${port} SSL Certificate: ${sslInfo}`, 'info');
                 }
+            }
 
-                // Add SSL certificate information to log view if available
-                if (sslCert && Object.keys(sslCert).length > 0) {
-                    let sslInfo = '';
-                    for (const [key, value] of Object.entries(sslCert)) {
-                        if (value) {
-                            const formattedKey = key.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
-                            sslInfo += `${formattedKey}: ${value}, `;
-                        }
-                    }
-
-                    if (sslInfo) {
-                        sslInfo = sslInfo.slice(0, -2); // Remove trailing comma and space
-                        addLogEntry(`Port ${port} SSL Certificate: ${sslInfo}`, 'info');
-                    }
-                }
+            fragment.appendChild(row);
+        }
 
-                resultsBody.appendChild(row);
-                delay += 0.05;
-            }
+        if (newPorts > 0) {
+            resultCount += newPorts;
+            addLogEntry(`Discovered ${newPorts} new open port${newPorts > 1 ? 's' : ''}`, 'success');
+            resultsBody.appendChild(fragment);
         }
     }
 
@@ -548,15 +660,70 @@
         modal.classList.remove('show');
     }
 
-    // Add log entry
+    // Log entries waiting to be inserted on the next animation frame
+    const LOG_MAX = 500; // Entries kept in the log view
+    const logQueue = [];
+    let logFlushScheduled = false;
+
+    // Per-level prefix and class, built once
+    const LOG_META = {
+        info: { prefix: 'ℹ', cls: 'log-entry log-info' },
+        success: { prefix: '✓', cls: 'log-entry log-success' },
+        warning: { prefix: '⚠', cls: 'log-entry log-warning' },
+        error: { prefix: '✗', cls: 'log-entry log-error' }
+    };
+
+    function logSpan(text) {
+        const span = document.createElement('span');
+        span.textContent = text;
+        return span;
+    }
+
+    // Add log entry (inserted in batches, once per frame)
     function addLogEntry(message, level) {
-        const timestamp = new Date().toLocaleTimeString();
+        const meta = LOG_META[level] || LOG_META.info;
         const logEntry = document.createElement('div');
-        logEntry.className = `log-entry log-${level}`;
-        logEntry.textContent = `[${timestamp}] ${message}`;
+        logEntry.className = meta.cls;
+        logEntry.appendChild(logSpan(`[${new Date().toLocaleTimeString()}] `));
+        logEntry.appendChild(logSpan(`${meta.prefix} `));
+        logEntry.appendChild(logSpan(message));
+
+        logQueue.push(logEntry);
+        if (logQueue.length > LOG_MAX) {
+            logQueue.shift(); // Hidden tabs don't run rAF; keep the backlog bounded
+        }
+        if (!logFlushScheduled) {
+            logFlushScheduled = true;
+            requestAnimationFrame(flushLogs);
+        }
+    }
 
-        logContainer.appendChild(logEntry);
-        logContainer.scrollTop = logContainer.scrollHeight; // Auto-scroll to bottom
+    // Insert queued log entries with one DOM append and one scroll
+    function flushLogs() {
+        logFlushScheduled = false;
+        const fragment = document.createDocumentFragment();
+        for (const entry of logQueue) {
+            fragment.appendChild(entry);
+        }
+        // A full batch replaces everything already shown
+        const replaceAll = logQueue.length >= LOG_MAX;
+        logQueue.length = 0;
+
+        // Read layout before writing so the frame only lays out once; leave
+        // the view alone if the user has scrolled up to read older entries
+        const pinned = logContainer.scrollTop + logContainer.clientHeight >= logContainer.scrollHeight - 50;
+        if (replaceAll) {
+            logContainer.replaceChildren(fragment);
+        } else {
+            logContainer.appendChild(fragment);
+            // Keep at most LOG_MAX entries so memory and layout stay bounded
+            while (logContainer.childElementCount > LOG_MAX) {
+                logContainer.firstElementChild.remove();
+            }
+        }
+        if (pinned) {
+            logContainer.scrollTop = logContainer.scrollHeight; // Auto-scroll to bottom
+        }
     }
 
     // Reset scan UI
@@ -564,13 +731,16 @@
         scanButton.disabled = false;
         stopButton.disabled = true;
         scanActive = false;
-        clearInterval(updateInterval);
+        setScanAnimations(false);
+        stopProgressUpdates();
     }
 
     // Clear results
     function clearResults(clearLogs = true) {
         // Clear table
         resultsBody.innerHTML = '';
+        renderedPorts.clear();
+        resultCount = 0;
 
         // Reset progress
         progressBar.style.width = '0%';
@@ -580,6 +750,7 @@
 
         // Clear logs if requested
         if (clearLogs) {
+            logQueue.length = 0;
             logContainer.innerHTML = '';
             addLogEntry('Results and logs cleared', 'info');
         }
@@ -595,6 +766,15 @@
             return;
         }
 
+        // Promote the dialog only while it slides in
+        const content = exportModal.querySelector('.modal-content');
+        if (content) {
+            content.style.willChange = 'transform, opacity';
+            content.addEventListener('animationend', () => {
+                content.style.willChange = 'auto';
+            }, { once: true });
+        }
+
         exportModal.style.display = 'block';
         // Add a small delay to ensure display is set before adding show class
         setTimeout(() => {
@@ -665,9 +845,9 @@
         console.log(`${type.toUpperCase()}: ${message}`);
     }
 
-    // Close modal when clicking outside of it
+    // Close modal when clicking outside of it or on a [data-dismiss] control
     window.onclick = function(event) {
-        if (event.target === exportModal) {
+        if (event.target === exportModal || event.target.closest('[data-dismiss="export-modal"]')) {
             closeExportModal();
         }
         if (event.target === document.getElementById('details-modal')) {
@@ -675,29 +855,27 @@
         }
     };
 
-    // Apply typing effect to an element
-    function applyTypingEffect(element) {
-        if (!element || typingEffect) return;
-        
-        typingEffect = true;
-        const text = element.textContent;
-        element.textContent = '';
-        element.classList.add('typing-effect');
-        
-        let i = 0;
-        const typeInterval = setInterval(() => {
-            if (i < text.length) {
-                element.textContent += text.charAt(i);
-                i++;
-            } else {
-                clearInterval(typeInterval);
-                setTimeout(() => {
-                    element.classList.remove('typing-effect');
-                }, 1000);
-            }
-        }, 80);
+    // Run fn only after it hasn't been called for ms milliseconds
+    function debounce(fn, ms) {
+        let timer = null;
+        return (...args) => {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn(...args), ms);
+        };
     }
-    
+
+    // Count the ports in a "21,22,80-90" style list in a single regex pass
+    const PORT_SPEC_RE = /(\d+)(?:\s*-\s*(\d+))?/g;
+    function countPorts(text) {
+        let count = 0;
+        for (const match of text.matchAll(PORT_SPEC_RE)) {
+            const start = +match[1];
+            const end = match[2] ? +match[2] : start;
+            if (end >= start) count += end - start + 1;
+        }
+        return count;
+    }
+
     // Validate ports visually
     function validatePortsVisually() {
         try {
@@ -705,21 +883,11 @@
             if (!portRangeText) return;
             
             // Count total ports
-            let portCount = 0;
-            const sections = portRangeText.split(',');
+            const portCount = countPorts(portRangeText);
             
-            for (const section of sections) {
-                if (section.includes('-')) {
-                    const [start, end] = section.split('-').map(p => parseInt(p.trim()));
-                    if (!isNaN(start) && !isNaN(end) && start <= end) {
-                        portCount += (end - start + 1);
-                    }
-                } else {
-                    if (!isNaN(parseInt(section.trim()))) {
-                        portCount++;
-                    }
-                }
-            }
+            // Only log when the count actually changed
+            if (portCount === lastPortCount) return;
+            lastPortCount = portCount;
             
             if (portCount > 100) {
                 addLogEntry(`Scan configuration: ${portCount} ports selected`, 'warning');
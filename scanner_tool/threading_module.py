@@ -4,15 +4,41 @@ This module provides efficient parallel processing capabilities for the port sca
 """
 
 import threading
-import queue
 import logging
-import time
 import os
 from typing import List, Tuple, Callable, Any
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker threads regardless of the machine
+THREAD_CEILING = 512
+# Socket budget used when the file descriptor limit can't be read
+DEFAULT_SOCKET_BUDGET = 256
+
+def socket_budget() -> int:
+    """
+    Number of sockets a scan may hold open at once: a quarter of the soft file
+    descriptor limit, leaving room for the web server, logs and exports.
+    
+    Returns:
+        int: Maximum concurrent sockets (at least 1)
+    """
+    if resource is None:
+        return DEFAULT_SOCKET_BUDGET
+    try:
+        soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    except (OSError, ValueError):
+        return DEFAULT_SOCKET_BUDGET
+    if soft_limit == resource.RLIM_INFINITY:
+        return THREAD_CEILING
+    return max(1, soft_limit // 4)
+
 class ThreadingModule:
     """
     Manages thread creation and synchronization for efficient port scanning.
@@ -22,9 +48,21 @@ class ThreadingModule:
     def __init__(self):
         """Initialize the threading module."""
         self.stop_event = threading.Event()
-        # Set reasonable limits for thread count based on system capabilities
+        # Set limits for thread count based on CPU count and the file descriptor budget
         cpu_count = os.cpu_count() or 4  # Default to 4 if cpu_count returns None
-        self.MAX_THREAD_COUNT = min(100, cpu_count * 5)
+        self.MAX_SOCKETS = socket_budget()
+        self.MAX_THREAD_COUNT = min(cpu_count * 8, self.MAX_SOCKETS, THREAD_CEILING)
+        # Worker pool shared by every scan, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.MAX_THREAD_COUNT, thread_name_prefix='scan')
+        return self._executor
         
     def execute_tasks(self, tasks: List[Tuple[Callable, Tuple]], thread_count: int) -> List[Any]:
         """
@@ -48,30 +86,35 @@ class ThreadingModule:
         if thread_count > optimal_thread_count:
             logger.warning(f"Thread count reduced from {thread_count} to {optimal_thread_count} for optimal performance")
         
-        # Use ThreadPoolExecutor for modern thread management
+        # Run on the shared pool; threads are reused across scans instead of
+        # being started and joined for every call
         results = []
+        executor = self._get_executor()
         
         logger.info(f"Starting execution of {len(tasks)} tasks with {optimal_thread_count} threads")
         
-        with ThreadPoolExecutor(max_workers=optimal_thread_count) as executor:
-            # Submit all tasks to the executor
-            futures = []
-            for func, args in tasks:
-                if self.stop_event.is_set():
-                    break
-                future = executor.submit(func, *args)
-                futures.append(future)
-            
-            # Collect results as they complete
-            for future in futures:
-                if self.stop_event.is_set():
-                    break
-                try:
-                    result = future.result(timeout=30)  # Add timeout to prevent hanging
-                    if result:  # Only append non-None results
-                        results.append(result)
-                except Exception as e:
-                    logger.error(f"Error in thread execution: {e}")
+        # Submit all tasks, keeping at most optimal_thread_count of this call's
+        # tasks in the pool so concurrent scans share it fairly
+        slots = threading.BoundedSemaphore(optimal_thread_count)
+        futures = []
+        for func, args in tasks:
+            if self.stop_event.is_set():
+                break
+            slots.acquire()
+            future = executor.submit(func, *args)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+        
+        # Collect results as they complete
+        for future in futures:
+            if self.stop_event.is_set():
+                break
+            try:
+                result = future.result(timeout=30)  # Add timeout to prevent hanging
+                if result:  # Only append non-None results
+                    results.append(result)
+            except Exception as e:
+                logger.error(f"Error in thread execution: {e}")
         
         logger.info(f"Completed execution of {len(tasks)} tasks")
         return results
@@ -0,0 +1,57 @@
+"""
+WSGI entry point - Serves the Flask app on gevent instead of the dev server
+
+gevent's monkey patching has to run before anything imports socket or
+threading, so this module patches first and imports the app afterwards.
+With the standard library patched, the scan worker threads and the
+ThreadPoolExecutor inside ThreadingModule run as greenlets that share one
+OS thread; each blocking connect() or recv() switches to another greenlet
+while it waits. Port discovery normally runs an asyncio event loop per scan,
+which can't be nested on one OS thread, so under gevent the scanner engine
+probes with blocking connects on greenlets instead (see
+ScannerEngine.discover_open_ports). CPU-bound work such as building exports
+still holds up every other scan and request while it runs.
+
+Usage:
+    python -m scanner_tool.wsgi
+    gunicorn -k gevent -w 1 scanner_tool.wsgi:application
+
+Run a single worker process. Scan state, finished results and the dashboard
+totals live in that process's memory, so with several workers a status poll,
+stream, export or dashboard request could reach a worker that never saw the
+scan. gevent already serves many requests concurrently within the one worker.
+"""
+
+# Step 1: Patch the standard library before the app is imported
+from gevent import monkey
+monkey.patch_all()
+
+import logging
+import os
+
+from gevent.pywsgi import WSGIServer
+
+# Step 2: Build the Flask app (noqa: the import must follow patch_all)
+from scanner_tool.flask_web_interface import create_app  # noqa: E402
+
+application = create_app()
+app = application  # Alias for `gunicorn scanner_tool.wsgi:app`
+
+logger = logging.getLogger(__name__)
+
+# Step 3: Server settings, overridable from the environment
+HOST = os.environ.get('HOST', '0.0.0.0')
+PORT = int(os.environ.get('PORT', 5000))
+
+
+def serve():
+    """
+    Step 4: Serve the app on gevent's WSGI server until interrupted.
+    """
+    logger.info("Serving on http://%s:%s (gevent)", HOST, PORT)
+    WSGIServer((HOST, PORT), app).serve_forever()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serve()
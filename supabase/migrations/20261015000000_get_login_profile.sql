@@ -0,0 +1,18 @@
+-- Username and admin flag of the signed-in user in one round trip, called at login
+-- by scanner_tool.auth.get_login_profile(). Returns null for any other user id.
+create or replace function public.get_login_profile(p_user_id uuid)
+returns json
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select json_build_object(
+        'username', (select username from public.users where id = p_user_id),
+        'is_admin', exists (select 1 from public.admin_users where id = p_user_id)
+    )
+    where p_user_id = auth.uid();
+$$;
+
+revoke execute on function public.get_login_profile(uuid) from public, anon;
+grant execute on function public.get_login_profile(uuid) to authenticated;
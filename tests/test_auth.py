@@ -0,0 +1,82 @@
+"""Tests for the Supabase client setup in scanner_tool.auth."""
+
+import pytest
+
+pytest.importorskip('supabase')
+
+from scanner_tool import auth
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    """Point auth at a dummy project and start without a cached client."""
+    monkeypatch.setattr(auth, '_SUPABASE_URL', 'https://example.supabase.co')
+    monkeypatch.setattr(auth, '_SUPABASE_KEY', 'header.payload.signature')
+    monkeypatch.setattr(auth, '_supabase_client', None)
+
+
+def test_get_supabase_constructs_client(credentials):
+    client = auth.get_supabase()
+    assert client is auth.get_supabase()
+
+
+def test_auth_client_is_separate_from_shared_client(credentials):
+    shared = auth.get_supabase()
+    auth_client = auth.create_auth_client()
+    assert auth_client is not shared
+    assert not auth_client.options.auto_refresh_token
+
+
+def test_missing_credentials_raise(monkeypatch):
+    monkeypatch.setattr(auth, '_SUPABASE_URL', None)
+    monkeypatch.setattr(auth, '_supabase_client', None)
+    with pytest.raises(ValueError):
+        auth.get_supabase()
+
+
+class _Query:
+    """Chainable stand-in for a PostgREST request builder."""
+
+    def __init__(self, data=None, error=None):
+        self.data = data
+        self.error = error
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return self
+
+
+class _ProfileClient:
+    """Client whose get_login_profile RPC fails with the given error."""
+
+    def __init__(self, rpc_error):
+        self.rpc_error = rpc_error
+        self.rpc_calls = 0
+
+    def rpc(self, name, params):
+        self.rpc_calls += 1
+        return _Query(error=self.rpc_error)
+
+    def table(self, name):
+        if name == 'users':
+            return _Query([{'username': 'alice'}])
+        return _Query([])
+
+
+def test_login_profile_falls_back_when_function_missing(monkeypatch):
+    monkeypatch.setattr(auth, '_login_profile_rpc', True)
+    client = _ProfileClient(auth.APIError({'code': 'PGRST202', 'message': 'not found'}))
+    assert auth.get_login_profile(client, 'user') == {'username': 'alice', 'is_admin': False}
+    auth.get_login_profile(client, 'user')
+    assert client.rpc_calls == 1
+
+
+def test_login_profile_other_errors_propagate(monkeypatch):
+    monkeypatch.setattr(auth, '_login_profile_rpc', True)
+    client = _ProfileClient(auth.APIError({'code': '42501', 'message': 'permission denied'}))
+    with pytest.raises(auth.APIError):
+        auth.get_login_profile(client, 'user')
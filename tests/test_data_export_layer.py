@@ -0,0 +1,57 @@
+"""Tests for PDF export and export history batching in scanner_tool.data_export_layer."""
+
+import os
+import warnings
+
+import pytest
+
+from scanner_tool import data_export_layer
+from scanner_tool.data_export_layer import DataExportLayer
+
+
+class _FailingClient:
+    """Supabase stand-in whose inserts always fail."""
+
+    def table(self, name):
+        raise ConnectionError("Supabase unreachable")
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return DataExportLayer()
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("port,service\n22,SSH\n")
+    return str(path)
+
+
+def test_batched_records_stay_with_the_caller(exporter, export_file):
+    batch = []
+    assert exporter.store_export_history('scan', 'host', 'csv', export_file, batch=batch)
+    assert exporter.store_export_history('scan', 'host', 'json', export_file, batch=batch)
+    assert [record['export_format'] for record in batch] == ['csv', 'json']
+
+
+def test_failed_insert_keeps_the_batch(exporter, export_file, monkeypatch):
+    monkeypatch.setattr(data_export_layer, 'get_supabase', lambda: _FailingClient())
+    batch = []
+    exporter.store_export_history('scan', 'host', 'csv', export_file, batch=batch)
+    assert not exporter.flush_export_history(batch)
+    assert len(batch) == 1
+
+
+def test_empty_batch_flushes_without_a_request(exporter, monkeypatch):
+    monkeypatch.setattr(data_export_layer, 'get_supabase', lambda: _FailingClient())
+    assert exporter.flush_export_history([])
+
+
+def test_pdf_export_uses_current_fpdf2_api(exporter):
+    pytest.importorskip("fpdf")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        filepath = exporter.export_to_pdf({22: {'service': 'ssh', 'banner': 'OpenSSH_9.6'}}, '127.0.0.1')
+    assert filepath and os.path.getsize(filepath) > 0
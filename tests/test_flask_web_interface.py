@@ -0,0 +1,40 @@
+"""Tests for the Flask routes and response hooks in scanner_tool.flask_web_interface."""
+
+import pytest
+
+from scanner_tool import flask_web_interface as web
+from scanner_tool.flask_web_interface import app
+from scanner_tool.scan_state import ScanState
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_versioned_static_is_immutable(client):
+    response = client.get('/static/css/styles.css?v=abc')
+    assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+
+def test_unversioned_static_is_revalidated(client):
+    response = client.get('/static/css/styles.css')
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_evicted_scan_keeps_details_and_dashboard_entry(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(web.scan_results, 'ttl', 0)
+    monkeypatch.setattr(web.scan_results, 'directory', str(tmp_path))
+    monkeypatch.setattr(web, 'active_scans', {})
+    web.active_scans['evicted-scan'] = ScanState(target='127.0.0.1', results={22: {'service': 'ssh', 'banner': ''}})
+    web.complete_scan('evicted-scan', 'completed')
+    scan_state = web.active_scans['evicted-scan']
+    assert scan_state.archived and scan_state.results == {}
+
+    with client.session_transaction() as session:
+        session['user_id'] = 'user'
+        session['access_token'] = 'token'
+    response = client.get('/api/scan/evicted-scan/details')
+    assert response.status_code == 200
+    assert [row['port'] for row in response.get_json()['results']] == [22]
+    assert [scan['scan_id'] for scan in web.dashboard_scans()] == ['evicted-scan']
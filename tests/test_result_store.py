@@ -0,0 +1,32 @@
+"""Tests for eviction and the on-disk archive in scanner_tool.result_store."""
+
+import time
+
+from scanner_tool.result_store import ScanResultStore
+
+RESULTS = {22: {'service': 'ssh', 'banner': 'OpenSSH_9.6'}, 80: {'service': 'http', 'banner': ''}}
+
+
+def test_overflow_evicts_oldest_to_archive(tmp_path):
+    evicted = []
+    store = ScanResultStore(maxsize=1, directory=str(tmp_path), on_evict=evicted.append)
+    store['first'] = RESULTS
+    store['second'] = {}
+    assert evicted == ['first']
+    assert len(store) == 1
+    assert 'first' in store
+
+
+def test_expired_scan_round_trips_through_archive(tmp_path):
+    store = ScanResultStore(ttl=0.01, directory=str(tmp_path))
+    store['scan'] = RESULTS
+    time.sleep(0.02)
+    assert store.items() == []
+    # Port keys come back as integers, as the engine stores them
+    assert store.get('scan') == RESULTS
+
+
+def test_unknown_scan_returns_default(tmp_path):
+    store = ScanResultStore(directory=str(tmp_path))
+    assert 'missing' not in store
+    assert store.get('missing', {}) == {}
@@ -0,0 +1,82 @@
+"""Tests for port range parsing and port discovery in scanner_tool.scanner_engine."""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from scanner_tool.scanner_engine import ScannerEngine, parse_port_range
+
+
+def test_parse_port_range_merges_sections():
+    assert parse_port_range("443, 80-82,81") == [80, 81, 82, 443]
+
+
+@pytest.mark.parametrize("port_range", ["0", "0-10", "65536", "1-65536"])
+def test_parse_port_range_rejects_out_of_range_ports(port_range):
+    with pytest.raises(ValueError, match="between 1 and 65535"):
+        parse_port_range(port_range)
+
+
+def test_parse_port_range_rejects_reversed_range():
+    with pytest.raises(ValueError, match="start > end"):
+        parse_port_range("100-50")
+
+
+@pytest.fixture
+def listening_port():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    yield server.getsockname()[1]
+    server.close()
+
+
+def test_concurrent_discovery_in_threads(listening_port):
+    results = {}
+
+    def discover(i):
+        results[i] = ScannerEngine().discover_open_ports("127.0.0.1", [listening_port])
+
+    threads = [threading.Thread(target=discover, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {0: [listening_port], 1: [listening_port]}
+
+
+_GEVENT_DISCOVERY = """
+from gevent import monkey
+monkey.patch_all()
+import socket, sys, threading
+from scanner_tool.scanner_engine import ScannerEngine
+
+server = socket.socket()
+server.bind(("127.0.0.1", 0))
+server.listen()
+port = server.getsockname()[1]
+results = {}
+
+def discover(i):
+    results[i] = ScannerEngine().discover_open_ports("127.0.0.1", [port] + list(range(1, 200)))
+
+threads = [threading.Thread(target=discover, args=(i,)) for i in range(2)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+sys.exit(0 if all(port in results.get(i, ()) for i in range(2)) else 1)
+"""
+
+
+def test_concurrent_discovery_under_gevent():
+    # Monkey patching can't be undone, so the patched scans run in a child process
+    pytest.importorskip("gevent")
+    result = subprocess.run([sys.executable, "-c", _GEVENT_DISCOVERY],
+                            capture_output=True, text=True, timeout=120,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.returncode == 0, result.stderr